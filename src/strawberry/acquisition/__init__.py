@@ -1,3 +1,8 @@
 from .alpha_vantage_api import AlphaVantageAPI
+from .alpha_vantage_async import AsyncAlphaVantageAPI
 from .injestor import Injestor
-from .injestor import PriceInjestor
\ No newline at end of file
+from .injestor import PriceInjestor
+from .injestor import StreamingPriceInjestor
+from .data_provider import DataProvider
+from .replay import RecordingProvider, ReplayProvider
+from .metrics import AcquisitionMetrics
@@ -1,34 +1,117 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import time
+
 import pandas as pd
+import pyarrow as pa
 from strawberry.config.config_loader import ConfigLoader
 from strawberry.repository.storage import ParquetStorage
 from strawberry.logging.logger_factory import LoggerFactory
 from strawberry.acquisition.alpha_vantage_api import AlphaVantageAPI
-from strawberry.acquisition.injestor import Injestor, PriceInjestor
+from strawberry.acquisition.coalescer import RequestCoalescer
+from strawberry.acquisition.data_provider import DataProvider
+from strawberry.acquisition.injestor import (
+    Injestor,
+    PriceInjestor,
+    StreamingPriceInjestor,
+)
+from strawberry.acquisition.rate_limiter import TokenBucket
+from strawberry.acquisition.replay import RecordingProvider, ReplayProvider
+from strawberry.acquisition.response_cache import ResponseCache
+from strawberry.acquisition.scheduler import AcquisitionScheduler, WorkItem
+from strawberry.acquisition.work_queue import AcquisitionQueue, QueueItem
 
 
 class Acquire:
 
-    def __init__(self):
+    QUEUE_FILE = "acquisition_queue.json"
+    METRICS_FOLDER = "metrics"
+
+    # injestor classes the acquisition config can name; see register_injestor
+    INJESTORS = {
+        "Injestor": Injestor,
+        "PriceInjestor": PriceInjestor,
+        "StreamingPriceInjestor": StreamingPriceInjestor,
+    }
+
+    def __init__(self, provider: DataProvider = None, tickers: list[str] = None):
+        """
+        provider defaults to the one named in the acquisition config; tickers
+        defaults to tickers.csv. Both can be overridden, e.g. to replay
+        recorded responses for a synthetic ticker universe.
+        """
         self.logger = LoggerFactory().create_logger(__name__)
         self.config = ConfigLoader()
         self.env = self.config.environment()
-        self.tickers = self.config.tickers()
+        self.tickers = tickers if tickers is not None else self.config.tickers()
         self.acq_cfg = self.config.acquisition()
 
-        self.api = AlphaVantageAPI(
-            self.env.alpha_vantage_api_key, self.env.alpha_vantage_url
-        )
+        self.api = provider or self._create_provider()
+        self.rate_limiter = self.api.rate_limiter
+        self.cache = self.api.cache
+        self.metrics = self.api.metrics
         self.storage = ParquetStorage(self.env.acquisition_folder)
-        self.injestor_map = {
-            "Injestor": Injestor,
-            "PriceInjestor": PriceInjestor,
-        }
+        self.injestor_map = dict(self.INJESTORS)
 
         # Build ingestion steps dynamically from JSON config
         self.steps = [
             (self._get_injestor(cfg.injestor), cfg.name, cfg.attribute)
             for cfg in self.acq_cfg.tables
         ]
+        self.step_map = {name: (inj, attr) for inj, name, attr in self.steps}
+        self.table_cfgs = {cfg.name: cfg for cfg in self.acq_cfg.tables}
+
+        # fetch only partitions whose table has released new data
+        self.scheduler = AcquisitionScheduler(self.storage, self.acq_cfg.tables)
+        # pending work survives across runs and resumes where the quota ran out
+        self.queue = AcquisitionQueue(self.env.data_root / self.QUEUE_FILE)
+
+        # multi-symbol endpoints are fetched a batch of tickers per call
+        self.bulk_scheduler = AcquisitionScheduler(
+            self.storage, self.acq_cfg.bulk_tables
+        )
+        self.coalescer = RequestCoalescer(
+            self.api, self.storage, self.acq_cfg.bulk_tables
+        )
+
+    @classmethod
+    def register_injestor(cls, name: str, injestor: type[Injestor]):
+        """
+        Make an injestor class available to the "injestor" key of the config.
+        """
+        cls.INJESTORS[name] = injestor
+
+    def _create_provider(self) -> DataProvider:
+        provider_cfg = self.acq_cfg.provider
+        folder = self.env.data_root / provider_cfg.folder
+        if provider_cfg.name == "replay":
+            return ReplayProvider.from_config(folder, provider_cfg)
+
+        # one token bucket shared by every worker enforces the Alpha Vantage quotas
+        rate_limiter = TokenBucket(
+            self.acq_cfg.api.calls_per_minute, self.acq_cfg.api.calls_per_day
+        )
+        # responses are cached under DATA_ROOT until the table's next release
+        cache = ResponseCache(
+            self.env.data_root / self.acq_cfg.api.cache_folder,
+            self.acq_cfg.tables + self.acq_cfg.bulk_tables,
+        )
+        api = AlphaVantageAPI(
+            self.env.alpha_vantage_api_key,
+            self.env.alpha_vantage_url,
+            rate_limiter,
+            max_connections=self.acq_cfg.api.max_connections,
+            timeout=self.acq_cfg.api.timeout_seconds,
+            cache=cache,
+        )
+        if provider_cfg.name == "record":
+            return RecordingProvider(api, folder)
+        if provider_cfg.name == "alphaVantage":
+            return api
+        raise ValueError(
+            f"Unknown provider '{provider_cfg.name}' in acquisition config"
+        )
 
     def tickers_acquired(self, tickers: list[str]) -> list[str]:
         """
@@ -64,22 +147,50 @@ class Acquire:
                 f"Unknown injestor '{injestor_name}' in acquisition config"
             )
 
-    def _ingest_step(self, injestor, table_name, attr, ticker) -> bool:
+    def _fetch_step(self, injestor, table_name, attr, ticker) -> pd.DataFrame:
+        """
+        Fetch one partition. Returns None when the partition is up to date and
+        an empty frame when the fetch did not complete.
+        """
         log_prefix = f"{ticker} | {table_name} | "
 
-        if self.storage.exists(table_name, ticker):
-            self.logger.info(f"{log_prefix} already exists")
-            # to do: merge the request with existing data
-            return True
+        if not self.scheduler.is_due(table_name, ticker):
+            self.logger.info(f"{log_prefix} up to date")
+            return None
+
+        return injestor.injest(table_name, attr, ticker)
 
-        df: pd.DataFrame = injestor.injest(table_name, attr, ticker)
+    def _write_step(self, df, table_name: str, ticker: str):
+        log_prefix = f"{ticker} | {table_name} | "
+
+        # merge new rows into the partition; keyless snapshots are replaced
+        primary_key = self.table_cfgs[table_name].primary_key
+        if not primary_key:
+            self.storage.remove_partition_by_symbol(table_name, ticker)
+
+        # streaming injestors hand back record batches rather than a frame
+        if isinstance(df, pa.RecordBatchReader):
+            self.storage.write_batches(df, table_name, ticker, primary_key)
+        else:
+            self.storage.write_df(
+                df, table_name, ["symbol"], index=False, primary_key=primary_key
+            )
+        self.logger.info(f"{log_prefix} acquired")
+
+    @staticmethod
+    def _failed(df) -> bool:
+        return isinstance(df, pd.DataFrame) and df.empty
+
+    def _ingest_step(self, injestor, table_name, attr, ticker) -> bool:
+        df = self._fetch_step(injestor, table_name, attr, ticker)
+        if df is None:
+            return True
 
         # if not data, then return a False to indicate did not complete
-        if df.empty:
+        if self._failed(df):
             return False
 
-        self.storage.write_df(df, table_name, ["symbol"], index=False)
-        self.logger.info(f"{log_prefix} acquired")
+        self._write_step(df, table_name, ticker)
         return True
 
     def acquire_ticker(self, ticker: str) -> bool:
@@ -93,10 +204,148 @@ class Acquire:
         self.logger.info(f"Successfully acquired {ticker}")
         return True
 
+    def acquire_tickers(self, tickers: list[str]) -> dict[str, bool]:
+        """
+        Acquire every due partition of the given tickers.
+        """
+        results = self.acquire_items(self.scheduler.due(tickers))
+        return {t: results.get(t, True) for t in tickers}
+
+    def _commit_ticker(self, ticker: str, ok: bool, frames: dict):
+        """
+        Write a ticker's fetched tables only once all of them succeeded, so a
+        ticker is never left with a partial table set. Fetched payloads stay
+        in the response cache, so a retry does not spend quota on them again.
+        """
+        if not ok:
+            self.logger.warning(
+                f"{ticker} | incomplete, {len(frames)} fetched tables not written"
+            )
+            for df in frames.values():
+                if isinstance(df, pa.RecordBatchReader):
+                    df.close()
+            return
+        for table_name, df in frames.items():
+            self._write_step(df, table_name, ticker)
+
+    def acquire_items(self, items: list[WorkItem | QueueItem]) -> dict[str, bool]:
+        """
+        Fan the (ticker, table) fetches out across a bounded worker pool. All workers
+        draw from the shared token bucket, so refresh time is bounded by quota
+        rather than network latency. Returns a success flag per ticker.
+        """
+        pending = Counter(item.ticker for item in items)
+        results = {t: True for t in pending}
+        staged: dict[str, dict] = {t: {} for t in pending}
+        max_workers = self.acq_cfg.api.max_workers
+        self.logger.info(
+            f"Acquiring {len(items)} partitions of {len(pending)} tickers "
+            f"with {max_workers} workers"
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self._fetch_step, *self._step(item.table), item.ticker): item
+                for item in items
+            }
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    self.logger.warning(f"{item.ticker} | {item.table} | {e}")
+                    self.metrics.add_error(item.table)
+                    df = pd.DataFrame()
+
+                if self._failed(df):
+                    results[item.ticker] = False
+                elif df is not None:
+                    staged[item.ticker][item.table] = df
+
+                # once a ticker's last fetch is in, write its tables together
+                pending[item.ticker] -= 1
+                if pending[item.ticker] == 0:
+                    self._commit_ticker(
+                        item.ticker, results[item.ticker], staged.pop(item.ticker)
+                    )
+
+        failed = [t for t, ok in results.items() if not ok]
+        if failed:
+            self.logger.warning(f"Failed to acquire {len(failed)} tickers: {failed}")
+        self.logger.info(
+            f"Acquired {len(results) - len(failed)} of {len(results)} tickers, "
+            f"{self.rate_limiter.remaining_today()} API calls left today"
+        )
+        if self.cache is not None:
+            self.logger.info(f"Response cache: {self.cache.stats()}")
+        return results
+
+    def _step(self, table_name: str) -> tuple:
+        inj, attr = self.step_map[table_name]
+        return inj, table_name, attr
+
+    def _cost(self, item: QueueItem) -> int:
+        # partitions served from the response cache cost no quota
+        if self.cache is None:
+            return 1
+        datatype = self.step_map[item.table][0].DATATYPE
+        return 0 if self.cache.is_fresh(item.table, item.ticker, datatype) else 1
+
+    def acquire_bulk(self, tickers: list[str]) -> dict[str, bool]:
+        """
+        Refresh the bulk tables for every due ticker, coalescing the
+        requests into batches of each table's batch_size symbols.
+        """
+        return self.coalescer.acquire(self.bulk_scheduler.due(tickers))
+
+    def export_metrics(self, run_seconds: float) -> dict:
+        """
+        Record the end-of-run gauges and write the metrics snapshot under
+        DATA_ROOT/metrics as JSON and Prometheus text.
+        """
+        self.metrics.gauge("run_seconds", round(run_seconds, 3))
+        self.metrics.gauge("quota_remaining", self.rate_limiter.remaining_today())
+        self.metrics.gauge(
+            "rate_limit_backoff_seconds", round(self.rate_limiter.backoff_seconds, 3)
+        )
+        self.metrics.gauge("queue_length", len(self.queue))
+        if self.cache is not None:
+            for name, value in self.cache.stats().items():
+                self.metrics.gauge(f"cache_{name}", value)
+
+        snapshot = self.metrics.export(self.env.data_root / self.METRICS_FOLDER)
+        self.logger.info(
+            f"Run took {run_seconds:.1f}s: {snapshot['requests']} requests, "
+            f"{snapshot['network_seconds']:.1f}s network, "
+            f"{snapshot['parse_seconds']:.1f}s parsing, "
+            f"{snapshot['gauges']['rate_limit_backoff_seconds']}s rate-limit back-off"
+        )
+        return snapshot
+
     def main(self):
-        for ticker in self.tickers_not_acquired(self.tickers):
-            if not self.acquire_ticker(ticker):
-                return
+        start = time.perf_counter()
+
+        # bulk tables first: a few calls cover the whole ticker universe
+        self.acquire_bulk(self.tickers)
+
+        # queue every due partition, ranked by staleness, table and ticker weight
+        weights = self.config.ticker_weights()
+        self.queue.push(
+            [
+                (item, self.scheduler.priority(item, weights.get(item.ticker, 1.0)))
+                for item in self.scheduler.due(self.tickers)
+            ]
+        )
+
+        # work through the queue, whole tickers at a time, within today's quota
+        batch = self.queue.next_batch(self.rate_limiter.remaining_today(), self._cost)
+        for ticker, ok in self.acquire_items(batch).items():
+            if ok:
+                self.queue.complete(ticker)
+            else:
+                self.queue.failed(ticker)
+        self.logger.info(f"{len(self.queue)} work items left in the queue")
+        self.export_metrics(time.perf_counter() - start)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,15 @@
+import itertools
+import json
+import tempfile
+import time
+from typing import BinaryIO
+
 import requests
+from requests.adapters import HTTPAdapter
 from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.acquisition.data_provider import DataProvider
+from strawberry.acquisition.rate_limiter import TokenBucket
+from strawberry.acquisition.response_cache import ResponseCache
 
 # define your new exceptions
 class DataNotFoundError(Exception):
@@ -10,44 +20,184 @@ class APILimitReachedError(Exception):
     """Raised when the AlphaVantage API limit is reached."""
     pass
 
-class AlphaVantageAPI:
+class AlphaVantageAPI(DataProvider):
     """
     Simple client for Alpha Vantage REST API.
+    Requests go through a pooled keep-alive session so repeated calls reuse
+    the same TCP+TLS connection. With a ResponseCache, quota is only spent on
+    a cache miss or an expired entry.
     """
 
+    STREAM_CHUNK = 64 * 1024
+
     def __init__(self, api_key: str,
-                 base_url: str = "https://www.alphavantage.co/query"):
+                 base_url: str = "https://www.alphavantage.co/query",
+                 rate_limiter: TokenBucket = None,
+                 max_connections: int = 10,
+                 timeout: float = 30.0,
+                 cache: ResponseCache = None):
+        # shared across workers; enforces the per-minute and per-day quotas
+        super().__init__(rate_limiter or TokenBucket(per_minute=5, per_day=25), cache)
         self.logger = LoggerFactory().create_logger(__name__)
         self.api_key = api_key
         self.base_url = base_url
-        self.api_limit = 25
-        self.calls = 0
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.session = self._create_session()
 
-    def fetch(self, function: str, symbol: str, datatype: str = "json") -> dict:
-        # do not exceed api limit
-        if self.calls >= self.api_limit:            
-            return None
-        self.calls += 1
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.max_connections
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        return session
 
-        params = {
+    def _params(self, function: str, symbol: str, datatype: str) -> dict:
+        return {
             "function": function,
             "symbol": symbol,
             "apikey": self.api_key,
             "datatype": datatype,
         }
-        resp = requests.get(self.base_url, params=params) 
-        resp.raise_for_status()
-        data = resp.json()
+
+    def _check_payload(self, function: str, symbol: str, data: dict) -> dict:
         # ensure we have data to proceed
         if data is None:
             m = f"{symbol} | {function} | Alpha Vantage - No data found."
             self.logger.warning(m)
-            raise DataNotFoundError(m) 
-        
+            raise DataNotFoundError(m)
+
         # ensure we have not reached API limit
         if 'Information' in data:
-            self.calls -= 1
+            self.rate_limiter.exhaust()
             m = f"{symbol} | {function} | API calls: {self.calls} | Alpha Vantage API limit reached."
             self.logger.warning(m)
             return None
         return data
+
+    def _cached(self, function: str, symbol: str, datatype: str) -> dict:
+        if self.cache is None:
+            return None
+        return self.cache.get(function, symbol, datatype)
+
+    def _stale_entry(self, function: str, symbol: str, datatype: str):
+        if self.cache is None:
+            return None
+        return self.cache.entry(function, symbol, datatype)
+
+    def _store(self, function, symbol, datatype, data, headers) -> dict:
+        if self.cache is not None and data is not None:
+            self.cache.put(
+                function,
+                symbol,
+                datatype,
+                data,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+            )
+        return data
+
+    def fetch(self, function: str, symbol: str, datatype: str = "json") -> dict:
+        # serve unchanged data from the cache without spending quota
+        data = self._cached(function, symbol, datatype)
+        if data is not None:
+            return data
+
+        # do not exceed api limit
+        if not self.rate_limiter.acquire():
+            return None
+        self.calls += 1
+
+        # revalidate an expired entry rather than re-downloading it
+        entry = self._stale_entry(function, symbol, datatype)
+        params = self._params(function, symbol, datatype)
+        start = time.perf_counter()
+        resp = self.session.get(
+            self.base_url,
+            params=params,
+            headers=ResponseCache.conditional_headers(entry),
+            timeout=self.timeout,
+        )
+        self.metrics.observe_request(
+            function, time.perf_counter() - start, len(resp.content)
+        )
+        if resp.status_code == 304 and entry is not None:
+            return self.cache.revalidated(entry)
+        resp.raise_for_status()
+        data = self._check_payload(function, symbol, resp.json())
+        return self._store(function, symbol, datatype, data, resp.headers)
+
+    def stream(self, function: str, symbol: str, datatype: str = "csv") -> BinaryIO:
+        """
+        Return the payload as a binary stream instead of a parsed dict, so large
+        responses can be parsed incrementally. The download is spooled chunk by
+        chunk into the response cache. Returns None when the quota is spent or
+        the upstream answers with an error message.
+        """
+        if self.cache is not None:
+            cached = self.cache.open(function, symbol, datatype)
+            if cached is not None:
+                return cached
+
+        if not self.rate_limiter.acquire():
+            return None
+        self.calls += 1
+
+        entry = self._stale_entry(function, symbol, datatype)
+        start = time.perf_counter()
+        resp = self.session.get(
+            self.base_url,
+            params=self._params(function, symbol, datatype),
+            headers=ResponseCache.conditional_headers(entry),
+            timeout=self.timeout,
+            stream=True,
+        )
+        if resp.status_code == 304 and entry is not None:
+            self.metrics.observe_request(function, time.perf_counter() - start)
+            self.cache.revalidated(entry)
+            return self.cache.open_payload(entry)
+        resp.raise_for_status()
+
+        chunks = self._measured(
+            function, start, resp.iter_content(self.STREAM_CHUNK)
+        )
+        first = next(chunks, b"")
+        # errors and limit messages come back as JSON even for csv requests
+        if datatype != "json" and first.lstrip()[:1] == b"{":
+            body = first + b"".join(chunks)
+            self._check_payload(function, symbol, json.loads(body))
+            return None
+        chunks = itertools.chain([first], chunks)
+
+        if self.cache is None:
+            spool = tempfile.TemporaryFile()
+            for chunk in chunks:
+                spool.write(chunk)
+            spool.seek(0)
+            return spool
+
+        entry = self.cache.put_stream(
+            function,
+            symbol,
+            datatype,
+            chunks,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+        return self.cache.open_payload(entry)
+
+    def _measured(self, function: str, start: float, chunks):
+        """
+        Pass chunks through, recording the download once it is complete.
+        """
+        nbytes = 0
+        for chunk in chunks:
+            nbytes += len(chunk)
+            yield chunk
+        self.metrics.observe_request(function, time.perf_counter() - start, nbytes)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import time
+
+import aiohttp
+
+from strawberry.acquisition.alpha_vantage_api import AlphaVantageAPI
+from strawberry.acquisition.rate_limiter import TokenBucket
+from strawberry.acquisition.response_cache import ResponseCache
+from strawberry.config.dtos import ApiConfig
+
+
+class AsyncAlphaVantageAPI(AlphaVantageAPI):
+    """
+    Async variant of the Alpha Vantage client. A single aiohttp session keeps a
+    bounded pool of keep-alive connections open, so concurrent fetches reuse
+    connections instead of paying a fresh TCP+TLS handshake per endpoint.
+
+    Use as an async context manager:
+
+        async with AsyncAlphaVantageAPI(key, url) as api:
+            data = await api.fetch_async("OVERVIEW", "MSFT")
+
+    Acquire runs the threaded, synchronous client; this one is for callers
+    with their own event loop (and the client benchmark).
+    """
+
+    def __init__(self, api_key: str,
+                 base_url: str = "https://www.alphavantage.co/query",
+                 rate_limiter: TokenBucket = None,
+                 max_connections: int = 10,
+                 timeout: float = 30.0,
+                 keepalive_timeout: float = 30.0,
+                 cache: ResponseCache = None):
+        super().__init__(
+            api_key, base_url, rate_limiter, max_connections, timeout, cache
+        )
+        self.keepalive_timeout = keepalive_timeout
+        self.async_session: aiohttp.ClientSession = None
+
+    @staticmethod
+    def from_config(
+        api_key: str,
+        base_url: str,
+        cfg: ApiConfig,
+        rate_limiter: TokenBucket = None,
+        cache: ResponseCache = None,
+    ) -> "AsyncAlphaVantageAPI":
+        return AsyncAlphaVantageAPI(
+            api_key,
+            base_url,
+            rate_limiter,
+            max_connections=cfg.max_connections,
+            timeout=cfg.timeout_seconds,
+            keepalive_timeout=cfg.keepalive_seconds,
+            cache=cache,
+        )
+
+    async def __aenter__(self) -> "AsyncAlphaVantageAPI":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def open(self):
+        if self.async_session is not None:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self.async_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={"Accept-Encoding": "gzip, deflate"},
+            auto_decompress=True,
+        )
+
+    async def aclose(self):
+        if self.async_session is not None:
+            await self.async_session.close()
+            self.async_session = None
+
+    async def fetch_async(
+        self, function: str, symbol: str, datatype: str = "json"
+    ) -> dict:
+        """
+        Async counterpart of fetch; returns the same dict (or None once the
+        quota is spent) that the injestors consume.
+        """
+        await self.open()
+
+        # the cache reads and writes gzip files: keep them off the event loop
+        data = await asyncio.to_thread(self._cached, function, symbol, datatype)
+        if data is not None:
+            return data
+
+        # the token bucket blocks, keep it off the event loop
+        if not await asyncio.to_thread(self.rate_limiter.acquire):
+            return None
+        self.calls += 1
+
+        entry = await asyncio.to_thread(self._stale_entry, function, symbol, datatype)
+        params = self._params(function, symbol, datatype)
+        headers = ResponseCache.conditional_headers(entry)
+        start = time.perf_counter()
+        async with self.async_session.get(
+            self.base_url, params=params, headers=headers
+        ) as resp:
+            body = await resp.read()
+            self.metrics.observe_request(
+                function, time.perf_counter() - start, len(body)
+            )
+            if resp.status == 304 and entry is not None:
+                return await asyncio.to_thread(self.cache.revalidated, entry)
+            resp.raise_for_status()
+            data = self._check_payload(function, symbol, json.loads(body))
+            return await asyncio.to_thread(
+                self._store, function, symbol, datatype, data, resp.headers
+            )
+
+    async def fetch_many(
+        self, requests: list[tuple[str, str]], datatype: str = "json"
+    ) -> list[dict]:
+        """
+        Fetch a list of (function, symbol) pairs concurrently over the pooled
+        session. Results are returned in request order; a failed request yields
+        its exception in place of the dict.
+        """
+        tasks = [self.fetch_async(fn, sym, datatype) for fn, sym in requests]
+        return await asyncio.gather(*tasks, return_exceptions=True)
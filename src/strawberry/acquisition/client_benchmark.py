@@ -0,0 +1,145 @@
+import asyncio
+import json
+import threading
+import time
+
+import requests
+from aiohttp import web
+
+from strawberry.acquisition.alpha_vantage_api import AlphaVantageAPI
+from strawberry.acquisition.alpha_vantage_async import AsyncAlphaVantageAPI
+from strawberry.acquisition.rate_limiter import TokenBucket
+from strawberry.logging.logger_factory import LoggerFactory
+
+
+class StubAlphaVantageServer:
+    """
+    Local stand-in for the Alpha Vantage endpoint. Serves a fixed payload for
+    every (function, symbol) and counts the TCP connections clients open,
+    so handshake savings can be measured without the real API.
+    """
+
+    PAYLOAD = {"quarterlyReports": [{"fiscalDateEnding": "2024-12-31", "totalAssets": "1"}]}
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765):
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self._peers: set = set()
+        self._loop: asyncio.AbstractEventLoop = None
+        self._runner: web.AppRunner = None
+        self._ready = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/query"
+
+    @property
+    def connections(self) -> int:
+        return len(self._peers)
+
+    def reset(self):
+        self.requests = 0
+        self._peers = set()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self._peers.add(request.transport.get_extra_info("peername"))
+        payload = dict(self.PAYLOAD, symbol=request.query.get("symbol"))
+        return web.Response(text=json.dumps(payload), content_type="application/json")
+
+    def _serve(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        app = web.Application()
+        app.router.add_get("/query", self._handle)
+        self._runner = web.AppRunner(app)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, self.host, self.port)
+        self._loop.run_until_complete(site.start())
+        self._ready.set()
+        self._loop.run_forever()
+
+    def start(self):
+        threading.Thread(target=self._serve, daemon=True).start()
+        self._ready.wait()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+class ClientBenchmark:
+    """
+    Compare one-connection-per-call requests against the pooled sync session
+    and the pooled async client on the same batch of endpoint calls.
+    """
+
+    FUNCTIONS = ["BALANCE_SHEET", "CASH_FLOW", "EARNINGS", "INCOME_STATEMENT"]
+
+    def __init__(self, calls: int = 200, max_connections: int = 10):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.calls = calls
+        self.max_connections = max_connections
+        self.server = StubAlphaVantageServer()
+
+    def _work(self) -> list[tuple[str, str]]:
+        return [
+            (self.FUNCTIONS[i % len(self.FUNCTIONS)], f"T{i // len(self.FUNCTIONS)}")
+            for i in range(self.calls)
+        ]
+
+    def _unlimited(self) -> TokenBucket:
+        return TokenBucket(per_minute=0, per_day=self.calls)
+
+    def _run_unpooled(self):
+        for fn, sym in self._work():
+            params = {"function": fn, "symbol": sym, "apikey": "demo", "datatype": "json"}
+            requests.get(self.server.url, params=params).json()
+
+    def _run_pooled(self):
+        api = AlphaVantageAPI("demo", self.server.url, self._unlimited(), self.max_connections)
+        for fn, sym in self._work():
+            api.fetch(fn, sym)
+        api.close()
+
+    def _run_async(self):
+        async def run():
+            async with AsyncAlphaVantageAPI(
+                "demo", self.server.url, self._unlimited(), self.max_connections
+            ) as api:
+                await api.fetch_many(self._work())
+
+        asyncio.run(run())
+
+    def _measure(self, name: str, fn) -> dict:
+        self.server.reset()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        result = {
+            "client": name,
+            "calls": self.server.requests,
+            "connections": self.server.connections,
+            "seconds": round(elapsed, 3),
+        }
+        self.logger.info(
+            f"{name} | {result['calls']} calls | "
+            f"{result['connections']} connections | {result['seconds']}s"
+        )
+        return result
+
+    def main(self) -> list[dict]:
+        self.server.start()
+        try:
+            return [
+                self._measure("requests.get", self._run_unpooled),
+                self._measure("pooled session", self._run_pooled),
+                self._measure("async pooled", self._run_async),
+            ]
+        finally:
+            self.server.stop()
+
+
+if __name__ == "__main__":
+    ClientBenchmark().main()
@@ -0,0 +1,109 @@
+import pandas as pd
+
+from strawberry.acquisition.data_provider import DataProvider
+from strawberry.acquisition.scheduler import WorkItem
+from strawberry.config.dtos import AcquisitionTableConfig
+from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.repository.storage import ParquetStorage
+
+
+class RequestCoalescer:
+    """
+    Batches requests for multi-symbol endpoints (bulk quotes and the like)
+    across tickers, so one upstream call covers up to batch_size symbols.
+    The combined response is split back into per-symbol `symbol=` partitions.
+    Quota used per refresh is O(tickers / batch size) rather than O(tickers).
+    """
+
+    def __init__(
+        self,
+        api: DataProvider,
+        storage: ParquetStorage,
+        tables: list[AcquisitionTableConfig],
+    ):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.api = api
+        self.storage = storage
+        self.table_cfgs = {t.name: t for t in tables}
+
+    @staticmethod
+    def batches(tickers: list[str], batch_size: int) -> list[list[str]]:
+        size = max(1, batch_size)
+        return [tickers[i : i + size] for i in range(0, len(tickers), size)]
+
+    def plan(self, items: list[WorkItem]) -> list[tuple[str, list[str]]]:
+        """
+        Group due work items into (table, symbols) upstream calls. Items of
+        tables that are not configured for batching are left out.
+        """
+        by_table: dict[str, list[str]] = {}
+        for item in items:
+            if item.table in self.table_cfgs:
+                by_table.setdefault(item.table, []).append(item.ticker)
+
+        return [
+            (table, batch)
+            for table, tickers in by_table.items()
+            for batch in self.batches(
+                sorted(set(tickers)), self.table_cfgs[table].batch_size
+            )
+        ]
+
+    def split(self, data: dict, table: str, symbols: list[str]) -> pd.DataFrame:
+        """
+        Rows of a multi-symbol response, restricted to the requested symbols.
+        """
+        rows = data.get(self.table_cfgs[table].attribute) or []
+        df = pd.DataFrame(rows)
+        if df.empty or "symbol" not in df.columns:
+            return pd.DataFrame()
+        df["symbol"] = df["symbol"].astype(str).str.upper()
+        return df[df["symbol"].isin(symbols)]
+
+    def fetch_batch(self, table: str, symbols: list[str]) -> pd.DataFrame:
+        log_prefix = f"{len(symbols)} tickers | {table} | "
+        try:
+            data = self.api.fetch(table, ",".join(symbols))
+        except Exception as e:
+            self.logger.warning(f"{log_prefix}{e}")
+            return pd.DataFrame()
+        if data is None:
+            return pd.DataFrame()
+
+        df = self.split(data, table, symbols)
+        self.api.metrics.add_rows(table, len(df))
+        missing = set(symbols) - set(df["symbol"]) if not df.empty else set(symbols)
+        if missing:
+            self.logger.warning(f"{log_prefix}no rows for {sorted(missing)}")
+        return df
+
+    def acquire(self, items: list[WorkItem]) -> dict[str, bool]:
+        """
+        Fetch every due item of the batched tables in as few calls as the
+        batch sizes allow and merge the rows into each symbol's partition.
+        Returns a success flag per ticker.
+        """
+        results: dict[str, bool] = {}
+        calls = self.plan(items)
+        for table, symbols in calls:
+            df = self.fetch_batch(table, symbols)
+            if not df.empty:
+                # partitioning on symbol splits the batch back per ticker
+                self.storage.write_df(
+                    df,
+                    table,
+                    ["symbol"],
+                    index=False,
+                    primary_key=self.table_cfgs[table].primary_key,
+                )
+            written = set(df["symbol"]) if not df.empty else set()
+            for symbol in symbols:
+                results[symbol] = results.get(symbol, True) and symbol in written
+
+        if calls:
+            ok = sum(results.values())
+            self.logger.info(
+                f"Coalesced {len(results)} partitions into {len(calls)} calls, "
+                f"{ok} acquired"
+            )
+        return results
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+from strawberry.acquisition.metrics import AcquisitionMetrics
+from strawberry.acquisition.rate_limiter import TokenBucket
+from strawberry.acquisition.response_cache import ResponseCache
+
+
+class DataProvider(ABC):
+    """
+    Source of upstream payloads consumed by the injestors. The live Alpha
+    Vantage client, the recording wrapper and the offline replay backend all
+    implement this, so Acquire does not care where the data comes from.
+    """
+
+    def __init__(self, rate_limiter: TokenBucket, cache: ResponseCache = None):
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.calls = 0
+        # shared with the injestors and Acquire, exported after each run
+        self.metrics = AcquisitionMetrics()
+
+    @abstractmethod
+    def fetch(self, function: str, symbol: str, datatype: str = "json") -> dict:
+        """
+        Return the parsed payload, or None once the quota is spent.
+        """
+
+    @abstractmethod
+    def stream(self, function: str, symbol: str, datatype: str = "csv") -> BinaryIO:
+        """
+        Return the payload as a binary stream, or None once the quota is spent.
+        """
+
+    def close(self):
+        pass
@@ -1,13 +1,32 @@
+import time
+
 import pandas as pd
-from strawberry.acquisition.alpha_vantage_api import AlphaVantageAPI
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from strawberry.acquisition.data_provider import DataProvider
 
 
 class Injestor:
-    def __init__(self, alpha_vantage: AlphaVantageAPI):
+
+    DATATYPE = "json"
+
+    def __init__(self, alpha_vantage: DataProvider):
         self.alpha_vantage = alpha_vantage
 
     def injest(self, name: str, attr: str, ticker: str):
         data = self.alpha_vantage.fetch(name, ticker)
+        start = time.perf_counter()
+        df = self.parse(data, attr, ticker)
+        metrics = self.alpha_vantage.metrics
+        metrics.observe_parse(name, time.perf_counter() - start)
+        metrics.add_rows(name, len(df))
+        return df
+
+    def parse(self, data: dict, attr: str, ticker: str):
+        """
+        Build the table for one ticker from an API payload, e.g. one returned
+        by AsyncAlphaVantageAPI.fetch_async.
+        """
         # ensure we have data
         if not data:
             return pd.DataFrame()
@@ -20,7 +39,7 @@ class Injestor:
 
 class PriceInjestor(Injestor):
 
-    def injest(self, name: str, attr: str, ticker: str):
+    def parse(self, data: dict, attr: str, ticker: str):
         """
         API Shape:
                                 2025-07-18 2025-06-30   ...  1999-12-31 symbol
@@ -32,9 +51,77 @@ class PriceInjestor(Injestor):
             6. volume            23197339   32291378   ...    9427500     CB
             7. dividend amount     0.0000     0.9700   ...     0.0000     CB
         Transposed (and returned shape):
-
+                  date   1. open   2. high  ...  7. dividend amount symbol
+            2025-07-18  289.1900  290.5000  ...              0.0000     CB
+            2025-06-30  294.7300  300.2700  ...              0.9700     CB
         """
-        df = super().injest(name, attr, ticker)
-        if not df.empty:
-            df.rename(columns={"index": "date"}, inplace=True)
+        # ensure we have data
+        if not data:
+            return pd.DataFrame()
+
+        # one row per date, keyed by the 'date' primary key
+        df = pd.DataFrame.from_dict(data[attr], orient="index")
+        df = df.reset_index().rename(columns={"index": "date"})
+        df["symbol"] = ticker
         return df
+
+
+class StreamingPriceInjestor(PriceInjestor):
+    """
+    Streams the datatype=csv price history straight into Arrow record batches
+    instead of materialising the JSON dict, a DataFrame and its transpose.
+    Peak memory per fetch is a small multiple of one batch.
+    """
+
+    DATATYPE = "csv"
+    BLOCK_SIZE = 256 * 1024
+
+    # csv header -> column names of the JSON payload used downstream
+    COLUMNS = {
+        "timestamp": "date",
+        "open": "1. open",
+        "high": "2. high",
+        "low": "3. low",
+        "close": "4. close",
+        "adjusted close": "5. adjusted close",
+        "volume": "6. volume",
+        "dividend amount": "7. dividend amount",
+    }
+
+    def injest(self, name: str, attr: str, ticker: str):
+        stream = self.alpha_vantage.stream(name, ticker, datatype=self.DATATYPE)
+        # ensure we have data
+        if stream is None:
+            return pd.DataFrame()
+
+        # keep the raw strings, as the JSON path does, so fragments share a schema
+        reader = pacsv.open_csv(
+            stream,
+            read_options=pacsv.ReadOptions(block_size=self.BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(
+                column_types={c: pa.string() for c in self.COLUMNS},
+                strings_can_be_null=False,
+            ),
+        )
+        names = [self.COLUMNS.get(c, c) for c in reader.schema.names]
+        schema = pa.schema([pa.field(n, pa.string()) for n in names])
+
+        metrics = self.alpha_vantage.metrics
+
+        def batches():
+            # parsing happens lazily as the writer pulls batches
+            elapsed, rows = 0.0, 0
+            with stream:
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        batch = reader.read_next_batch()
+                    except StopIteration:
+                        break
+                    elapsed += time.perf_counter() - start
+                    rows += batch.num_rows
+                    yield pa.RecordBatch.from_arrays(batch.columns, schema=schema)
+            metrics.observe_parse(name, elapsed)
+            metrics.add_rows(name, rows)
+
+        return pa.RecordBatchReader.from_batches(schema, batches())
@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+from bisect import bisect_left
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram in the Prometheus style: a count per upper bound,
+    plus the running sum and count of observations.
+    """
+
+    BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(self, buckets: tuple = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        bounds = [str(b) for b in self.buckets] + ["+Inf"]
+        total, out = 0, []
+        for bound, n in zip(bounds, self.counts):
+            total += n
+            out.append((bound, total))
+        return out
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class AcquisitionMetrics:
+    """
+    Thread-safe telemetry for one acquisition run: per-endpoint network
+    latency and bytes, per-table parse time and rows produced, plus gauges
+    such as the remaining quota and rate-limit back-off. A snapshot is
+    exported as JSON and Prometheus text at the end of each run.
+    """
+
+    PREFIX = "strawberry_acquisition"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = datetime.now(timezone.utc)
+        self.network: dict[str, Histogram] = {}
+        self.parse: dict[str, Histogram] = {}
+        self.bytes: dict[str, int] = {}
+        self.rows: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.gauges: dict[str, float] = {}
+
+    def observe_request(self, endpoint: str, seconds: float, nbytes: int = 0):
+        """
+        One upstream call: time spent on the wire and the payload size.
+        """
+        with self._lock:
+            self.network.setdefault(endpoint, Histogram()).observe(seconds)
+            self.bytes[endpoint] = self.bytes.get(endpoint, 0) + nbytes
+
+    def observe_parse(self, table: str, seconds: float):
+        with self._lock:
+            self.parse.setdefault(table, Histogram()).observe(seconds)
+
+    def add_rows(self, table: str, rows: int):
+        with self._lock:
+            self.rows[table] = self.rows.get(table, 0) + rows
+
+    def add_error(self, endpoint: str):
+        with self._lock:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def gauge(self, name: str, value: float):
+        with self._lock:
+            self.gauges[name] = value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            network_seconds = sum(h.sum for h in self.network.values())
+            parse_seconds = sum(h.sum for h in self.parse.values())
+            return {
+                "started_at": self.started_at.isoformat(),
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "requests": sum(h.count for h in self.network.values()),
+                "network_seconds": round(network_seconds, 6),
+                "parse_seconds": round(parse_seconds, 6),
+                "bytes": sum(self.bytes.values()),
+                "rows": sum(self.rows.values()),
+                "gauges": dict(self.gauges),
+                "endpoints": {
+                    endpoint: {
+                        "latency": h.to_dict(),
+                        "bytes": self.bytes.get(endpoint, 0),
+                        "errors": self.errors.get(endpoint, 0),
+                    }
+                    for endpoint, h in self.network.items()
+                },
+                "tables": {
+                    table: {
+                        "parse": self.parse[table].to_dict()
+                        if table in self.parse
+                        else None,
+                        "rows": self.rows.get(table, 0),
+                    }
+                    for table in sorted(set(self.parse) | set(self.rows))
+                },
+            }
+
+    def _histogram_lines(self, name, label, histograms, help_text) -> list[str]:
+        metric = f"{self.PREFIX}_{name}"
+        lines = [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+        for key, h in sorted(histograms.items()):
+            for bound, n in h.cumulative():
+                lines.append(f'{metric}_bucket{{{label}="{key}",le="{bound}"}} {n}')
+            lines.append(f'{metric}_sum{{{label}="{key}"}} {h.sum:.6f}')
+            lines.append(f'{metric}_count{{{label}="{key}"}} {h.count}')
+        return lines
+
+    def _counter_lines(self, name, label, values, help_text) -> list[str]:
+        metric = f"{self.PREFIX}_{name}"
+        lines = [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        for key, value in sorted(values.items()):
+            lines.append(f'{metric}{{{label}="{key}"}} {value}')
+        return lines
+
+    def to_prometheus(self) -> str:
+        with self._lock:
+            lines = self._histogram_lines(
+                "request_seconds", "endpoint", self.network,
+                "Upstream request latency per endpoint.",
+            )
+            lines += self._histogram_lines(
+                "parse_seconds", "table", self.parse,
+                "Time spent parsing payloads into tables.",
+            )
+            lines += self._counter_lines(
+                "bytes_total", "endpoint", self.bytes, "Payload bytes downloaded."
+            )
+            lines += self._counter_lines(
+                "rows_total", "table", self.rows, "Rows produced per table."
+            )
+            lines += self._counter_lines(
+                "errors_total", "endpoint", self.errors, "Failed fetches per endpoint."
+            )
+            for name, value in sorted(self.gauges.items()):
+                metric = f"{self.PREFIX}_{name}"
+                lines += [f"# TYPE {metric} gauge", f"{metric} {value}"]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _atomic_write(path: Path, text: str):
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(text)
+        os.replace(tmp, path)
+
+    def export(self, folder: Path, name: str = "acquisition") -> dict:
+        """
+        Write the snapshot to folder/<name>.json and folder/<name>.prom
+        (Prometheus text format, e.g. for the node_exporter textfile collector).
+        """
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        snapshot = self.snapshot()
+        self._atomic_write(folder / f"{name}.json", json.dumps(snapshot, indent=2))
+        self._atomic_write(folder / f"{name}.prom", self.to_prometheus())
+        return snapshot
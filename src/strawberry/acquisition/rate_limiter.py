@@ -0,0 +1,78 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket enforcing both the per-minute and per-day
+    Alpha Vantage quotas. Every acquisition worker draws from the same bucket.
+    """
+
+    def __init__(self, per_minute: int, per_day: int):
+        self.per_minute = per_minute
+        self.per_day = per_day
+        self._rate = per_minute / 60.0 if per_minute else None
+        self._tokens = float(per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._day = self._today()
+        self._day_used = 0
+        self._lock = threading.Lock()
+        # total time callers spent blocked waiting for a token
+        self.backoff_seconds = 0.0
+
+    @staticmethod
+    def _today():
+        # Alpha Vantage daily quotas reset on the UTC calendar day
+        return datetime.now(timezone.utc).date()
+
+    def _roll_day(self):
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._day_used = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.per_minute, self._tokens + elapsed * self._rate)
+
+    def acquire(self) -> bool:
+        """
+        Block until a per-minute token is available and take it.
+        Returns False, without blocking, once the daily quota is spent.
+        """
+        while True:
+            with self._lock:
+                self._roll_day()
+                if self._day_used >= self.per_day:
+                    return False
+
+                # no per-minute limit configured, only the daily quota applies
+                if self._rate is None:
+                    self._day_used += 1
+                    return True
+
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._day_used += 1
+                    return True
+                wait = (1 - self._tokens) / self._rate
+                self.backoff_seconds += wait
+
+            time.sleep(wait)
+
+    def exhaust(self):
+        """
+        Mark the daily quota as spent, e.g. when the upstream reports its limit was reached.
+        """
+        with self._lock:
+            self._roll_day()
+            self._day_used = self.per_day
+
+    def remaining_today(self) -> int:
+        with self._lock:
+            self._roll_day()
+            return max(0, self.per_day - self._day_used)
@@ -0,0 +1,101 @@
+import calendar
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from strawberry.config.dtos import AcquisitionTableConfig
+
+
+class ReleaseCalendar:
+    """
+    Works out when new data is expected for an acquisition table from its
+    frequency, release_day_rule, release_time and timezone.
+
+    frequency:        daily | weekly | monthly | quarterly | annual
+    release_day_rule: endOfPeriod | nextBusinessDay | endOfMonthAfterPeriod
+                      (endOfMonthAfterQuarter is accepted as an alias)
+    """
+
+    FREQUENCIES = ("daily", "weekly", "monthly", "quarterly", "annual")
+    RULES = (
+        "endOfPeriod",
+        "nextBusinessDay",
+        "endOfMonthAfterPeriod",
+        "endOfMonthAfterQuarter",
+    )
+
+    def __init__(self, cfg: AcquisitionTableConfig):
+        if cfg.frequency not in self.FREQUENCIES:
+            raise ValueError(f"Unknown frequency '{cfg.frequency}' for {cfg.name}")
+        if cfg.release_day_rule not in self.RULES:
+            raise ValueError(
+                f"Unknown releaseDayRule '{cfg.release_day_rule}' for {cfg.name}"
+            )
+        self.name = cfg.name
+        self.frequency = cfg.frequency
+        self.rule = cfg.release_day_rule
+        self.tz = ZoneInfo(cfg.timezone or "UTC")
+        hour, minute = (int(p) for p in (cfg.release_time or "00:00").split(":"))
+        self.release_time = time(hour, minute)
+
+    @staticmethod
+    def _month_end(year: int, month: int) -> date:
+        return date(year, month, calendar.monthrange(year, month)[1])
+
+    @staticmethod
+    def _shift_month(year: int, month: int, n: int) -> tuple[int, int]:
+        idx = year * 12 + (month - 1) + n
+        return idx // 12, idx % 12 + 1
+
+    def _period_ends(self, around: date) -> list[date]:
+        """
+        Period end dates a few periods either side of the given day, enough
+        to cover the release lag of every rule.
+        """
+        steps = range(-3, 4)
+        if self.frequency == "daily":
+            return [around + timedelta(days=k) for k in range(-7, 8)]
+        if self.frequency == "weekly":
+            friday = around + timedelta(days=4 - around.weekday())
+            return [friday + timedelta(weeks=k) for k in steps]
+        if self.frequency == "monthly":
+            months = [self._shift_month(around.year, around.month, k) for k in steps]
+            return [self._month_end(y, m) for y, m in months]
+        if self.frequency == "quarterly":
+            q_month = ((around.month - 1) // 3) * 3 + 3
+            months = [self._shift_month(around.year, q_month, 3 * k) for k in steps]
+            return [self._month_end(y, m) for y, m in months]
+        return [date(around.year + k, 12, 31) for k in steps]
+
+    def _release_date(self, period_end: date) -> date:
+        if self.rule == "endOfPeriod":
+            return period_end
+        if self.rule == "nextBusinessDay":
+            d = period_end + timedelta(days=1)
+            while d.weekday() >= 5:
+                d += timedelta(days=1)
+            return d
+        y, m = self._shift_month(period_end.year, period_end.month, 1)
+        return self._month_end(y, m)
+
+    def _releases(self, now: datetime) -> list[datetime]:
+        local_day = now.astimezone(self.tz).date()
+        releases = {
+            datetime.combine(self._release_date(p), self.release_time, self.tz)
+            for p in self._period_ends(local_day)
+            if self.frequency != "daily" or p.weekday() < 5
+        }
+        return sorted(r.astimezone(timezone.utc) for r in releases)
+
+    def last_release(self, now: datetime = None) -> datetime:
+        """
+        Most recent release at or before now (UTC).
+        """
+        now = now or datetime.now(timezone.utc)
+        return max(r for r in self._releases(now) if r <= now)
+
+    def next_release(self, now: datetime = None) -> datetime:
+        """
+        First release strictly after now (UTC).
+        """
+        now = now or datetime.now(timezone.utc)
+        return min(r for r in self._releases(now) if r > now)
@@ -0,0 +1,86 @@
+import time
+
+from strawberry.acquisition.acquire import Acquire
+from strawberry.acquisition.replay import ReplayProvider
+from strawberry.config.config_loader import ConfigLoader
+from strawberry.dimensions.dim_stocks import DimStocks
+from strawberry.dimensions.fact_qtr_financials import FactQrtFinancials
+from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.validation.validate import Validate
+
+
+class PipelineBenchmark:
+    """
+    Run acquisition, validation and the quarterly financials fact for a
+    synthetic ticker universe against recorded responses, with no network
+    and no quota. Record first with the "record" provider, then point
+    DATA_ROOT at a scratch folder holding the recordings before running this:
+    every stage writes to DATA_ROOT.
+    """
+
+    def __init__(
+        self,
+        tickers: int = 10_000,
+        latency_ms: float = None,
+        calls_per_second: float = None,
+        error_rate: float = None,
+    ):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.config = ConfigLoader()
+        self.env = self.config.environment()
+        self.tickers = ReplayProvider.synthetic_tickers(tickers)
+
+        # settings default to the "provider" block of acquisition.json
+        provider_cfg = self.config.acquisition().provider
+        if latency_ms is not None:
+            provider_cfg.latency_ms = latency_ms
+        if calls_per_second is not None:
+            provider_cfg.calls_per_second = calls_per_second
+        if error_rate is not None:
+            provider_cfg.error_rate = error_rate
+        self.provider = ReplayProvider.from_config(
+            self.env.data_root / provider_cfg.folder, provider_cfg
+        )
+
+    def _acquire(self):
+        acquirer = Acquire(self.provider, self.tickers)
+        acquirer.acquire_bulk(self.tickers)
+        acquirer.acquire_tickers(self.tickers)
+
+    def _validate(self):
+        Validate(self.tickers).validate()
+
+    def _facts(self):
+        DimStocks().main()
+        FactQrtFinancials().main()
+
+    def _measure(self, name: str, fn) -> dict:
+        calls = self.provider.calls
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        result = {
+            "stage": name,
+            "tickers": len(self.tickers),
+            "calls": self.provider.calls - calls,
+            "seconds": round(elapsed, 3),
+            "tickers_per_second": round(len(self.tickers) / elapsed, 1),
+        }
+        self.logger.info(
+            f"{name} | {result['tickers']} tickers | {result['calls']} calls | "
+            f"{result['seconds']}s | {result['tickers_per_second']} tickers/s"
+        )
+        return result
+
+    def main(self) -> list[dict]:
+        results = [
+            self._measure("acquire", self._acquire),
+            self._measure("validate", self._validate),
+            self._measure("facts", self._facts),
+        ]
+        self.logger.info(f"{self.provider.errors} injected errors")
+        return results
+
+
+if __name__ == "__main__":
+    PipelineBenchmark().main()
@@ -0,0 +1,248 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional
+
+from strawberry.acquisition.release_calendar import ReleaseCalendar
+from strawberry.config.dtos import AcquisitionTableConfig
+from strawberry.logging.logger_factory import LoggerFactory
+
+
+@dataclass
+class CacheEntry:
+    """
+    Metadata for one cached (function, symbol, datatype) response.
+    The payload itself is stored once per distinct content hash.
+    """
+
+    function: str
+    symbol: str
+    datatype: str
+    content_hash: str
+    fetched_at: str
+    expires_at: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def expired(self, now: datetime) -> bool:
+        return datetime.fromisoformat(self.expires_at) <= now
+
+
+class ResponseCache:
+    """
+    Persistent, content-addressed cache of Alpha Vantage responses.
+
+    Entries are keyed by (function, symbol, datatype) and point at a gzip
+    compressed payload named by the SHA-256 of its content, so an unchanged
+    re-download does not rewrite the payload. Entries expire at the table's
+    next expected release, derived from its frequency / release_day_rule.
+    """
+
+    DEFAULT_TTL = timedelta(hours=24)
+
+    def __init__(self, folder: Path, tables: list[AcquisitionTableConfig]):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.folder = Path(folder)
+        self.entries_dir = self.folder / "entries"
+        self.blobs_dir = self.folder / "blobs"
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.calendars = {t.name: ReleaseCalendar(t) for t in tables}
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    @staticmethod
+    def key(function: str, symbol: str, datatype: str) -> str:
+        return hashlib.sha256(f"{function}|{symbol}|{datatype}".encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.entries_dir / f"{key}.json"
+
+    def _blob_path(self, content_hash: str, datatype: str) -> Path:
+        return self.blobs_dir / f"{content_hash}.{datatype}.gz"
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def _expiry(self, function: str, now: datetime) -> datetime:
+        cal = self.calendars.get(function)
+        return cal.next_release(now) if cal else now + self.DEFAULT_TTL
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def entry(self, function: str, symbol: str, datatype: str = "json") -> CacheEntry:
+        """
+        Return the stored entry, fresh or expired, or None when never cached.
+        """
+        path = self._entry_path(self.key(function, symbol, datatype))
+        if not path.exists():
+            return None
+        try:
+            return CacheEntry(**json.loads(path.read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def is_fresh(self, function: str, symbol: str, datatype: str = "json") -> bool:
+        """
+        True when a fetch would be served from the cache without spending quota.
+        """
+        entry = self.entry(function, symbol, datatype)
+        return entry is not None and not entry.expired(datetime.now(timezone.utc))
+
+    def _read_payload(self, entry: CacheEntry) -> dict:
+        try:
+            with self.open_payload(entry) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def open_payload(self, entry: CacheEntry) -> BinaryIO:
+        """
+        Open a cached payload as a decompressing binary stream.
+        """
+        return gzip.open(self._blob_path(entry.content_hash, entry.datatype), "rb")
+
+    def open(self, function: str, symbol: str, datatype: str) -> BinaryIO:
+        """
+        Streaming counterpart of get: an open payload stream if the entry is
+        present and not expired, else None.
+        """
+        entry = self.entry(function, symbol, datatype)
+        if entry is None or entry.expired(datetime.now(timezone.utc)):
+            self._count("misses" if entry is None else "expired")
+            return None
+        self._count("hits")
+        return self.open_payload(entry)
+
+    def get(self, function: str, symbol: str, datatype: str = "json") -> dict:
+        """
+        Return the cached payload if present and not expired, else None.
+        """
+        entry = self.entry(function, symbol, datatype)
+        if entry is None:
+            self._count("misses")
+            return None
+        if entry.expired(datetime.now(timezone.utc)):
+            self._count("expired")
+            return None
+
+        data = self._read_payload(entry)
+        self._count("hits" if data is not None else "misses")
+        return data
+
+    def put(
+        self,
+        function: str,
+        symbol: str,
+        datatype: str,
+        data: dict,
+        etag: str = None,
+        last_modified: str = None,
+    ) -> CacheEntry:
+        body = json.dumps(data, separators=(",", ":")).encode()
+        content_hash = hashlib.sha256(body).hexdigest()
+        blob = self._blob_path(content_hash, datatype)
+        if not blob.exists():
+            self._atomic_write(blob, gzip.compress(body))
+
+        return self._new_entry(
+            function, symbol, datatype, content_hash, etag, last_modified
+        )
+
+    def put_stream(
+        self,
+        function: str,
+        symbol: str,
+        datatype: str,
+        chunks: Iterable[bytes],
+        etag: str = None,
+        last_modified: str = None,
+    ) -> CacheEntry:
+        """
+        Store a payload from an iterable of byte chunks, compressing and
+        hashing as it goes so the payload is never held in memory.
+        """
+        digest = hashlib.sha256()
+        tmp = self.blobs_dir / f".{uuid.uuid4().hex}.tmp"
+        with gzip.open(tmp, "wb") as f:
+            for chunk in chunks:
+                digest.update(chunk)
+                f.write(chunk)
+
+        content_hash = digest.hexdigest()
+        blob = self._blob_path(content_hash, datatype)
+        if blob.exists():
+            tmp.unlink()
+        else:
+            os.replace(tmp, blob)
+
+        return self._new_entry(
+            function, symbol, datatype, content_hash, etag, last_modified
+        )
+
+    def _new_entry(
+        self, function, symbol, datatype, content_hash, etag, last_modified
+    ) -> CacheEntry:
+        now = datetime.now(timezone.utc)
+        entry = CacheEntry(
+            function=function,
+            symbol=symbol,
+            datatype=datatype,
+            content_hash=content_hash,
+            fetched_at=now.isoformat(),
+            expires_at=self._expiry(function, now).isoformat(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._write_entry(entry)
+        return entry
+
+    def _write_entry(self, entry: CacheEntry):
+        key = self.key(entry.function, entry.symbol, entry.datatype)
+        self._atomic_write(self._entry_path(key), json.dumps(asdict(entry)).encode())
+
+    def revalidated(self, entry: CacheEntry) -> dict:
+        """
+        The upstream confirmed an expired entry is unchanged (HTTP 304):
+        extend its expiry and return the cached payload.
+        """
+        now = datetime.now(timezone.utc)
+        entry.fetched_at = now.isoformat()
+        entry.expires_at = self._expiry(entry.function, now).isoformat()
+        self._write_entry(entry)
+        return self._read_payload(entry)
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry) -> dict:
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.expired
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "hit_rate": round(self.hit_rate(), 3),
+        }
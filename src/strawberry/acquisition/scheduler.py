@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from strawberry.acquisition.release_calendar import ReleaseCalendar
+from strawberry.config.dtos import AcquisitionTableConfig
+from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.repository.storage import ParquetStorage
+
+
+@dataclass(frozen=True)
+class WorkItem:
+    """
+    One (ticker, table) partition that is due for acquisition.
+    last_update is None when the partition has never been acquired.
+    """
+
+    ticker: str
+    table: str
+    due_since: datetime
+    last_update: Optional[datetime] = None
+
+
+class AcquisitionScheduler:
+    """
+    Decides which (ticker, table) partitions are due, based on when each
+    table's release calendar says new data is expected, and ranks the due
+    work for the acquisition queue.
+    """
+
+    FREQUENCY_WEIGHT = {
+        "daily": 4.0,
+        "weekly": 3.0,
+        "monthly": 2.0,
+        "quarterly": 1.0,
+        "annual": 1.0,
+    }
+    MISSING_BOOST = 10.0
+
+    def __init__(self, storage: ParquetStorage, tables: list[AcquisitionTableConfig]):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.storage = storage
+        self.calendars = {t.name: ReleaseCalendar(t) for t in tables}
+
+    def _last_update(self, table: str, ticker: str) -> Optional[datetime]:
+        updated = self.storage.last_update(table, ticker)
+        # mtimes are naive local times
+        return updated.astimezone(timezone.utc) if updated else None
+
+    def due_item(self, table: str, ticker: str, now: datetime = None) -> WorkItem:
+        """
+        Return the work item if the partition is missing or older than the
+        table's most recent release, otherwise None.
+        """
+        now = now or datetime.now(timezone.utc)
+        last_release = self.calendars[table].last_release(now)
+        last_update = self._last_update(table, ticker)
+        if last_update is not None and last_update >= last_release:
+            return None
+        return WorkItem(ticker, table, last_release, last_update)
+
+    def is_due(self, table: str, ticker: str, now: datetime = None) -> bool:
+        return self.due_item(table, ticker, now) is not None
+
+    def due(self, tickers: list[str], now: datetime = None) -> list[WorkItem]:
+        now = now or datetime.now(timezone.utc)
+        return [
+            item
+            for ticker in tickers
+            for table in self.calendars
+            if (item := self.due_item(table, ticker, now)) is not None
+        ]
+
+    def priority(
+        self, item: WorkItem, weight: float = 1.0, now: datetime = None
+    ) -> float:
+        """
+        Queue priority of a due item: how stale it is, scaled by how often its
+        table releases, a boost for never-acquired partitions and the ticker's
+        user-supplied weight.
+        """
+        now = now or datetime.now(timezone.utc)
+        since = item.last_update or item.due_since
+        stale_days = max(0.0, (now - since).total_seconds() / 86400)
+        frequency = self.calendars[item.table].frequency
+        boost = self.MISSING_BOOST if item.last_update is None else 1.0
+        return round(
+            weight * self.FREQUENCY_WEIGHT[frequency] * boost * (1 + stale_days), 3
+        )
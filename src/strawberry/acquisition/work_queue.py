@@ -0,0 +1,122 @@
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from strawberry.acquisition.scheduler import WorkItem
+from strawberry.logging.logger_factory import LoggerFactory
+
+
+@dataclass
+class QueueItem:
+    """
+    A pending (ticker, table) acquisition, persisted between runs.
+    """
+
+    ticker: str
+    table: str
+    priority: float
+    enqueued_at: str
+    attempts: int = 0
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.ticker, self.table)
+
+
+class AcquisitionQueue:
+    """
+    Persistent priority queue of pending (ticker, table) work items.
+
+    The queue is stored as JSON and rewritten atomically, so it survives
+    across runs and a run that stops when the quota runs out resumes with
+    exactly the work that was left. Work is handed out a whole ticker at a
+    time so no ticker is left with a partial table set.
+    """
+
+    def __init__(self, path: Path):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.items: dict[tuple[str, str], QueueItem] = self._load()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _load(self) -> dict[tuple[str, str], QueueItem]:
+        if not self.path.exists():
+            return {}
+        try:
+            rows = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Unreadable queue {self.path}, starting empty: {e}")
+            return {}
+        items = [QueueItem(**row) for row in rows]
+        return {item.key: item for item in items}
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        tmp.write_text(json.dumps([asdict(i) for i in self.items.values()], indent=1))
+        os.replace(tmp, self.path)
+
+    def push(self, work: list[tuple[WorkItem, float]]):
+        """
+        Enqueue (work item, priority) pairs. Items already queued keep their
+        attempt count and take the new priority.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            for item, priority in work:
+                key = (item.ticker, item.table)
+                if key in self.items:
+                    self.items[key].priority = priority
+                else:
+                    self.items[key] = QueueItem(item.ticker, item.table, priority, now)
+            self._save()
+        self.logger.info(f"{len(self.items)} work items queued")
+
+    def next_batch(
+        self, budget: int, cost: Callable[[QueueItem], int] = lambda item: 1
+    ) -> list[QueueItem]:
+        """
+        Highest priority work that fits the budget. A ticker's items are taken
+        together or not at all; cost() lets cached items count as free.
+        """
+        by_ticker: dict[str, list[QueueItem]] = {}
+        for item in self.items.values():
+            by_ticker.setdefault(item.ticker, []).append(item)
+
+        ranked = sorted(
+            by_ticker.values(),
+            key=lambda items: max(i.priority for i in items),
+            reverse=True,
+        )
+
+        batch: list[QueueItem] = []
+        remaining = budget
+        for items in ranked:
+            needed = sum(cost(i) for i in items)
+            if needed <= remaining:
+                batch.extend(items)
+                remaining -= needed
+        return batch
+
+    def complete(self, ticker: str):
+        """
+        Drop every queued item of a ticker once all of its tables are written.
+        """
+        with self._lock:
+            for key in [k for k in self.items if k[0] == ticker]:
+                del self.items[key]
+            self._save()
+
+    def failed(self, ticker: str):
+        with self._lock:
+            for item in self.items.values():
+                if item.ticker == ticker:
+                    item.attempts += 1
+            self._save()
@@ -1,9 +1,14 @@
 from .config_loader import ConfigLoader
 from .dtos import (
     AcquisitionTableConfig,
+    ApiConfig,
+    ProviderConfig,
+    ValidationConfig,
     ChartConfig,
     ColumnConfig,
     ValTableConfig,
     Environment,
     RuleConfig,
+    StorageProfile,
+    StorageProfilesConfig,
 )
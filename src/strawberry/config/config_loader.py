@@ -15,6 +15,7 @@ class ConfigLoader:
         self.env = dto.Environment.load()
         # cache to avoid reloading
         self._acquisition_config = None
+        self._storage_profiles = None
 
     def acquisition(self) -> dto.AcquisitionConfig:
         p = os.path.join(self.env.config_path, "acquisition.json")
@@ -26,6 +27,20 @@ class ConfigLoader:
         )
         return self._acquisition_config
 
+    def storage_profiles(self) -> dto.StorageProfilesConfig:
+        p = os.path.join(self.env.config_path, "storage_profiles.json")
+        if self._storage_profiles is not None:
+            return self._storage_profiles
+        if not os.path.exists(p):
+            # pyarrow defaults everywhere
+            self._storage_profiles = dto.StorageProfilesConfig()
+            return self._storage_profiles
+        self._storage_profiles = dto.StorageProfilesConfig.load_from_file(p)
+        self.logger.info(
+            f"Loaded {len(self._storage_profiles.profiles)} storage profiles from {p}"
+        )
+        return self._storage_profiles
+
     def fact_qtr_financials(self) -> list[dto.ValTableConfig]:
         path = os.path.join(self.env.config_path, "fact_qtr_financials.json")
         tables = dto.ValTableConfig.load_from_file(path)
@@ -63,6 +78,24 @@ class ConfigLoader:
         self.logger.info(f"Loaded {len(tickers)} tickers from {path}")
         return sorted(tickers)
 
+    def ticker_weights(self) -> dict[str, float]:
+        """
+        Optional acquisition weight per ticker, read from a second column in
+        tickers.csv. Tickers without one weigh 1.0.
+        """
+        weights: dict[str, float] = {}
+        path = os.path.join(self.env.config_path, "tickers.csv")
+
+        with open(path, newline="") as csvfile:
+            reader = csv.reader(csvfile)
+            for row in reader:
+                if row:  # skip empty rows
+                    weights[row[0]] = (
+                        float(row[1]) if len(row) > 1 and row[1].strip() else 1.0
+                    )
+
+        return weights
+
     def load_dividend_params(self) -> list[dto.DividendScoreParameter]:
         path = os.path.join(self.env.config_path, "dividend_score.json")
         with open(path, "r", encoding="utf-8") as f:
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 import json
 
@@ -44,6 +44,7 @@ class AcquisitionTableConfig:
     release_day_rule: str
     release_time: str
     timezone: str
+    batch_size: int = 1
 
     @staticmethod
     def from_dict(d: Dict[str, Any], defaults: Dict[str, Any]) -> 'AcquisitionTableConfig':
@@ -63,17 +64,94 @@ class AcquisitionTableConfig:
             frequency=frequency,
             release_day_rule=release_day_rule,
             release_time=release_time,
-            timezone=timezone
+            timezone=timezone,
+            batch_size=d.get('batchSize', 1)
+        )
+
+@dataclass
+class ApiConfig:
+    """
+    Alpha Vantage quota, concurrency and HTTP connection settings shared by
+    every acquisition worker.
+    """
+    calls_per_minute: int = 5
+    calls_per_day: int = 25
+    max_workers: int = 4
+    max_connections: int = 10
+    timeout_seconds: float = 30.0
+    keepalive_seconds: float = 30.0
+    cache_folder: str = "cache"
+
+    @staticmethod
+    def from_dict(d: Dict[str, Any]) -> 'ApiConfig':
+        return ApiConfig(
+            calls_per_minute=d.get('callsPerMinute', 5),
+            calls_per_day=d.get('callsPerDay', 25),
+            max_workers=d.get('maxWorkers', 4),
+            max_connections=d.get('maxConnections', 10),
+            timeout_seconds=d.get('timeoutSeconds', 30.0),
+            keepalive_seconds=d.get('keepaliveSeconds', 30.0),
+            cache_folder=d.get('cacheFolder', "cache")
+        )
+
+@dataclass
+class ProviderConfig:
+    """
+    Which data provider feeds acquisition: the live Alpha Vantage API, the
+    API with every response recorded to disk, or an offline replay of those
+    recordings with simulated latency, throughput and errors.
+    """
+    name: str = "alphaVantage"
+    folder: str = "recordings"
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    calls_per_second: float = 0.0
+    calls_per_day: int = 1_000_000
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+
+    @staticmethod
+    def from_dict(d: Dict[str, Any]) -> 'ProviderConfig':
+        return ProviderConfig(
+            name=d.get('name', "alphaVantage"),
+            folder=d.get('folder', "recordings"),
+            latency_ms=d.get('latencyMs', 0.0),
+            jitter_ms=d.get('jitterMs', 0.0),
+            calls_per_second=d.get('callsPerSecond', 0.0),
+            calls_per_day=d.get('callsPerDay', 1_000_000),
+            error_rate=d.get('errorRate', 0.0),
+            seed=d.get('seed')
+        )
+
+@dataclass
+class ValidationConfig:
+    """
+    Process pool settings for validating many tickers at once. Work is
+    scheduled in chunks of chunk_size tickers of one table; max_workers of
+    None uses every core, 1 validates in-process.
+    """
+    max_workers: Optional[int] = None
+    chunk_size: int = 32
+
+    @staticmethod
+    def from_dict(d: Dict[str, Any]) -> 'ValidationConfig':
+        return ValidationConfig(
+            max_workers=d.get('maxWorkers'),
+            chunk_size=d.get('chunkSize', 32)
         )
 
 @dataclass
 class AcquisitionConfig:
     """
-    Top-level configuration object that includes defaults and
-    a list of table-specific configs.
+    Top-level configuration object that includes defaults, API quota settings,
+    a list of table-specific configs and the multi-symbol bulk tables.
     """
     defaults: Dict[str, Any]
     tables: List[AcquisitionTableConfig]
+    api: ApiConfig = field(default_factory=ApiConfig)
+    bulk_tables: List[AcquisitionTableConfig] = field(default_factory=list)
+    provider: ProviderConfig = field(default_factory=ProviderConfig)
+    validation: ValidationConfig = field(default_factory=ValidationConfig)
    
     def table_names(self) -> list[str]:
         return [t.name for t in self.tables]
@@ -92,4 +170,20 @@ class AcquisitionConfig:
             for tbl in data.get('tables', [])
         ]
 
-        return AcquisitionConfig(defaults=defaults, tables=tables)
+        api = ApiConfig.from_dict(data.get('api', {}))
+        bulk_tables = [
+            AcquisitionTableConfig.from_dict(tbl, defaults)
+            for tbl in data.get('bulkTables', [])
+        ]
+
+        provider = ProviderConfig.from_dict(data.get('provider', {}))
+        validation = ValidationConfig.from_dict(data.get('validation', {}))
+
+        return AcquisitionConfig(
+            defaults=defaults,
+            tables=tables,
+            api=api,
+            bulk_tables=bulk_tables,
+            provider=provider,
+            validation=validation,
+        )
@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Union
+import json
+
+
+@dataclass
+class StorageProfile:
+    """
+    Parquet write settings for a layer or table: codec and level, rows per
+    row group, sort keys, dictionary columns and statistics/page index.
+    Sort keys not present in a frame are skipped. An unset codec leaves
+    pyarrow's default (snappy). mirror keeps a memory-mapped Arrow copy of
+    the table for readers (see ArrowMirror).
+    """
+    compression: Optional[str] = None
+    compression_level: Optional[int] = None
+    row_group_rows: Optional[int] = None
+    sort_by: List[str] = field(default_factory=list)
+    # True for every column, or a list of column names
+    dictionary: Union[bool, List[str]] = True
+    statistics: Union[bool, List[str]] = True
+    page_index: bool = False
+    mirror: bool = False
+
+    @staticmethod
+    def from_dict(d: Dict[str, Any], base: 'StorageProfile' = None) -> 'StorageProfile':
+        base = base or StorageProfile()
+        return StorageProfile(
+            compression=d.get('compression', base.compression),
+            compression_level=d.get('compressionLevel', base.compression_level),
+            row_group_rows=d.get('rowGroupRows', base.row_group_rows),
+            sort_by=d.get('sortBy', base.sort_by),
+            dictionary=d.get('dictionary', base.dictionary),
+            statistics=d.get('statistics', base.statistics),
+            page_index=d.get('pageIndex', base.page_index),
+            mirror=d.get('mirror', base.mirror)
+        )
+
+    def write_options(self) -> Dict[str, Any]:
+        """
+        Keyword arguments for pq.write_table, pq.ParquetWriter and
+        DataFrame.to_parquet (pyarrow engine).
+        """
+        options = {
+            'use_dictionary': self.dictionary,
+            'write_statistics': self.statistics,
+            'write_page_index': self.page_index,
+        }
+        if self.compression is not None:
+            options['compression'] = self.compression
+        if self.compression_level is not None:
+            options['compression_level'] = self.compression_level
+        if self.row_group_rows is not None:
+            options['row_group_size'] = self.row_group_rows
+        return options
+
+    def sort_keys(self, columns: List[str]) -> List[str]:
+        return [c for c in self.sort_by if c in columns]
+
+
+@dataclass
+class StorageProfilesConfig:
+    """
+    Named write profiles, the profile each storage layer uses, and per-table
+    overrides layered on top of it.
+    """
+    profiles: Dict[str, StorageProfile] = field(default_factory=dict)
+    layers: Dict[str, str] = field(default_factory=dict)
+    tables: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def for_table(self, layer: Optional[str], table_name: str) -> StorageProfile:
+        profile = self.profiles.get(self.layers.get(layer), StorageProfile())
+        override = self.tables.get(table_name)
+        if override is None:
+            return replace(profile)
+        if 'profile' in override:
+            if override['profile'] not in self.profiles:
+                raise ValueError(
+                    f"Unknown storage profile {override['profile']!r} for {table_name}"
+                )
+            profile = self.profiles[override['profile']]
+        return StorageProfile.from_dict(override, profile)
+
+    @staticmethod
+    def from_dict(d: Dict[str, Any]) -> 'StorageProfilesConfig':
+        profiles = {
+            name: StorageProfile.from_dict(p) for name, p in d.get('profiles', {}).items()
+        }
+        layers = d.get('layers', {})
+        for layer, name in layers.items():
+            if name not in profiles:
+                raise ValueError(f"Unknown storage profile {name!r} for layer {layer!r}")
+        return StorageProfilesConfig(
+            profiles=profiles,
+            layers=layers,
+            tables=d.get('tables', {})
+        )
+
+    @staticmethod
+    def load_from_file(path: str) -> 'StorageProfilesConfig':
+        with open(path, 'r', encoding='utf-8') as f:
+            return StorageProfilesConfig.from_dict(json.load(f))
@@ -1,6 +1,9 @@
 from .AcquisitionTableConfig import (
     AcquisitionConfig,
     AcquisitionTableConfig,
+    ApiConfig,
+    ProviderConfig,
+    ValidationConfig,
     ColumnConfig,
 )
 from .ChartConfig import ChartConfig
@@ -8,4 +11,5 @@ from .ConsolidationTableConfig import ValTableConfig, ValColConfig
 from .DividendScoreParameter import DividendScoreParameter
 from .Environment import Environment
 from .RuleConfig import RuleConfig
+from .StorageProfile import StorageProfile, StorageProfilesConfig
 from .FactTableConfig import FactTableConfig, FactColConfig
@@ -0,0 +1,123 @@
+import time
+
+import pandas as pd
+
+from strawberry.config.config_loader import ConfigLoader
+from strawberry.data_utilities.series_conversion import SeriesConversion
+from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.repository.storage import ParquetStorage
+
+
+class ConversionBenchmark:
+    """
+    Time SeriesConversion's Arrow numeric coercion against the pandas path
+    it replaces, over every float and integer column of an acquired table.
+    The acquired partitions are stacked, then tiled up to rows, to stand in
+    for a wide partition of the whole universe.
+    """
+
+    # tokens both paths must convert alike, each next to a plain number
+    EDGE_CASES = (
+        " 7 ", "+7", "-7", "1e3", "2.5", ".5", "0x10", "1,000", "inf", "-inf",
+        "1e30", "1e400", "nan", "n/a", "None", "-", "",
+    )
+
+    def __init__(self, table_name: str = "BALANCE_SHEET", rows: int = 100_000, repeat: int = 3):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.config = ConfigLoader()
+        self.env = self.config.environment()
+        self.table = next(t for t in self.config.acquisition().tables if t.name == table_name)
+        self.rows = rows
+        self.repeat = repeat
+        self.series = SeriesConversion()
+        self.acq_store = ParquetStorage(self.env.acquisition_folder)
+
+    def _frame(self) -> pd.DataFrame:
+        df = self.acq_store.read_df(self.table.name)
+        if df is None or df.empty:
+            raise ValueError(f"{self.table.name} has not been acquired")
+        tiles = -(-self.rows // len(df))
+        return pd.concat([df] * tiles, ignore_index=True).head(self.rows)
+
+    def _seconds(self, fn, columns: list[pd.Series]) -> float:
+        best = float("inf")
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            for series in columns:
+                fn(series)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    @staticmethod
+    def _mismatches(old: pd.Series, new: pd.Series) -> int:
+        same = (old == new).fillna(False) | (old.isna() & new.isna())
+        return int((~same.to_numpy(dtype=bool)).sum())
+
+    def _measure(self, kind: str, df: pd.DataFrame, pandas_fn, arrow_fn) -> dict:
+        columns = [df[c.name] for c in self.table.columns if c.type == kind and c.name in df]
+        if not columns:
+            return None
+        pandas_seconds = self._seconds(pandas_fn, columns)
+        arrow_seconds = self._seconds(arrow_fn, columns)
+        result = {
+            "table": self.table.name,
+            "type": kind,
+            "columns": len(columns),
+            "rows": len(df),
+            "pandas_seconds": round(pandas_seconds, 4),
+            "arrow_seconds": round(arrow_seconds, 4),
+            "speedup": round(pandas_seconds / arrow_seconds, 1),
+            "mismatches": sum(self._mismatches(pandas_fn(s), arrow_fn(s)) for s in columns),
+        }
+        self.logger.info(
+            f"{self.table.name} | {kind} | {result['columns']} columns x {result['rows']} rows | "
+            f"pandas {result['pandas_seconds']}s | arrow {result['arrow_seconds']}s | "
+            f"{result['speedup']}x | {result['mismatches']} mismatches"
+        )
+        return result
+
+    @staticmethod
+    def _outcome(fn, series: pd.Series):
+        try:
+            return fn(series)
+        except (TypeError, ValueError) as e:
+            return type(e).__name__
+
+    def parity(self) -> int:
+        """
+        Convert each EDGE_CASES token with both paths, as float and as
+        integer; returns the number of tokens on which they disagree,
+        either in value or in the error raised.
+        """
+        paths = {
+            "float": (self.series._to_float_pandas, self.series.to_float),
+            "integer": (self.series._to_integer_pandas, self.series.to_integer),
+        }
+        mismatches = 0
+        for kind, (pandas_fn, arrow_fn) in paths.items():
+            for token in self.EDGE_CASES:
+                series = pd.Series(["1", token], dtype=object)
+                old = self._outcome(pandas_fn, series)
+                new = self._outcome(arrow_fn, series)
+                if isinstance(old, str) or isinstance(new, str):
+                    same = isinstance(old, str) and isinstance(new, str) and old == new
+                else:
+                    same = not self._mismatches(old, new)
+                if not same:
+                    mismatches += 1
+                    self.logger.warning(f"{kind} | {token!r} | pandas {old!r} | arrow {new!r}")
+        self.logger.info(f"parity | {len(self.EDGE_CASES)} tokens | {mismatches} mismatches")
+        return mismatches
+
+    def main(self) -> list[dict]:
+        self.parity()
+        df = self._frame()
+        results = [
+            self._measure("float", df, self.series._to_float_pandas, self.series.to_float),
+            self._measure("integer", df, self.series._to_integer_pandas, self.series.to_integer),
+        ]
+        return [r for r in results if r is not None]
+
+
+if __name__ == "__main__":
+    ConversionBenchmark().main()
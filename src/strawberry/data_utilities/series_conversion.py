@@ -1,5 +1,8 @@
 import re
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import logging
 from typing import Sequence, Optional
 
@@ -13,6 +16,13 @@ class SeriesConversion:
     DATE_RE = re.compile(
         r"((?:00|19|20)\d{2}-\d{2}-\d{2})"
     )  # first ISO-like date in string
+    ISO_FORMAT = "%Y-%m-%d"
+    ISO_CENTURIES = ("19", "20")
+    # plain numbers Arrow can cast: exponents below 100 cannot overflow
+    # (pd.to_numeric makes that NaN, not inf), 18 digits always fit int64
+    # and Arrow's int64 cast rejects a leading '+'
+    FLOAT_RE = r"^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d{1,2})?$"
+    INTEGER_RE = r"^-?\d{1,18}$"
 
     def __init__(self):
         # set up logger and type-to-function mapping
@@ -53,21 +63,45 @@ class SeriesConversion:
             self.logger.warning(f"{log_prefix} {col.name} | {col.type} | {e}")
             raise
 
-    def to_datetime(
-        self,
-        series: pd.Series,
-        fmt: Optional[str] = "%Y-%m-%d",
-        *,
-        nullable: bool = True,
-        null_action: Optional[str] = None,
-    ) -> pd.Series:
+    def _parse_iso(self, series: pd.Series) -> Optional[tuple[np.ndarray, np.ndarray]]:
         """
-        Convert a Series to datetime.
-        - Strips tags/extra whitespace.
-        - Extracts the first ISO date substring.
-        - Fixes years starting '00' -> 2000s.
-        - Respects NONE_TOKENS as nulls.
-        - If nullable is False and no null_action provided, forward-fills rows that were NONE_TOKENS.
+        Strict fast path: parse the values that already are a bare ISO date
+        with Arrow's compute kernels, no Python-object string passes.
+        Returns (datetime64[ns] values, mask of parsed rows), or None when
+        the series is not a string column.
+        """
+        try:
+            arr = pa.array(series, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            return None
+        if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+            return None
+
+        # exactly YYYY-MM-DD in the centuries DATE_RE accepts ('00YY' is cleaned)
+        candidate = pc.and_(
+            pc.equal(pc.utf8_length(arr), 10),
+            pc.is_in(
+                pc.utf8_slice_codeunits(arr, 0, 2),
+                value_set=pa.array(self.ISO_CENTURIES),
+            ),
+        )
+        parsed = pc.strptime(arr, format=self.ISO_FORMAT, unit="s", error_is_null=True)
+
+        # strptime rolls impossible days over (02-30 -> 03-01) and takes
+        # non-ASCII digits: the parsed date must print as the value written
+        exact = pc.equal(pc.strftime(parsed, format=self.ISO_FORMAT), arr)
+        ok = pc.fill_null(pc.and_(candidate, exact), False)
+        # rejected rows may hold years outside the nanosecond range
+        parsed = pc.if_else(ok, parsed, pa.scalar(None, type=parsed.type))
+        values = pc.cast(parsed, pa.timestamp("ns")).to_numpy(
+            zero_copy_only=False, writable=True
+        )
+        return values, ok.to_numpy(zero_copy_only=False)
+
+    def _clean_dates(self, series: pd.Series) -> tuple[pd.Series, pd.Series]:
+        """
+        Slow cleaning path: strip tags/whitespace, extract the first ISO date,
+        fix '00YY' years. Returns the cleaned strings and the NONE_TOKENS mask.
         """
         # Normalize to string, drop HTML-ish tags, collapse whitespace
         clean = (
@@ -84,34 +118,157 @@ class SeriesConversion:
         clean = clean.str.replace(r"^00(\d{2})", r"20\1", regex=True)
 
         mask_none = clean.astype(str).str.strip().isin(self.NONE_TOKENS)
+        return clean, mask_none
 
+    def to_datetime(
+        self,
+        series: pd.Series,
+        fmt: Optional[str] = "%Y-%m-%d",
+        *,
+        nullable: bool = True,
+        null_action: Optional[str] = None,
+    ) -> pd.Series:
+        """
+        Convert a Series to datetime.
+        - Parses clean ISO dates directly with Arrow (the common case).
+        - Otherwise strips tags/extra whitespace.
+        - Extracts the first ISO date substring.
+        - Fixes years starting '00' -> 2000s.
+        - Respects NONE_TOKENS as nulls.
+        - If nullable is False and no null_action provided, forward-fills rows that were NONE_TOKENS.
+        """
+        fast = self._parse_iso(series) if fmt in (None, self.ISO_FORMAT) else None
+        if fast is None:
+            values = np.full(len(series), np.datetime64("NaT"), dtype="datetime64[ns]")
+            parsed = np.zeros(len(series), dtype=bool)
+        else:
+            values, parsed = fast
+
+        # only the rows the strict parse rejected take the cleaning path
+        rest = ~parsed
+        mask_none = np.zeros(len(series), dtype=bool)
+        if rest.any():
+            clean, rest_none = self._clean_dates(series[rest])
+            clean = clean.where(~rest_none, pd.NA)
+            slow = pd.to_datetime(clean, format=fmt, errors="coerce")
+            values[rest] = slow.to_numpy(dtype="datetime64[ns]")
+            mask_none[rest] = rest_none.to_numpy()
+
+        dt = pd.Series(values, index=series.index, name=series.name)
         if not nullable and not null_action:
-            # mark NONE_TOKENS as NA
-            clean = clean.where(~mask_none, pd.NA)
-            dt = pd.to_datetime(clean, format=fmt, errors="coerce")
             # forward-fill only those rows that were NONE_TOKENS
             return dt.where(~mask_none, dt.ffill())
 
         # default path (nullable or has explicit null_action you’ll handle elsewhere)
-        clean[mask_none] = pd.NA
-        return pd.to_datetime(clean, format=fmt, errors="coerce")
+        return dt
 
-    def to_float(self, series: pd.Series) -> pd.Series:
+    def _parse_numeric(
+        self, series: pd.Series, pattern: str, type: pa.DataType
+    ) -> Optional[tuple[pa.Array, np.ndarray]]:
         """
-        Convert Series to float64, honoring NONE_TOKENS as nulls.
+        Fast path: trim the values, null NONE_TOKENS and cast the plain
+        numbers matching pattern straight to type with Arrow's compute
+        kernels, no Python-object string passes. Returns (Arrow values, mask
+        of the rows left for pd.to_numeric), or None when the series is not
+        a string column.
         """
+        try:
+            arr = pa.array(series, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            return None
+        if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+            return None
+
+        # pd.to_numeric ignores surrounding whitespace, Arrow's cast does not
+        clean = pc.utf8_trim_whitespace(arr)
+        none = pc.is_in(clean, value_set=pa.array(self.NONE_TOKENS))
+
+        # usually every value is a number: one cast, no regex. Beyond what
+        # pattern admits, Arrow's cast also takes hex integers ('0x10') and
+        # overflows to inf where pd.to_numeric gives NaN; those columns take
+        # the regex split
+        hexadecimal = pc.any(pc.match_substring(clean, "0x", ignore_case=True)).as_py()
+        if not hexadecimal:
+            try:
+                values = pc.cast(
+                    pc.if_else(none, pa.scalar(None, pa.string()), clean), type
+                )
+                if not (
+                    pa.types.is_floating(type) and pc.any(pc.is_inf(values)).as_py()
+                ):
+                    return values, np.zeros(len(arr), dtype=bool)
+            except pa.ArrowInvalid:
+                pass
+
+        number = pc.fill_null(pc.match_substring_regex(clean, pattern), False)
+        values = pc.cast(pc.if_else(number, clean, pa.scalar(None, pa.string())), type)
+
+        # e.g. "inf", "1,000" or "n/a": pd.to_numeric decides
+        rest = pc.invert(pc.or_(pc.or_(number, pc.fill_null(none, False)), pc.is_null(arr)))
+        return values, rest.to_numpy(zero_copy_only=False)
+
+    def _to_float_pandas(self, series: pd.Series) -> pd.Series:
         clean = series.copy()
         mask = clean.astype(str).str.strip().isin(self.NONE_TOKENS)
         clean[mask] = pd.NA
         clean = pd.to_numeric(clean, errors="coerce")
         return clean.astype("float64", copy=False)
 
-    def to_integer(self, series: pd.Series) -> pd.Series:
-        """
-        Convert Series to nullable pandas Int64, honoring NONE_TOKENS as nulls.
-        """
+    @staticmethod
+    def _as_int64(values: pd.Series) -> pd.Series:
+        # infinities raise OverflowError, unlike the TypeError of a
+        # fraction: both mean the column is not an integer column
+        try:
+            return values.astype("Int64", copy=False)
+        except OverflowError as e:
+            raise TypeError(str(e)) from e
+
+    def _to_integer_pandas(self, series: pd.Series) -> pd.Series:
         clean = series.copy()
         mask = clean.astype(str).str.strip().isin(self.NONE_TOKENS)
         clean[mask] = pd.NA
         clean = pd.to_numeric(clean, errors="coerce", downcast="integer")
-        return clean.astype("Int64", copy=False)
+        return self._as_int64(clean)
+
+    def to_float(self, series: pd.Series) -> pd.Series:
+        """
+        Convert Series to float64, honoring NONE_TOKENS as nulls.
+        - Numeric columns are cast as they are.
+        - String columns are parsed with Arrow; only values that are not a
+          plain decimal number or a NONE_TOKEN go through pd.to_numeric.
+        """
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            return series.astype("float64")
+        fast = self._parse_numeric(series, self.FLOAT_RE, pa.float64())
+        if fast is None:
+            return self._to_float_pandas(series)
+
+        values, rest = fast
+        values = values.to_numpy(zero_copy_only=False, writable=True)
+        if rest.any():
+            slow = pd.to_numeric(series[rest], errors="coerce")
+            values[rest] = slow.to_numpy(dtype="float64", na_value=np.nan)
+        return pd.Series(values, index=series.index, name=series.name)
+
+    def to_integer(self, series: pd.Series) -> pd.Series:
+        """
+        Convert Series to nullable pandas Int64, honoring NONE_TOKENS as nulls.
+        String columns take the same Arrow path as to_float; values with a
+        fraction, or infinities, still raise TypeError.
+        """
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            return series.astype("Int64")
+        fast = self._parse_numeric(series, self.INTEGER_RE, pa.int64())
+        if fast is None:
+            return self._to_integer_pandas(series)
+
+        values, rest = fast
+        data = pc.fill_null(values, 0).to_numpy(zero_copy_only=False, writable=True)
+        mask = values.is_null().to_numpy(zero_copy_only=False, writable=True)
+        if rest.any():
+            slow = self._as_int64(pd.to_numeric(series[rest], errors="coerce"))
+            data[rest] = slow.to_numpy(dtype="int64", na_value=0)
+            mask[rest] = slow.isna().to_numpy()
+        return pd.Series(
+            pd.arrays.IntegerArray(data, mask), index=series.index, name=series.name
+        )
@@ -37,17 +37,41 @@ class DimStocks:
         dimensioned_tickers = self.dim_store.unique_column_list(
             self.TABLE_NAME, "symbol"
         )
-        # Filter and return tickers not present in the dimensioned list
+        # Filter and return tickers not present in the dimensioned set
+        dimensioned_tickers = set(dimensioned_tickers)
         return [ticker for ticker in tickers if ticker not in dimensioned_tickers]
 
+    def _tickers_changed(self) -> list[str]:
+        """
+        Tickers whose validated table changed since DIM_STOCKS was last written.
+        """
+        # re-read: tickers may have been validated since this was created
+        self.tickers = sorted(self.val_store.get_tickers(self.cfg.name))
+        since = self.dim_store.last_update(self.TABLE_NAME)
+        if since is None:
+            return self.tickers
+        return [
+            t
+            for t in self.tickers
+            if (updated := self.val_store.last_update(self.cfg.name, t)) is not None
+            and updated > since
+        ]
+
     def dimension_ticker(self):
         log_prefix = f" {self.cfg.name} | "
 
-        # read the table from the validation folder
-        df = self.val_store.read_df(self.cfg.name)
-
-        # get required columns
-        df = df[self.cfg.in_names()]
+        # only upsert the tickers that changed
+        tickers = self._tickers_changed()
+        if not tickers:
+            self.logger.info(f"{log_prefix} up to date")
+            return
+
+        # read the required columns from the validation folder
+        df = self.val_store.read_df(
+            self.cfg.name,
+            columns=self.cfg.in_names(),
+            filters=[("symbol", "in", tickers)],
+        )
 
         # rename columns
         df.rename(columns=self.cfg.in_to_out_map(), inplace=True)
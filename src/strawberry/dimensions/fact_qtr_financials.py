@@ -11,6 +11,8 @@ from strawberry.logging.logger_factory import LoggerFactory
 class FactQrtFinancials:
 
     TABLE_NAME = "FACT_QTR_FINANCIALS"
+    # tickers read per scan in main: only a chunk's frames are held in memory
+    CHUNK_SIZE = 64
 
     def __init__(self):
         self.logger = LoggerFactory().create_logger(__name__)
@@ -67,15 +69,16 @@ class FactQrtFinancials:
         )
         return df
 
-    def _consolidate_table(self, table: ValTableConfig, ticker: str) -> pd.DataFrame:
-        df = self.val_store.read_df(table.name, ticker)
+    def _consolidate_table(
+        self, table: ValTableConfig, ticker: str, df: pd.DataFrame = None
+    ) -> pd.DataFrame:
+        # only the required columns are read
+        if df is None:
+            df = self.val_store.read_df(table.name, ticker, columns=table.in_names())
         if df is None or df.empty:
             self.logger.warning(f"Table {table.name} is empty for {ticker}.")
             return pd.DataFrame()
 
-        # get required columns
-        df = df[table.in_names()]
-
         # rename columns
         df.rename(columns=table.in_to_out_map(), inplace=True)
 
@@ -97,10 +100,17 @@ class FactQrtFinancials:
         self.logger.info(f"Table {table.name} consolidated for {ticker}.")
         return df if df.empty else df.merge(df, on=dates[0], how="left")
 
-    def fact_ticker(self, ticker: str) -> bool:
+    def fact_ticker(self, ticker: str, frames: dict = None) -> bool:
+        """
+        frames optionally holds the pre-read {table: {ticker: frame}} of main;
+        without it each table is read for the ticker.
+        """
         df = pd.DataFrame()
         for table in self.cfg:
-            df2 = self._consolidate_table(table, ticker)
+            pre_read = (
+                frames[table.name].get(ticker, pd.DataFrame()) if frames else None
+            )
+            df2 = self._consolidate_table(table, ticker, pre_read)
             if not df2.empty:
                 df = df.merge(df2) if not df.empty else df2
             else:
@@ -113,9 +123,21 @@ class FactQrtFinancials:
         self.logger.info(f"{ticker} | FACT Qtrly Financials successful")
         return True
 
-    def main(self):
-        for ticker in self.tickers:
-            self.fact_ticker(ticker)
+    def main(self, chunk_size: int = CHUNK_SIZE):
+        # one scan per table for each chunk of tickers, rather than one read
+        # per ticker
+        for start in range(0, len(self.tickers), max(1, chunk_size)):
+            chunk = self.tickers[start : start + chunk_size]
+            frames = {
+                table.name: dict(
+                    self.val_store.iter_tickers(
+                        table.name, chunk, columns=table.in_names()
+                    )
+                )
+                for table in self.cfg
+            }
+            for ticker in chunk:
+                self.fact_ticker(ticker, frames)
 
 
 if __name__ == "__main__":
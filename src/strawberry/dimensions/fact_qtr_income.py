@@ -21,11 +21,13 @@ class BaseFactProcessor(ABC):
         self.dim_stock_srv = DimStocks()
         self.tickers = sorted(self.dim_stock_srv.tickers_dimensioned())
 
-    def fact_ticker(self, ticker: str) -> bool:
-        df = self.val_store.read_df(self.cfg.val_table_name, ticker)
-        df = df[self.cfg.data_col_names()]
+    def fact_ticker(self, ticker: str, df: pd.DataFrame = None) -> bool:
+        if df is None:
+            df = self.val_store.read_df(
+                self.cfg.val_table_name, ticker, columns=self.cfg.data_col_names()
+            )
 
-        if not df.empty:
+        if df is not None and not df.empty:
             df["symbol"] = ticker
             self.dim_store.write_df(df, self.cfg.fact_table_name, ["symbol"])
             self.logger.info(f"FACT {self.cfg.fact_table_name} created for {ticker}.")
@@ -36,8 +38,12 @@ class BaseFactProcessor(ABC):
         return True
 
     def main(self):
-        for ticker in self.tickers:
-            self.fact_ticker(ticker)
+        # one scan of the validated table for every dimensioned ticker
+        frames = self.val_store.iter_tickers(
+            self.cfg.val_table_name, self.tickers, columns=self.cfg.data_col_names()
+        )
+        for ticker, df in frames:
+            self.fact_ticker(ticker, df)
 
 
 class FactQtrIncomeProcessor(BaseFactProcessor):
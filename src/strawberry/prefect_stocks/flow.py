@@ -6,6 +6,7 @@ from strawberry.dimensions.fact_qtr_financials import FactQrtFinancials
 from strawberry.validation.validate import Validate
 from strawberry.dimensions.dim_stocks import DimStocks
 from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.repository.compaction import Compactor
 
 
 class PrefectPipeline:
@@ -18,6 +19,7 @@ class PrefectPipeline:
         self.validate_srv = Validate()
         self.dim_stock_srv = DimStocks()
         self.fact_q_fin_srv = FactQrtFinancials()
+        self.compactor = Compactor()
 
     @task
     def read_tickers_to_acquire(self) -> list[str]:
@@ -32,10 +34,20 @@ class PrefectPipeline:
     def acquire_stock(self, ticker: str) -> bool:
         return self.acquire_srv.acquire_ticker(ticker=ticker)
 
+    @task
+    def acquire_stocks(self):
+        # acquires only the partitions that are due, within today's quota
+        return self.acquire_srv.main()
+
     @task
     def validate_stock(self, ticker: str) -> bool:
         return self.validate_srv.validate_ticker(ticker=ticker)
 
+    @task
+    def validate_stocks(self, tickers: list[str]) -> dict[str, bool]:
+        # chunks of tickers per table, spread across a process pool
+        return self.validate_srv.validate_tickers(tickers)
+
     @task
     def dimension_stock(self) -> bool:
         return self.dim_stock_srv.dimension_ticker()
@@ -44,6 +56,15 @@ class PrefectPipeline:
     def fact_qtr_financials(self, ticker: str) -> bool:
         return self.fact_q_fin_srv.fact_ticker(ticker)
 
+    @task
+    def fact_qtr_financials_all(self):
+        return self.fact_q_fin_srv.main()
+
+    @task
+    def compact_storage(self):
+        # merge the small fragments each run leaves in the partitions
+        return [r.to_dict() for r in self.compactor.main()]
+
     @task
     def fact_qtr_ratios(self, ticker: str) -> bool:
         return True
@@ -58,24 +79,18 @@ class PrefectPipeline:
 
     @flow
     def pipeline(self):
-        # get a list of tickers to acquire
-        tickers = self.read_tickers_to_acquire()
-        for t in tickers:
-            success = self.acquire_stock(t)
-            if not success:
-                # skip to validation
-                break
-
-        # validate any files that have been acquired but not yet validated
+        # fetch due partitions across workers until the daily quota is spent
+        self.acquire_stocks()
+
+        # validate any partitions acquired or refreshed since last validated
         tickers = self.read_tickers_to_validate()
-        for t in tickers:
-            self.validate_stock(t)
+        self.validate_stocks(tickers)
 
         # Dimensions are run across all validated tables
         self.dimension_stock()
-        tickers = self.dim_stock_srv.tickers_dimensioned()
-        for t in tickers:
-            self.fact_qtr_financials(t)
+        self.fact_q_fin_srv.tickers = sorted(self.dim_stock_srv.tickers_dimensioned())
+        self.fact_qtr_financials_all()
+        self.compact_storage()
         """
             for t in self.dim_stock_srv.tickers_dimensioned():
             if not self.dimension_stock.submit(ticker):
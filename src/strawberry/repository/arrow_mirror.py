@@ -0,0 +1,113 @@
+import hashlib
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable
+
+import pyarrow as pa
+
+from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.repository.manifest import Catalog
+
+
+class ArrowMirror:
+    """
+    Uncompressed Arrow IPC copies of hot tables, read through memory maps.
+
+    A mirror is named after the files the catalog lists for the table, so
+    it is rebuilt only when the table changes and a pinned snapshot keeps
+    using the mirror of its own version. Mapped tables are zero-copy views
+    of the OS page cache, shared by every session and worker of a host
+    instead of each decoding its own copy of the parquet files. Within a
+    process one mapping per mirror is kept, so readers pinned to different
+    versions of a table do not evict each other's; a mirror is built under
+    its own lock, without holding up reads of other tables.
+    """
+
+    FOLDER = "_mirror"
+    # mirrors of superseded versions older than this are deleted
+    RETAIN_SECONDS = 3600
+
+    _mapped: dict[Path, pa.Table] = {}
+    # one lock per mirror path serialises its build
+    _locks: dict[Path, threading.Lock] = {}
+    # guards _mapped and _locks
+    _lock = threading.Lock()
+
+    def __init__(self, root: Path):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.folder = Path(root) / self.FOLDER
+
+    @staticmethod
+    def _key(catalog: Catalog, table_name: str) -> str:
+        table = catalog.table(table_name)
+        files = sorted(
+            f"{f.path}:{f.bytes}:{f.mtime}"
+            for p in table.partitions.values()
+            for f in p.files
+        )
+        return hashlib.sha256("\n".join(files).encode()).hexdigest()[:16]
+
+    def path(self, catalog: Catalog, table_name: str) -> Path:
+        return self.folder / f"{table_name}-{self._key(catalog, table_name)}.arrow"
+
+    def table(
+        self, catalog: Catalog, table_name: str, load: Callable[[], pa.Table]
+    ) -> pa.Table:
+        """
+        The mapped mirror of the table at the catalog's version, built with
+        load() when missing. Returns None when the table does not exist.
+        """
+        if not catalog.exists(table_name):
+            return None
+        path = self.path(catalog, table_name)
+        with self._lock:
+            mapped = self._mapped.get(path)
+            lock = self._locks.setdefault(path, threading.Lock())
+        if mapped is not None:
+            return mapped
+
+        with lock:
+            # built meanwhile by another thread
+            with self._lock:
+                mapped = self._mapped.get(path)
+            if mapped is not None:
+                return mapped
+            if not path.exists():
+                data = load()
+                if data is None:
+                    return None
+                self._write(data, path)
+                self._prune(table_name, path)
+            mapped = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+            with self._lock:
+                self._mapped[path] = mapped
+            return mapped
+
+    def _write(self, data: pa.Table, path: Path):
+        self.folder.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, data.schema) as writer:
+                writer.write_table(data)
+        os.replace(tmp, path)
+        self.logger.info(f"{path.stem} | mirrored {data.num_rows} rows")
+
+    def _prune(self, table_name: str, current: Path):
+        expired = time.time() - self.RETAIN_SECONDS
+        for path in self.folder.glob(f"{table_name}-*.arrow"):
+            if path == current:
+                continue
+            try:
+                if path.stat().st_mtime >= expired:
+                    continue
+                # sessions still holding the mapping keep it alive
+                with self._lock:
+                    self._mapped.pop(path, None)
+                    self._locks.pop(path, None)
+                path.unlink()
+            except OSError:
+                # still mapped by another process on platforms that forbid it
+                continue
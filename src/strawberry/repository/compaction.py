@@ -0,0 +1,246 @@
+import math
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from strawberry.config.config_loader import ConfigLoader
+from strawberry.config.dtos import StorageProfile
+from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.repository.storage import ParquetStorage
+from strawberry.repository.upsert_log import UpsertLog
+
+
+@dataclass
+class CompactionReport:
+    """
+    Before/after file counts, bytes and read latency of one table. Latency
+    is the mean read_df time over the sampled partitions.
+    """
+
+    folder: str
+    table: str
+    partitions: int = 0
+    files_before: int = 0
+    files_after: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    read_seconds_before: float = 0.0
+    read_seconds_after: float = 0.0
+    sampled: list[str] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> float:
+        if not self.read_seconds_after:
+            return 0.0
+        return self.read_seconds_before / self.read_seconds_after
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        d["speedup"] = round(self.speedup, 2)
+        return d
+
+
+class Compactor:
+    """
+    Rewrite the many small fragments that repeated write_df calls leave in
+    each symbol=XXX partition into a few size-targeted files, sorted and
+    encoded per the table's storage profile (zstd with 128K-row row groups
+    where the profile leaves them unset).
+
+    Each partition is rewritten under temporary names, renamed into place
+    and swapped in one manifest version: fragments written meanwhile are
+    kept, and the replaced ones stay on disk for pinned readers until the
+    manifest's garbage collection removes them. Upserted tables are
+    compacted through their UpsertLog instead.
+    """
+
+    TARGET_FILE_BYTES = 128 * 1024 * 1024
+    ROW_GROUP_ROWS = 128 * 1024
+    COMPRESSION = "zstd"
+    COMPRESSION_LEVEL = 3
+    # partitions whose read latency is measured before and after
+    SAMPLE = 20
+
+    def __init__(
+        self,
+        target_file_bytes: int = TARGET_FILE_BYTES,
+        row_group_rows: int = ROW_GROUP_ROWS,
+        sample: int = SAMPLE,
+    ):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.config = ConfigLoader()
+        self.env = self.config.environment()
+        self.target_file_bytes = target_file_bytes
+        self.row_group_rows = row_group_rows
+        self.sample = sample
+
+    def _needs_compaction(self, files: list) -> bool:
+        """
+        More files than the partition's bytes need at the target size.
+        """
+        total = sum(f.bytes for f in files)
+        return len(files) > max(1, math.ceil(total / self.target_file_bytes))
+
+    def _rows_per_file(self, files: list) -> int:
+        rows = sum(f.rows for f in files)
+        total = sum(f.bytes for f in files)
+        if not rows or not total:
+            return self.row_group_rows
+        return max(1, int(self.target_file_bytes / (total / rows)))
+
+    def _options(self, profile: StorageProfile) -> dict:
+        options = profile.write_options()
+        options.setdefault("row_group_size", self.row_group_rows)
+        if profile.compression is None:
+            # no codec configured; compaction trades CPU for disk
+            options["compression"] = self.COMPRESSION
+            options["compression_level"] = self.COMPRESSION_LEVEL
+        return options
+
+    def _write(
+        self, table: pa.Table, folder: Path, rows_per_file: int, profile: StorageProfile
+    ) -> list[Path]:
+        keys = profile.sort_keys(table.column_names)
+        if keys:
+            table = table.sort_by([(k, "ascending") for k in keys])
+        options = self._options(profile)
+
+        written = []
+        for start in range(0, max(table.num_rows, 1), rows_per_file):
+            name = f"part-{uuid.uuid4().hex}.parquet"
+            tmp = folder / f".{name}.tmp"
+            pq.write_table(table.slice(start, rows_per_file), str(tmp), **options)
+            path = folder / name
+            os.replace(tmp, path)
+            written.append(path)
+        return written
+
+    def compact_partition(
+        self, storage: ParquetStorage, table_name: str, partition: str
+    ) -> int:
+        """
+        Compact one partition; returns the number of files written, 0 when
+        it was left as it is.
+        """
+        manifest = storage.manifest
+        entry = manifest.partition(table_name, partition)
+        files = list(entry.files) if entry is not None else []
+        if not self._needs_compaction(files):
+            return 0
+
+        paths = [manifest.root / f.path for f in files]
+        try:
+            # a dataset takes the first file's schema: unify them all, or
+            # columns only later fragments hold (e.g. _violations) are lost
+            schema = ParquetStorage.unified_schema(paths)
+            table = ds.dataset(
+                [str(p) for p in paths], schema=schema, format="parquet"
+            ).to_table()
+        except (OSError, pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            reason = str(e).splitlines()[0]
+            self.logger.warning(f"{table_name} | {partition} | not compacted: {reason}")
+            return 0
+
+        written = self._write(
+            table,
+            paths[0].parent,
+            self._rows_per_file(files),
+            storage.profile(table_name),
+        )
+        # the data is unchanged: keep the partition's last update, which
+        # decides whether a refreshed acquisition needs validating again
+        mtime = max(f.mtime for f in files)
+        for path in written:
+            os.utime(path, (mtime, mtime))
+        with manifest.transaction():
+            manifest.remove_files(table_name, paths)
+            manifest.add_files(table_name, written)
+        return len(written)
+
+    def _read_seconds(self, storage: ParquetStorage, table_name: str, tickers: list) -> float:
+        if not tickers:
+            return 0.0
+        start = time.perf_counter()
+        for ticker in tickers:
+            storage.read_df(table_name, ticker)
+        return (time.perf_counter() - start) / len(tickers)
+
+    @staticmethod
+    def _footprint(manifest, table_name: str) -> tuple[int, int]:
+        files = [
+            f for p in manifest.table(table_name).partitions.values() for f in p.files
+        ]
+        return len(files), sum(f.bytes for f in files)
+
+    def compact_table(self, storage: ParquetStorage, table_name: str) -> CompactionReport:
+        report = CompactionReport(str(storage.folder), table_name)
+        manifest = storage.manifest
+
+        # upserted tables fold their deltas into a new base
+        if manifest.exists(table_name, UpsertLog.DELTA):
+            report.files_before, report.bytes_before = self._footprint(
+                manifest, table_name
+            )
+            storage._upsert_log(table_name).compact()
+            report.files_after, report.bytes_after = self._footprint(
+                manifest, table_name
+            )
+            return report
+
+        partitions = [
+            p
+            for p in manifest.partitions(table_name)
+            if p.startswith("symbol=")
+            and self._needs_compaction(manifest.partition(table_name, p).files)
+        ]
+        report.sampled = [p.split("=", 1)[1] for p in partitions[: self.sample]]
+        report.read_seconds_before = self._read_seconds(
+            storage, table_name, report.sampled
+        )
+
+        report.files_before, report.bytes_before = self._footprint(manifest, table_name)
+        for partition in partitions:
+            self.compact_partition(storage, table_name, partition)
+        report.partitions = len(partitions)
+        report.files_after, report.bytes_after = self._footprint(manifest, table_name)
+
+        report.read_seconds_after = self._read_seconds(
+            storage, table_name, report.sampled
+        )
+        self.logger.info(
+            f"{storage.folder} | {table_name} | {report.partitions} partitions | "
+            f"files {report.files_before} -> {report.files_after} | "
+            f"bytes {report.bytes_before} -> {report.bytes_after} | "
+            f"read {report.read_seconds_before * 1000:.1f}ms -> "
+            f"{report.read_seconds_after * 1000:.1f}ms"
+        )
+        return report
+
+    def compact_folder(self, folder: Path) -> list[CompactionReport]:
+        storage = ParquetStorage(folder)
+        reports = [
+            self.compact_table(storage, table_name)
+            for table_name in storage.manifest.table_names()
+        ]
+        storage.collect_garbage()
+        return reports
+
+    def main(self) -> list[CompactionReport]:
+        reports = []
+        for folder in (
+            self.env.acquisition_folder,
+            self.env.validated_folder,
+            self.env.dim_stocks_folder,
+        ):
+            reports += self.compact_folder(Path(folder))
+        return reports
+
+
+if __name__ == "__main__":
+    Compactor().main()
@@ -0,0 +1,824 @@
+import bisect
+import hashlib
+import heapq
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from strawberry.logging.logger_factory import LoggerFactory
+
+
+@dataclass
+class FileEntry:
+    """
+    One parquet file; path is relative to the storage folder. bounds holds
+    the min and max of each indexed column in the file, as strings.
+    """
+
+    path: str
+    rows: int
+    bytes: int
+    mtime: float
+    bounds: dict[str, list[str]] = field(default_factory=dict)
+
+
+def index_path(path: Path) -> Path:
+    """
+    Sidecar holding the sorted distinct values of a file's indexed columns.
+    """
+    path = Path(path)
+    return path.with_name(f".{path.name}.idx.json")
+
+
+def write_index(path: Path, columns: list[str]) -> dict[str, list[str]]:
+    """
+    Write the index sidecar of a parquet file for the columns it has;
+    returns their bounds.
+    """
+    present = [c for c in columns if c in pq.read_schema(path).names]
+    if not present:
+        return {}
+    table = pq.read_table(path, columns=present)
+    values = {
+        c: sorted({str(v) for v in pc.unique(table[c]).to_pylist() if v is not None})
+        for c in present
+    }
+    sidecar = index_path(path)
+    tmp = sidecar.with_name(f"{sidecar.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_text(json.dumps(values, separators=(",", ":")))
+    os.replace(tmp, sidecar)
+    return {c: [v[0], v[-1]] for c, v in values.items() if v}
+
+
+# where the file of a table written as a single file is kept once the table
+# has become a folder, until gc: <table>/_retired/<table>
+RETIRED = "_retired"
+
+
+def replace_with_folder(path: Path, folder: Path):
+    """
+    Swap folder in, by rename, for the single file a table was written as.
+    The file moves to folder/RETIRED, where readers of versions that still
+    list it find it (see resolve_file) until gc deletes it.
+    """
+    retired = folder / RETIRED / path.name
+    retired.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(path, retired)
+    os.replace(folder, path)
+
+
+def resolve_file(root: Path, rel: str) -> Path:
+    """
+    The file a manifest entry names; a single-file table (rel without a
+    folder) may since have become a folder that keeps the file retired.
+    """
+    path = root / rel
+    if "/" not in rel and path.is_dir():
+        return path / RETIRED / path.name
+    return path
+
+
+@lru_cache(maxsize=4096)
+def _file_values(path: str, mtime: float, column: str) -> tuple[str, ...]:
+    """
+    Sorted distinct values of a column in a file, from its sidecar or, for
+    files written before the index existed, from the column itself.
+    """
+    try:
+        values = json.loads(index_path(Path(path)).read_text())
+        if column in values:
+            return tuple(values[column])
+    except (OSError, ValueError):
+        pass
+    if column not in pq.read_schema(path).names:
+        return ()
+    column_values = pq.read_table(path, columns=[column])[column]
+    return tuple(
+        sorted({str(v) for v in pc.unique(column_values).to_pylist() if v is not None})
+    )
+
+
+@dataclass
+class PartitionEntry:
+    """
+    The files of one partition, keyed in the table as "symbol=XXX"
+    ("" for a table written as a single unpartitioned file).
+    """
+
+    files: list[FileEntry] = field(default_factory=list)
+
+    @property
+    def rows(self) -> int:
+        return sum(f.rows for f in self.files)
+
+    @property
+    def updated_at(self) -> Optional[float]:
+        return max((f.mtime for f in self.files), default=None)
+
+    @staticmethod
+    def from_dict(d: dict) -> "PartitionEntry":
+        return PartitionEntry(files=[FileEntry(**f) for f in d.get("files", [])])
+
+
+@dataclass
+class TableEntry:
+    """
+    index is the merge key of a log-structured (upserted) table.
+    """
+
+    schema_hash: Optional[str] = None
+    partitions: dict[str, PartitionEntry] = field(default_factory=dict)
+    index: Optional[str] = None
+    # columns with a secondary index maintained on every write
+    indexes: list[str] = field(default_factory=list)
+
+    @property
+    def rows(self) -> int:
+        return sum(p.rows for p in self.partitions.values())
+
+    @property
+    def updated_at(self) -> Optional[float]:
+        return max(
+            (p.updated_at for p in self.partitions.values() if p.files), default=None
+        )
+
+    @staticmethod
+    def from_dict(d: dict) -> "TableEntry":
+        return TableEntry(
+            schema_hash=d.get("schema_hash"),
+            partitions={
+                k: PartitionEntry.from_dict(p)
+                for k, p in d.get("partitions", {}).items()
+            },
+            index=d.get("index"),
+            indexes=d.get("indexes", []),
+        )
+
+
+class Catalog:
+    """
+    Read-only queries over a set of tables; shared by the live Manifest and
+    the pinned Snapshot of one of its versions.
+    """
+
+    root: Path
+    version: int
+    tables: dict[str, TableEntry]
+
+    def table(self, table_name: str) -> Optional[TableEntry]:
+        return self.tables.get(table_name)
+
+    def table_names(self) -> list[str]:
+        return sorted(self.tables)
+
+    def partition(self, table_name: str, partition: str) -> Optional[PartitionEntry]:
+        table = self.table(table_name)
+        return table.partitions.get(partition) if table is not None else None
+
+    def exists(self, table_name: str, partition: str = None) -> bool:
+        if partition is None:
+            table = self.table(table_name)
+            return table is not None and table.updated_at is not None
+        entry = self.partition(table_name, partition)
+        return entry is not None and bool(entry.files)
+
+    def last_update(self, table_name: str, partition: str = None) -> Optional[float]:
+        if partition is None:
+            table = self.table(table_name)
+            return table.updated_at if table is not None else None
+        entry = self.partition(table_name, partition)
+        return entry.updated_at if entry is not None else None
+
+    def partitions(self, table_name: str) -> list[str]:
+        table = self.table(table_name)
+        if table is None:
+            return []
+        return [k for k, p in table.partitions.items() if p.files]
+
+    def files(self, table_name: str, partition: str = None) -> list[Path]:
+        table = self.table(table_name)
+        if table is None:
+            return []
+        parts = (
+            table.partitions.values()
+            if partition is None
+            else [table.partitions.get(partition, PartitionEntry())]
+        )
+        return [resolve_file(self.root, f.path) for p in parts for f in p.files]
+
+    def rows(self, table_name: str, partition: str = None) -> int:
+        if partition is None:
+            table = self.table(table_name)
+            return table.rows if table is not None else 0
+        entry = self.partition(table_name, partition)
+        return entry.rows if entry is not None else 0
+
+    # secondary indexes
+
+    def indexed(self, table_name: str, column: str) -> bool:
+        """
+        Whether the index of column answers for the table. Rows of an
+        upserted table can change in place, so only its merge key is.
+        """
+        table = self.table(table_name)
+        if table is None or column not in table.indexes:
+            return False
+        return table.index is None or table.index == column
+
+    def _partition_values(self, table_name: str, column: str) -> Optional[list[str]]:
+        # hive partition columns are answered from the partition keys
+        prefix = f"{column}="
+        keys = [p for p in self.partitions(table_name) if p.startswith(prefix)]
+        return sorted(k[len(prefix):] for k in keys) if keys else None
+
+    def _entries_of(self, table_name: str) -> list[FileEntry]:
+        table = self.table(table_name)
+        if table is None:
+            return []
+        return [f for p in table.partitions.values() for f in p.files]
+
+    def index_values(self, table_name: str, column: str) -> list[str]:
+        """
+        Sorted distinct values of column, merged from the per-file indexes.
+        """
+        values = self._partition_values(table_name, column)
+        if values is not None:
+            return values
+        merged = heapq.merge(
+            *(
+                _file_values(str(self.root / f.path), f.mtime, column)
+                for f in self._entries_of(table_name)
+            )
+        )
+        out: list[str] = []
+        for v in merged:
+            if not out or out[-1] != v:
+                out.append(v)
+        return out
+
+    def index_contains(self, table_name: str, column: str, value) -> bool:
+        """
+        Membership test: files whose bounds exclude value are skipped, the
+        rest answered by a binary search of their sorted values.
+        """
+        value = str(value)
+        values = self._partition_values(table_name, column)
+        if values is not None:
+            return self.exists(table_name, f"{column}={value}")
+        for f in self._entries_of(table_name):
+            bounds = f.bounds.get(column)
+            if bounds is not None and not bounds[0] <= value <= bounds[1]:
+                continue
+            found = _file_values(str(self.root / f.path), f.mtime, column)
+            i = bisect.bisect_left(found, value)
+            if i < len(found) and found[i] == value:
+                return True
+        return False
+
+
+class Snapshot(Catalog):
+    """
+    One version of a manifest, pinned for a reader such as a UI session.
+    Its file lists never change, and the files stay on disk until the
+    snapshot is released or its lease expires, so writers publishing new
+    versions meanwhile are invisible to it.
+    """
+
+    def __init__(self, root: Path, version: int, tables: dict, lease: Path):
+        self.root = root
+        self.version = version
+        self.tables = tables
+        self.lease = lease
+        self._renewed = time.time()
+
+    def table(self, table_name: str) -> Optional[TableEntry]:
+        # keep the lease alive while the snapshot is in use
+        if time.time() - self._renewed > Manifest.PIN_TTL / 4:
+            self.renew()
+        return self.tables.get(table_name)
+
+    def renew(self):
+        self.lease.touch(exist_ok=True)
+        self._renewed = time.time()
+
+    def release(self):
+        self.lease.unlink(missing_ok=True)
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class Manifest(Catalog):
+    """
+    Catalog of one storage folder: its tables, their partitions, file
+    lists, row counts, schema hash and last update time.
+
+    The manifest is versioned under _manifest/ in the folder. Every change
+    is committed as a new immutable version file v<n>.json, created
+    exclusively so that two writers cannot both publish version n: the
+    loser reloads the winner's version, replays its changes on top and
+    retries. CURRENT points at the latest version and is swapped by
+    rename. Data files are written under staging names and only become
+    visible once a version lists them, so readers never see partial
+    writes, and pin() hands a reader a Snapshot that stays consistent
+    while writers carry on. gc() deletes versions, and files no longer
+    listed by any version kept or pinned.
+
+    Status queries (exists, last_update, tickers) are in-memory lookups.
+    The manifest is rebuilt from a scan of the folder when missing and
+    reloaded when another process has published a newer version. Use
+    for_folder to share one instance per folder within a process.
+
+    Scale: each lookup stats CURRENT, and each version is a full copy of
+    the catalog, so a commit costs time and space proportional to every
+    file of every table in the folder (a few MB at 10k tickers x 15
+    tables). Writers publishing many files should batch them in one
+    transaction, as validate_chunk does, rather than commit per file.
+    """
+
+    DIR_NAME = "_manifest"
+    CURRENT = "CURRENT"
+    PINS = "pins"
+    # single-file manifest written before versioning, migrated on load
+    LEGACY_FILE = "_manifest.json"
+    # parquet key-value metadata naming the merge key of upserted files
+    INDEX_KEY = b"strawberry.index"
+
+    # versions kept for readers that loaded them without pinning
+    KEEP_VERSIONS = 16
+    # seconds a pin lasts without being renewed
+    PIN_TTL = 6 * 3600
+    # commits between opportunistic garbage collections
+    GC_EVERY = 64
+
+    _instances: dict[Path, "Manifest"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, root: Path):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.root = Path(root)
+        self.dir = self.root / self.DIR_NAME
+        self.tables: dict[str, TableEntry] = {}
+        self.version = 0
+
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._pending: list = []
+        self._mtime: Optional[int] = None
+        self._load()
+
+    @classmethod
+    def for_folder(cls, root: Path) -> "Manifest":
+        root = Path(root)
+        with cls._instances_lock:
+            if root not in cls._instances:
+                cls._instances[root] = cls(root)
+            return cls._instances[root]
+
+    # persistence
+
+    def _version_path(self, version: int) -> Path:
+        return self.dir / f"v{version:010d}.json"
+
+    def _versions(self) -> list[int]:
+        if not self.dir.is_dir():
+            return []
+        return sorted(
+            int(p.stem[1:]) for p in self.dir.glob("v*.json") if p.stem[1:].isdigit()
+        )
+
+    def _stat_mtime(self) -> Optional[int]:
+        try:
+            return (self.dir / self.CURRENT).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _current(self) -> Optional[int]:
+        """
+        Latest published version: CURRENT, or a newer version whose writer
+        has not swapped CURRENT yet.
+        """
+        try:
+            version = int((self.dir / self.CURRENT).read_text().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            versions = self._versions()
+            return versions[-1] if versions else None
+        while self._version_path(version + 1).exists():
+            version += 1
+        return version
+
+    def _read_version(self, version: int) -> dict[str, TableEntry]:
+        data = json.loads(self._version_path(version).read_text())
+        return {
+            name: TableEntry.from_dict(t) for name, t in data.get("tables", {}).items()
+        }
+
+    def _load(self):
+        with self._lock:
+            mtime = self._stat_mtime()
+            version = self._current()
+            if version is None:
+                legacy = self.root / self.LEGACY_FILE
+                if legacy.is_file():
+                    self._migrate(legacy)
+                else:
+                    self.rebuild()
+                return
+            try:
+                self.tables = self._read_version(version)
+            except (OSError, ValueError) as e:
+                self.logger.warning(
+                    f"Unreadable manifest version {version} in {self.dir}, rebuilding: {e}"
+                )
+                self.rebuild()
+                return
+            self.version = version
+            self._mtime = mtime
+
+    def _adopt_current(self):
+        # start the next version after whatever is on disk, readable or not
+        self._mtime = self._stat_mtime()
+        self.version = self._current() or 0
+
+    def _migrate(self, legacy: Path):
+        self._adopt_current()
+        data = json.loads(legacy.read_text())
+        tables = {
+            name: TableEntry.from_dict(t) for name, t in data.get("tables", {}).items()
+        }
+
+        def replace():
+            self.tables = tables
+
+        self._commit(replace)
+        legacy.unlink(missing_ok=True)
+
+    def _refresh(self):
+        """
+        Pick up a version published by another process since the last load.
+        """
+        with self._lock:
+            if self._depth > 0:
+                return
+            if (
+                self._stat_mtime() != self._mtime
+                or self._version_path(self.version + 1).exists()
+            ):
+                self._load()
+
+    def _commit(self, change):
+        """
+        Apply a change to the tables and publish it as a new version. The
+        change is kept until published so it can be replayed on top of a
+        version another writer published first.
+        """
+        with self._lock:
+            self._refresh()
+            change()
+            self._pending.append(change)
+            self._save()
+
+    def _save(self):
+        if self._depth > 0 or not self._pending:
+            return
+        self.dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            version = self.version + 1
+            data = {
+                "version": version,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "tables": {name: asdict(t) for name, t in self.tables.items()},
+            }
+            tmp = self.dir / f".v{version:010d}.{uuid.uuid4().hex}.tmp"
+            tmp.write_text(json.dumps(data, separators=(",", ":")))
+            try:
+                # a hard link fails if the version exists: only one writer wins
+                os.link(tmp, self._version_path(version))
+                break
+            except FileExistsError:
+                self.tables = self._read_version(version)
+                self.version = version
+                for change in self._pending:
+                    change()
+            finally:
+                tmp.unlink(missing_ok=True)
+
+        self.version = version
+        self._pending = []
+        self._publish(version)
+        if version % self.GC_EVERY == 0:
+            self.gc()
+
+    def _publish(self, version: int):
+        current = self.dir / self.CURRENT
+        try:
+            # a writer that lost a race must not move CURRENT backwards
+            if int(current.read_text().strip() or 0) >= version:
+                return
+        except (FileNotFoundError, ValueError):
+            pass
+        tmp = self.dir / f".{self.CURRENT}.{uuid.uuid4().hex}.tmp"
+        tmp.write_text(str(version))
+        os.replace(tmp, current)
+        self._mtime = self._stat_mtime()
+
+    def _discard(self):
+        """
+        Drop the changes not yet published and go back to the latest
+        published version.
+        """
+        self._pending = []
+        if self._current() is None:
+            self.tables = {}
+            self.version = 0
+            return
+        self._mtime = None
+        self._load()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several changes into one atomic manifest version. When the
+        body raises nothing is published: the changes are discarded and the
+        exception re-raised. Files already written stay on disk, unlisted.
+        """
+        with self._lock:
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._discard()
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._save()
+
+    def rebuild(self):
+        """
+        Recreate the manifest by scanning the folder.
+        """
+        with self._lock:
+            # nothing written yet; the first write creates folder and manifest
+            if not self.root.is_dir():
+                self.tables = {}
+                return
+            self._adopt_current()
+            self._commit(self._scan)
+            self.logger.info(
+                f"Manifest of {self.root} rebuilt: {len(self.tables)} tables"
+            )
+
+    def _scan(self):
+        self.tables = {}
+        for entry in sorted(self.root.iterdir()):
+            if entry.name.startswith(("_", ".")):
+                continue
+            files = [entry] if entry.is_file() else sorted(entry.rglob("*.parquet"))
+            files = [f for f in files if not f.name.startswith(".")]
+            if files:
+                self._add(entry.name, files)
+
+    # snapshots
+
+    def pin(self) -> Snapshot:
+        """
+        Pin the latest version for a reader. The snapshot's files are kept
+        until it is released, or until its lease goes PIN_TTL seconds
+        without a renewal.
+        """
+        with self._lock:
+            self._refresh()
+            version = self.version
+            lease = self.dir / self.PINS / f"{version:010d}-{uuid.uuid4().hex}"
+            lease.parent.mkdir(parents=True, exist_ok=True)
+            lease.touch()
+            try:
+                tables = self._read_version(version)
+            except FileNotFoundError:
+                # nothing published yet
+                tables = {}
+        return Snapshot(self.root, version, tables, lease)
+
+    def _pinned_versions(self) -> set[int]:
+        pins = self.dir / self.PINS
+        if not pins.is_dir():
+            return set()
+        expired = time.time() - self.PIN_TTL
+        versions = set()
+        for lease in pins.iterdir():
+            try:
+                if lease.stat().st_mtime < expired:
+                    lease.unlink(missing_ok=True)
+                    continue
+                versions.add(int(lease.name.split("-", 1)[0]))
+            except (OSError, ValueError):
+                continue
+        return versions
+
+    def _listed_files(self, version: int) -> set[str]:
+        try:
+            tables = self._read_version(version)
+        except (OSError, ValueError):
+            return set()
+        return {
+            f.path
+            for t in tables.values()
+            for p in t.partitions.values()
+            for f in p.files
+        }
+
+    def gc(self) -> dict:
+        """
+        Delete versions older than the last KEEP_VERSIONS that no reader has
+        pinned, and the data files only those versions listed.
+        """
+        with self._lock:
+            self._refresh()
+            versions = self._versions()
+            keep = set(range(self.version - self.KEEP_VERSIONS + 1, self.version + 1))
+            keep |= self._pinned_versions()
+            drop = [v for v in versions if v not in keep and v < self.version]
+            if not drop:
+                return {"versions": 0, "files": 0}
+
+            live = set().union(*(self._listed_files(v) for v in versions if v in keep))
+            dead = set().union(*(self._listed_files(v) for v in drop))
+            garbage = dead - live
+            for rel in garbage:
+                path = resolve_file(self.root, rel)
+                if not path.is_file():
+                    continue
+                path.unlink()
+                index_path(path).unlink(missing_ok=True)
+                # drop partition folders left empty
+                try:
+                    path.parent.rmdir()
+                except OSError:
+                    pass
+            for version in drop:
+                self._version_path(version).unlink(missing_ok=True)
+            self._sweep_staging()
+
+        self.logger.info(
+            f"Manifest of {self.root}: collected {len(drop)} versions, "
+            f"{len(garbage)} files"
+        )
+        return {"versions": len(drop), "files": len(garbage)}
+
+    def _sweep_staging(self):
+        """
+        Remove staging folders abandoned by writers that crashed.
+        """
+        staging = self.root / "_staging"
+        if not staging.is_dir():
+            return
+        expired = time.time() - self.PIN_TTL
+        for entry in staging.iterdir():
+            if entry.stat().st_mtime < expired:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    # changes
+
+    @staticmethod
+    def schema_hash(schema: pa.Schema) -> str:
+        text = schema.remove_metadata().to_string(show_schema_metadata=False)
+        return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+    def _partition_key(self, table_name: str, path: Path) -> str:
+        table_path = self.root / table_name
+        if path == table_path:
+            return ""
+        return "/".join(path.relative_to(table_path).parts[:-1])
+
+    def _entries(self, table_name: str, paths: list[Path]) -> list[tuple]:
+        """
+        Read the footer of each file and write its index sidecar once,
+        outside of any commit retries.
+        """
+        table = self.tables.get(table_name)
+        indexes = table.indexes if table is not None else []
+        entries = []
+        for path in map(Path, paths):
+            try:
+                meta = pq.read_metadata(path)
+                stat = path.stat()
+                bounds = write_index(path, indexes) if indexes else {}
+            except (OSError, pa.ArrowInvalid) as e:
+                self.logger.warning(f"{table_name} | skipping {path}: {e}")
+                continue
+            entries.append((path, meta, stat, bounds))
+        return entries
+
+    def _add(self, table_name: str, paths: list[Path], replace: bool = False):
+        self._add_entries(table_name, self._entries(table_name, paths), replace)
+
+    def _add_entries(self, table_name: str, entries: list[tuple], replace: bool):
+        table = self.tables.setdefault(table_name, TableEntry())
+        touched = set()
+        for path, meta, stat, bounds in entries:
+            key = self._partition_key(table_name, path)
+            partition = table.partitions.setdefault(key, PartitionEntry())
+            # an unpartitioned table holds one file: a new one replaces it
+            if (replace or key == "") and key not in touched:
+                partition.files = []
+            touched.add(key)
+
+            rel = path.relative_to(self.root).as_posix()
+            partition.files = [f for f in partition.files if f.path != rel]
+            partition.files.append(
+                FileEntry(rel, meta.num_rows, stat.st_size, stat.st_mtime, bounds)
+            )
+            table.schema_hash = self.schema_hash(meta.schema.to_arrow_schema())
+            if meta.metadata and self.INDEX_KEY in meta.metadata:
+                table.index = meta.metadata[self.INDEX_KEY].decode()
+
+    def add_files(self, table_name: str, paths: list[Path], replace: bool = False):
+        """
+        Record newly written files. With replace, the files listed replace
+        the previous contents of their partitions.
+        """
+        entries = self._entries(table_name, paths)
+        self._commit(lambda: self._add_entries(table_name, entries, replace))
+
+    def create_index(self, table_name: str, column: str):
+        """
+        Index column across the table's files; later writes maintain it.
+        """
+        table = self.table(table_name)
+        if table is None or column in table.indexes:
+            return
+        columns = [*table.indexes, column]
+        built = {}
+        for f in [f for p in table.partitions.values() for f in p.files]:
+            try:
+                built[f.path] = write_index(self.root / f.path, columns)
+            except (OSError, pa.ArrowInvalid) as e:
+                self.logger.warning(f"{table_name} | not indexed {f.path}: {e}")
+
+        def index():
+            entry = self.tables.get(table_name)
+            if entry is None or column in entry.indexes:
+                return
+            entry.indexes.append(column)
+            for partition in entry.partitions.values():
+                for f in partition.files:
+                    if f.path in built:
+                        f.bounds = built[f.path]
+
+        self._commit(index)
+        self.logger.info(f"{table_name} | indexed {column}")
+
+    def remove_files(self, table_name: str, paths: list[Path]):
+        """
+        Drop files, e.g. ones superseded by a compaction, from the table.
+        They stay on disk for older versions until collected by gc.
+        """
+        gone = {Path(p).relative_to(self.root).as_posix() for p in paths}
+
+        def remove():
+            table = self.tables.get(table_name)
+            if table is None:
+                return
+            for partition in table.partitions.values():
+                partition.files = [f for f in partition.files if f.path not in gone]
+
+        self._commit(remove)
+
+    def remove_partition(self, table_name: str, partition: str):
+        def remove():
+            table = self.tables.get(table_name)
+            if table is not None:
+                table.partitions.pop(partition, None)
+
+        self._commit(remove)
+
+    def remove_table(self, table_name: str):
+        self._commit(lambda: self.tables.pop(table_name, None))
+
+    # queries
+
+    def table(self, table_name: str) -> Optional[TableEntry]:
+        self._refresh()
+        return self.tables.get(table_name)
+
+    def table_names(self) -> list[str]:
+        self._refresh()
+        return sorted(self.tables)
@@ -0,0 +1,124 @@
+import threading
+
+import duckdb
+import pyarrow as pa
+
+from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.repository.storage import ParquetStorage
+from strawberry.repository.upsert_log import UpsertLog
+
+
+class QueryService:
+    """
+    SQL over the storage folders with DuckDB. Every table of each store is
+    a view in a schema named after the store's layer, e.g.
+    validated.BALANCE_SHEET or dimensions.DIM_STOCKS, so one vectorised
+    query can scan every symbol partition. Results come back as Arrow.
+
+    Views list the files of the store's catalog, so a store pinned to a
+    snapshot is queried at that version. They are recreated when the
+    catalog moves to a new version. Upserted and single-file tables are
+    registered from their (memory-mapped) Arrow view, so their
+    merge-on-read semantics hold.
+
+    The connection can only reach the stores' folders: external access is
+    disabled and the configuration locked before any query runs. SQL from
+    users goes through select, which runs a single SELECT statement only.
+    """
+
+    def __init__(self, stores: list[ParquetStorage]):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.stores = {self._schema(s): s for s in stores}
+        self.con = duckdb.connect()
+        self._restrict()
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _restrict(self):
+        """
+        Confine the connection to the stores' folders: no other files,
+        extensions or attached databases, and settings that cannot be
+        changed back by a query.
+        """
+        roots = ", ".join(self._literal(s.manifest.root) for s in self.stores.values())
+        self.con.execute(f"SET allowed_directories = [{roots}]")
+        self.con.execute("SET enable_external_access = false")
+        self.con.execute("SET lock_configuration = true")
+
+    @staticmethod
+    def _schema(store: ParquetStorage) -> str:
+        return store.layer or str(store.folder).replace("/", "_")
+
+    @staticmethod
+    def _literal(value: str) -> str:
+        return "'" + str(value).replace("'", "''") + "'"
+
+    def _register_store(self, schema: str, store: ParquetStorage, tables: list[str]):
+        catalog = store.catalog
+        self.con.execute(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+        self.con.execute(f'CREATE SCHEMA "{schema}"')
+        for table_name in tables:
+            view = f'"{schema}"."{table_name}"'
+            partitions = catalog.partitions(table_name)
+            if not partitions:
+                continue
+
+            if "" in partitions or UpsertLog.DELTA in partitions:
+                arrow = store.read_arrow(table_name)
+                name = f"__{schema}_{table_name}"
+                self.con.register(name, arrow)
+                self.con.execute(f"CREATE OR REPLACE VIEW {view} AS SELECT * FROM {name}")
+                continue
+
+            files = ", ".join(self._literal(f) for f in catalog.files(table_name))
+            self.con.execute(
+                f"CREATE OR REPLACE VIEW {view} AS SELECT * FROM read_parquet("
+                f"[{files}], hive_partitioning = true, union_by_name = true, "
+                f"hive_types = {{'symbol': VARCHAR}})"
+            )
+
+    def refresh(self):
+        """
+        Recreate the views of every store whose catalog version changed.
+        """
+        with self._lock:
+            for schema, store in self.stores.items():
+                tables = store.catalog.table_names()
+                version = store.catalog.version
+                if self._versions.get(schema) == version:
+                    continue
+                self._register_store(schema, store, tables)
+                self._versions[schema] = version
+                self.logger.info(f"{schema} | views registered at version {version}")
+
+    def tables(self) -> list[str]:
+        self.refresh()
+        rows = self.con.execute(
+            "SELECT table_schema || '.' || table_name FROM information_schema.tables "
+            "WHERE table_type = 'VIEW' AND table_schema IN "
+            f"({', '.join(self._literal(s) for s in self.stores)}) ORDER BY 1"
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def query(self, sql: str, params: list = None) -> pa.Table:
+        """
+        Run a query, with ? placeholders bound to params, and return the
+        result as an Arrow table.
+        """
+        self.refresh()
+        with self._lock:
+            return self.con.execute(sql, params or []).fetch_arrow_table()
+
+    def select(self, sql: str) -> pa.Table:
+        """
+        Run SQL typed by a user. Only a single SELECT statement is accepted,
+        so it cannot write files (COPY) or change the views; anything else
+        raises ValueError.
+        """
+        statements = duckdb.extract_statements(sql)
+        if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+            raise ValueError("only a single SELECT statement can be run")
+        return self.query(sql)
+
+    def close(self):
+        self.con.close()
@@ -1,11 +1,27 @@
 from datetime import datetime
+import json
+import os
 from pathlib import Path
 import shutil
+import uuid
 import pandas as pd
-from typing import Optional
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from typing import Iterator, Optional
 
 from strawberry.logging.logger_factory import LoggerFactory
 from strawberry.config.config_loader import ConfigLoader
+from strawberry.config.dtos import StorageProfile
+from strawberry.repository.arrow_mirror import ArrowMirror
+from strawberry.repository.manifest import (
+    Catalog,
+    Manifest,
+    Snapshot,
+    replace_with_folder,
+)
+from strawberry.repository.upsert_log import UpsertLog
 
 
 class ParquetStorage:
@@ -16,6 +32,56 @@ class ParquetStorage:
         self.env = self.config.environment()
         self.engine: str = "pyarrow"
         self.folder = folder
+        # status queries are answered from the folder's manifest, not the filesystem
+        self.manifest = Manifest.for_folder(self.env.data_root / self.folder)
+        # reads go through the catalog: the live manifest, or a pinned snapshot
+        self.catalog: Catalog = self.manifest
+        self.profiles = self.config.storage_profiles()
+        self.layer = self._layer()
+        self.mirror = ArrowMirror(self.manifest.root)
+
+    def _layer(self) -> Optional[str]:
+        """
+        Storage layer of the folder, which picks its default write profile.
+        """
+        layers = {
+            Path(self.env.acquisition_folder): "acquisition",
+            Path(self.env.validated_folder): "validated",
+            Path(self.env.dim_stocks_folder): "dimensions",
+        }
+        return layers.get(Path(self.folder))
+
+    def profile(self, table_name: str) -> StorageProfile:
+        return self.profiles.for_table(self.layer, table_name)
+
+    @staticmethod
+    def _sorted(df: pd.DataFrame, profile: StorageProfile) -> pd.DataFrame:
+        # sorted data gives row groups tight min/max statistics to skip on
+        keys = profile.sort_keys(list(df.columns))
+        if not keys:
+            return df
+        return df.sort_values(keys, kind="stable", ignore_index=True)
+
+    def pin(self) -> Snapshot:
+        """
+        Pin the folder's current version for this storage's reads, so they
+        keep seeing the same files while pipeline writers publish new ones.
+        Call again to move to the latest version.
+        """
+        self.release()
+        self.catalog = self.manifest.pin()
+        return self.catalog
+
+    def release(self):
+        if self.catalog is not self.manifest:
+            self.catalog.release()
+            self.catalog = self.manifest
+
+    def collect_garbage(self) -> dict:
+        """
+        Delete files no longer listed by any manifest version kept or pinned.
+        """
+        return self.manifest.gc()
 
     def _table_path(self, table_name: str) -> Path:
         return self.env.data_root / self.folder / f"{table_name}"
@@ -23,49 +89,25 @@ class ParquetStorage:
     def _partition_path(self, table_name: str, partition_name: str) -> Path:
         return self._table_path(table_name) / Path(f"symbol={partition_name}")
 
+    @staticmethod
+    def _partition_key(partition_name: str) -> str:
+        return f"symbol={partition_name}"
+
     def last_update(self, table_name: str, partition_name: str = None) -> datetime:
         """
         Return the most recent modification datetime of parquet files
         for a given table, optionally scoped to a symbol partition.
         """
-        # Determine search directory: either table root or specific partition
-        if partition_name:
-            search_path = self._partition_path(table_name, partition_name)
-        else:
-            search_path = self._table_path(table_name)
-
-        # If path doesn't exist, nothing to update
-        if not search_path.exists():
+        partition = self._partition_key(partition_name) if partition_name else None
+        latest_mtime = self.catalog.last_update(table_name, partition)
+        if latest_mtime is None:
             return None
-
-        # Gather parquet files
-        files = []
-        # If a single parquet file at the root
-        if search_path.is_file() and search_path.suffix == ".parquet":
-            files = [search_path]
-        else:
-            files = list(search_path.glob("**/*.parquet"))
-
-        if not files:
-            return None
-
-        # Select most recent modification time
-        latest_mtime = max(f.stat().st_mtime for f in files)
         return datetime.fromtimestamp(latest_mtime)
 
     def exists(self, table_name: str, ticker: str = None) -> bool:
-        # If a ticker was provided, look in its partition sub‑dir
-        p = (
-            self._partition_path(table_name, ticker)
-            if ticker is not None
-            else self._table_path(table_name)
-        )
-
-        if not p.is_dir():
-            return False
-
-        # Any .parquet files present?
-        return any(p.glob("*.parquet"))
+        # If a ticker was provided, look in its partition
+        partition = self._partition_key(ticker) if ticker is not None else None
+        return self.catalog.exists(table_name, partition)
 
     def all_exist(self, table_names: list[str], ticker: str | None = None) -> bool:
         """
@@ -83,62 +125,537 @@ class ParquetStorage:
         table_name: str,
         partition_cols: list[str] = None,
         index: bool = False,
+        primary_key: list[str] = None,
     ):
+        """
+        Write df to the table. With a primary_key the rows are upserted into
+        the existing symbol partitions: rows with new keys are appended as a
+        new fragment, so I/O is proportional to new rows, while a partition
+        with restated rows is rewritten with the incoming rows replacing the
+        stored ones of the same key.
+        """
+        replaced: set[str] = set()
+        if primary_key:
+            df, replaced = self._upsert_rows(df, table_name, primary_key)
+            if df.empty:
+                return
+
+        profile = self.profile(table_name)
+        df = self._sorted(df, profile)
+        options = profile.write_options()
+
         path = self._table_path(table_name)
         path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(
-            str(path), engine=self.engine, partition_cols=partition_cols, index=index
+        if not partition_cols:
+            self._write_unpartitioned(df, table_name, index, options)
+            return
+
+        # write to a staging folder, move the finished files into the table
+        # and only then publish them in a new manifest version
+        staging = self.manifest.root / "_staging" / uuid.uuid4().hex
+        written: list[Path] = []
+        try:
+            df.to_parquet(
+                str(staging),
+                engine=self.engine,
+                partition_cols=partition_cols,
+                index=index,
+                file_visitor=lambda f: written.append(Path(f.path)),
+                **options,
+            )
+            published = []
+            for f in written:
+                target = path / f.relative_to(staging)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(f, target)
+                published.append(target)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        # rewritten partitions replace their files, the rest are appended to
+        rewritten = {self._partition_key(t) for t in replaced}
+        rewrites = [f for f in published if f.relative_to(path).parts[0] in rewritten]
+        appends = [f for f in published if f not in rewrites]
+        with self.manifest.transaction():
+            if rewrites:
+                self.manifest.add_files(table_name, rewrites, replace=True)
+            if appends:
+                self.manifest.add_files(table_name, appends)
+
+    def _write_unpartitioned(
+        self, df: pd.DataFrame, table_name: str, index: bool, options: dict
+    ):
+        """
+        Rewrite an unpartitioned table as a new file in its folder, published
+        in place of the table's previous files (and any upsert deltas). The
+        replaced files are not touched: versions pinned to them keep reading
+        them until the manifest's garbage collection removes them.
+        """
+        path = self._table_path(table_name)
+        name = f"part-{uuid.uuid4().hex}.parquet"
+        # a table written before as a single file becomes a folder; the new
+        # file is staged next to it and swapped in by rename
+        legacy = path.is_file()
+        folder = path.with_name(f".{table_name}.{uuid.uuid4().hex}") if legacy else path
+        folder.mkdir(parents=True, exist_ok=True)
+        tmp = folder / f".{name}.tmp"
+        df.to_parquet(str(tmp), engine=self.engine, index=index, **options)
+        os.replace(tmp, folder / name)
+        if legacy:
+            replace_with_folder(path, folder)
+
+        deltas = self.manifest.files(table_name, UpsertLog.DELTA)
+        with self.manifest.transaction():
+            self.manifest.add_files(table_name, [path / name], replace=True)
+            if deltas:
+                self.manifest.remove_files(table_name, deltas)
+
+    def _read_stored(
+        self, table_name: str, ticker: str, columns: list[str]
+    ) -> pa.Table:
+        """
+        Read the files the live manifest lists for a ticker's partition;
+        the folder may also hold files only older versions still list.
+        """
+        files = self.manifest.files(table_name, self._partition_key(ticker))
+        return ds.dataset([str(f) for f in files], format="parquet").to_table(
+            columns=columns
         )
 
-    def read_df(self, table_name: str, ticker: Optional[str] = None) -> pd.DataFrame:
-        # Base directory for this table
-        table_dir = self._table_path(table_name)
+    def _upsert_rows(
+        self, df: pd.DataFrame, table_name: str, primary_key: list[str]
+    ) -> tuple[pd.DataFrame, set[str]]:
+        """
+        Merge df into its symbol partitions. Returns the rows to write and
+        the tickers whose partitions they replace rather than append to.
+        """
+        if "symbol" not in df.columns:
+            # an unpartitioned write replaces the table, there is nothing to merge
+            if self._key_index(df, primary_key).has_duplicates:
+                self.logger.warning(
+                    f"{table_name} | primary key {primary_key} is not unique"
+                )
+            return df, set()
+
+        parts, replaced = [], set()
+        for ticker, rows in df.groupby("symbol", sort=False):
+            rows, replace = self._merge_partition(table_name, ticker, rows, primary_key)
+            parts.append(rows)
+            if replace:
+                replaced.add(ticker)
+        return (pd.concat(parts) if parts else df.iloc[0:0]), replaced
+
+    def _merge_partition(
+        self,
+        table_name: str,
+        ticker: str,
+        rows: pd.DataFrame,
+        primary_key: list[str],
+    ) -> tuple[pd.DataFrame, bool]:
+        """
+        Upsert a ticker's incoming rows into its stored partition. When every
+        stored key the rows repeat carries the same payload only the rows with
+        new keys are returned, to append. Otherwise the stored rows of the
+        incoming keys are dropped and the merged partition is returned with
+        replace set. Rows are never deduplicated: a key the incoming rows
+        repeat is not unique, so all its stored rows give way to all of them.
+        """
+        log_prefix = f"{ticker} | {table_name} | "
+        keys = self._key_index(rows, primary_key)
+        if keys.has_duplicates:
+            self.logger.warning(
+                f"{log_prefix}primary key {primary_key} is not unique"
+            )
+        if not self.manifest.exists(table_name, self._partition_key(ticker)):
+            return rows, False
+
+        stored = self._read_stored(table_name, ticker, None).to_pandas()
+        stored_keys = self._key_index(stored, primary_key)
+        known = keys.isin(stored_keys)
+        if not keys.has_duplicates and not stored_keys.has_duplicates:
+            columns = [c for c in rows.columns if c in stored.columns]
+            before = stored[columns].set_axis(stored_keys).reindex(keys[known])
+            after = rows[known][columns]
+            # compared as text: a restated value, not a dtype, forces a rewrite
+            if (before.astype(str).values == after.astype(str).values).all():
+                return rows[~known], False
+
+        kept = stored[~stored_keys.isin(keys)]
+        if "symbol" in rows.columns and "symbol" not in kept.columns:
+            kept = kept.assign(symbol=ticker)
+        self.logger.info(f"{log_prefix}restated rows, rewriting the partition")
+        return pd.concat([kept, rows], ignore_index=True), True
+
+    @staticmethod
+    def _key_index(df: pd.DataFrame, primary_key: list[str]) -> pd.MultiIndex:
+        return pd.MultiIndex.from_frame(df[primary_key].astype(str))
+
+    def write_batches(
+        self,
+        reader: pa.RecordBatchReader,
+        table_name: str,
+        ticker: str,
+        primary_key: list[str] = None,
+        replace: bool = False,
+    ) -> int:
+        """
+        Stream record batches into a new fragment of a ticker's partition.
+        The fragment is written under a temporary name and renamed into place
+        once complete. With replace the fragment, even when empty, replaces
+        the partition's files instead. With a primary_key and a stored
+        partition the batches are upserted into it as write_df does, which
+        reads them into memory. Returns the number of rows written.
+        """
+        partition_dir = self._partition_path(table_name, ticker)
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        exists = self.manifest.exists(table_name, self._partition_key(ticker))
+        if primary_key and exists and not replace:
+            incoming = reader.read_all()
+            rows, replace = self._merge_partition(
+                table_name, ticker, incoming.to_pandas(), primary_key
+            )
+            merged = pa.Table.from_pandas(
+                rows, schema=incoming.schema, preserve_index=False
+            )
+            reader = merged.to_reader()
+
+        name = uuid.uuid4().hex
+        tmp = partition_dir / f".{name}.tmp"
+        rows = 0
+        options = self.profile(table_name).write_options()
+        row_group_size = options.pop("row_group_size", None)
+        with pq.ParquetWriter(str(tmp), reader.schema, **options) as writer:
+            for batch in reader:
+                if batch.num_rows:
+                    writer.write_batch(batch, row_group_size=row_group_size)
+                    rows += batch.num_rows
+
+        if rows or replace:
+            path = partition_dir / f"{name}.parquet"
+            os.replace(tmp, path)
+            self.manifest.add_files(table_name, [path], replace=replace)
+        else:
+            tmp.unlink()
+        return rows
 
-        # If a ticker was provided, look in its partition sub‑dir
-        partition_dir = (
-            table_dir / Path(f"symbol={ticker}") if ticker is not None else table_dir
+    def write_arrow(
+        self,
+        table: pa.Table,
+        table_name: str,
+        ticker: str,
+        primary_key: list[str] = None,
+        replace: bool = False,
+    ) -> int:
+        """
+        Write an Arrow table as a new fragment of a ticker's partition (or in
+        place of it, with replace), sorted per the table's storage profile.
+        Returns the rows written.
+        """
+        keys = self.profile(table_name).sort_keys(table.column_names)
+        if keys:
+            table = table.sort_by([(k, "ascending") for k in keys])
+        return self.write_batches(
+            table.to_reader(), table_name, ticker, primary_key, replace
         )
 
-        # If the directory (or file) doesn’t exist, bail out with None
-        if not partition_dir.exists():
+    def write_partition_json(self, table_name: str, ticker: str, name: str, payload: dict):
+        """
+        Write a JSON document, e.g. a quality summary, next to the files of
+        a ticker's partition. It is replaced by rename.
+        """
+        path = self._partition_path(table_name, ticker) / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")))
+        os.replace(tmp, path)
+
+    def read_partition_json(self, table_name: str, ticker: str, name: str) -> Optional[dict]:
+        path = self._partition_path(table_name, ticker) / name
+        try:
+            return json.loads(path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
             return None
 
-        # Otherwise attempt to read; guard against any parquet errors too
+    def _dataset(
+        self,
+        table_name: str,
+        ticker: Optional[str] = None,
+        tickers: list[str] = None,
+    ) -> ds.Dataset:
+        """
+        Dataset over the files the manifest lists for the table, for one
+        ticker's partition or for the partitions of a list of tickers, with
+        hive partition columns such as symbol= discovered.
+        """
+        if ticker is not None:
+            files = self.catalog.files(table_name, self._partition_key(ticker))
+            base_dir = self._partition_path(table_name, ticker)
+        elif tickers is not None:
+            files = [
+                f
+                for t in dict.fromkeys(tickers)
+                for f in self.catalog.files(table_name, self._partition_key(t))
+            ]
+            base_dir = self._table_path(table_name)
+        else:
+            files = self.catalog.files(table_name)
+            base_dir = self._table_path(table_name)
+
+        if not files:
+            return None
+        paths = [str(f) for f in files]
+        partitioning = ds.HivePartitioning.discover(infer_dictionary=True)
         try:
-            return pd.read_parquet(str(partition_dir), engine=self.engine)
-        except (FileNotFoundError, OSError, pd.errors.EmptyDataError):
+            discovered = ds.dataset(
+                paths,
+                format="parquet",
+                partitioning=partitioning,
+                partition_base_dir=str(base_dir),
+            )
+            # the discovered schema is the first file's, plus the partition
+            # columns: columns only later fragments hold would read as absent
+            schema = self.unified_schema(paths, discovered.schema)
+        except (FileNotFoundError, OSError, pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            reason = str(e).splitlines()[0]
+            self.logger.warning(f"{ticker} | {table_name} | read failed: {reason}")
             return None
+        return ds.dataset(
+            paths,
+            schema=schema,
+            format="parquet",
+            partitioning=partitioning,
+            partition_base_dir=str(base_dir),
+        )
 
-    def remove_partition_by_symbol(self, table_name: str, ticker: str) -> bool:
+    @staticmethod
+    def unified_schema(paths: list, *schemas: pa.Schema) -> pa.Schema:
         """
-        Permanently delete the partition directory for a given symbol.
-        Returns True if the directory was found and removed, False otherwise.
+        Union of the schemas of the parquet files at paths (and of any
+        schemas given), with types promoted where they differ. Raises
+        pa.ArrowInvalid or pa.ArrowTypeError when they cannot be reconciled.
         """
-        partition_dir = self._table_path(table_name) / f"symbol={ticker}"
-        if not partition_dir.is_dir():
-            return False
+        return pa.unify_schemas(
+            [*(pq.read_schema(str(p)) for p in paths), *schemas],
+            promote_options="permissive",
+        )
+
+    @staticmethod
+    def _filter_expression(filters) -> Optional[pc.Expression]:
+        """
+        Accept a pyarrow expression or pandas-style filters,
+        e.g. [("date", ">=", start), ("symbol", "in", ["AAPL", "MSFT"])].
+        """
+        if filters is None or isinstance(filters, pc.Expression):
+            return filters
+        return pq.filters_to_expression(filters)
+
+    def read_df(
+        self,
+        table_name: str,
+        ticker: Optional[str] = None,
+        columns: list[str] = None,
+        filters=None,
+    ) -> pd.DataFrame:
+        """
+        Read a table, or one ticker's partition of it. columns and filters
+        are pushed down to the dataset scan, so only the column chunks and
+        row groups that are needed get decoded. Returns None when the table
+        or partition does not exist or cannot be read.
+        """
+        # upserted tables are merged on read
+        if ticker is None and self.catalog.exists(table_name, UpsertLog.DELTA):
+            return self._upsert_log(table_name, self.catalog).read(
+                columns, self._filter_expression(filters)
+            )
+
+        dataset = self._dataset(table_name, ticker)
+        if dataset is None:
+            return None
+
+        # guard against any parquet errors, and columns the table lacks
+        try:
+            table = dataset.to_table(
+                columns=columns, filter=self._filter_expression(filters)
+            )
+        except (FileNotFoundError, OSError, pa.ArrowInvalid) as e:
+            reason = str(e).splitlines()[0]
+            self.logger.warning(f"{ticker} | {table_name} | read failed: {reason}")
+            return None
+        return table.to_pandas()
+
+    def _hive_partitioned(self, table_name: str) -> bool:
+        return any(p.startswith("symbol=") for p in self.catalog.partitions(table_name))
+
+    def _load_arrow(self, table_name: str) -> pa.Table:
+        if self._hive_partitioned(table_name):
+            return self.read_tickers(table_name)
+        df = self.read_df(table_name)
+        return None if df is None else pa.Table.from_pandas(df, preserve_index=False)
+
+    def read_arrow(
+        self,
+        table_name: str,
+        ticker: Optional[str] = None,
+        columns: list[str] = None,
+        filters=None,
+    ) -> pa.Table:
+        """
+        Arrow counterpart of read_df. Tables whose profile sets mirror are
+        served from a memory-mapped Arrow copy shared across processes, so
+        repeated reads cost a filter over mapped pages instead of a parquet
+        decode; other tables are scanned as read_df does.
+        """
+        if not self.profile(table_name).mirror:
+            if ticker is not None:
+                dataset = self._dataset(table_name, ticker)
+                if dataset is None:
+                    return None
+                return dataset.to_table(
+                    columns=columns, filter=self._filter_expression(filters)
+                )
+            df = self.read_df(table_name, columns=columns, filters=filters)
+            return None if df is None else pa.Table.from_pandas(df, preserve_index=False)
+
+        table = self.mirror.table(
+            self.catalog, table_name, lambda: self._load_arrow(table_name)
+        )
+        if table is None:
+            return None
+        if ticker is not None and "symbol" in table.column_names:
+            table = table.filter(pc.field("symbol") == ticker)
+            if self._hive_partitioned(table_name):
+                # shaped like a partition read, without the hive column
+                table = table.drop_columns("symbol")
+        expression = self._filter_expression(filters)
+        if expression is not None:
+            table = table.filter(expression)
+        if columns is not None:
+            table = table.select(columns)
+        return table
+
+    def read_batches(
+        self,
+        table_name: str,
+        ticker: Optional[str] = None,
+        columns: list[str] = None,
+        filters=None,
+        batch_size: int = 64 * 1024,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Batch-iterator counterpart of read_df: yields frames of at most
+        batch_size rows so a large table never has to be held in memory.
+        """
+        if ticker is None and self.catalog.exists(table_name, UpsertLog.DELTA):
+            df = self.read_df(table_name, columns=columns, filters=filters)
+            for start in range(0, len(df), batch_size):
+                yield df.iloc[start : start + batch_size]
+            return
+
+        dataset = self._dataset(table_name, ticker)
+        if dataset is None:
+            return
+
+        batches = dataset.to_batches(
+            columns=columns,
+            filter=self._filter_expression(filters),
+            batch_size=batch_size,
+        )
+        for batch in batches:
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+    def read_tickers(
+        self,
+        table_name: str,
+        tickers: list[str] = None,
+        columns: list[str] = None,
+        filters=None,
+    ) -> pa.Table:
+        """
+        Read the partitions of many tickers (all when tickers is None) in one
+        dataset scan, returned as a single Arrow table with a symbol column.
+        Returns None when none of the partitions exist.
+        """
+        dataset = self._dataset(table_name, tickers=tickers)
+        if dataset is None:
+            return None
+        if columns is not None:
+            columns = list(dict.fromkeys(["symbol", *columns]))
 
-        # Recursively delete the partition folder and its contents
         try:
-            shutil.rmtree(partition_dir)
-            return True
-        except Exception:
+            return dataset.to_table(
+                columns=columns, filter=self._filter_expression(filters)
+            )
+        except (FileNotFoundError, OSError, pa.ArrowInvalid) as e:
+            reason = str(e).splitlines()[0]
+            self.logger.warning(f"{table_name} | read failed: {reason}")
+            return None
+
+    def iter_tickers(
+        self,
+        table_name: str,
+        tickers: list[str] = None,
+        columns: list[str] = None,
+        filters=None,
+    ) -> Iterator[tuple[str, pd.DataFrame]]:
+        """
+        Per-symbol iterator over one dataset scan: yields (ticker, frame) with
+        frames shaped as read_df(table, ticker) returns them. The dataset is
+        opened and its schema resolved once for the whole list of tickers.
+        """
+        dataset = self._dataset(table_name, tickers=tickers)
+        if dataset is None:
+            return
+
+        expression = self._filter_expression(filters)
+        by_symbol: dict[str, list[ds.Fragment]] = {}
+        for fragment in dataset.get_fragments(filter=expression):
+            keys = ds.get_partition_keys(fragment.partition_expression)
+            by_symbol.setdefault(keys.get("symbol"), []).append(fragment)
+
+        order = tickers if tickers is not None else sorted(by_symbol)
+        for ticker in order:
+            fragments = by_symbol.get(ticker)
+            if not fragments:
+                continue
+            try:
+                table = pa.concat_tables(
+                    fragment.to_table(
+                        schema=dataset.schema, columns=columns, filter=expression
+                    )
+                    for fragment in fragments
+                )
+            except (FileNotFoundError, OSError, pa.ArrowInvalid) as e:
+                reason = str(e).splitlines()[0]
+                self.logger.warning(f"{ticker} | {table_name} | read failed: {reason}")
+                continue
+            if "symbol" in table.column_names:
+                table = table.drop_columns("symbol")
+            yield ticker, table.to_pandas()
+
+    def remove_partition_by_symbol(self, table_name: str, ticker: str) -> bool:
+        """
+        Remove the partition for a given symbol from the table. Its files are
+        deleted by garbage collection once no kept or pinned version lists them.
+        Returns True if the partition was found and removed, False otherwise.
+        """
+        partition = self._partition_key(ticker)
+        if not self.manifest.exists(table_name, partition):
             return False
+        self.manifest.remove_partition(table_name, partition)
+        return True
 
     def get_tickers(self, table_name: str) -> list[str]:
         """
         Given a path like 'BALANCE_SHEET', find all subdirectories named
         'symbol=XXX' and return ['XXX', ...].
         """
-        base_path = self._table_path(table_name)
-
-        if not base_path.is_dir():
+        if self.catalog.table(table_name) is None:
             raise ValueError(f"{table_name!r} is not a valid directory")
 
         symbols: list[str] = []
-        for sub in base_path.iterdir():
-            name = sub.name
-            if sub.is_dir() and name.startswith("symbol="):
+        for name in self.catalog.partitions(table_name):
+            if name.startswith("symbol="):
                 # split on the first '=' and take the right side
                 symbol = name.split("=", 1)[1]
                 symbols.append(symbol)
@@ -149,9 +666,14 @@ class ParquetStorage:
         self, table_name: str, column_name: str, value: str
     ) -> bool:
         """
-        Read the specified table, index by the given column, and check if the value exists in the indexed column.
-        Returns True if exists, False otherwise.
+        Check if the value exists in the given column, by a binary search of
+        the column's secondary index. Returns True if exists, False otherwise.
         """
+        # indexed on first use; the catalog decides whether the index answers
+        self.manifest.create_index(table_name, column_name)
+        if self.catalog.indexed(table_name, column_name):
+            return self.catalog.index_contains(table_name, column_name, value)
+
         # Load the DataFrame for the table
         df = self.read_df(table_name)
         if df is None:
@@ -174,10 +696,14 @@ class ParquetStorage:
 
     def unique_column_list(self, table_name: str, column_name: str) -> list[str]:
         """
-        Read the specified table, index by the given column (assumed unique),
-        and return a list of all index values as strings.
+        Return the sorted distinct values of the given column as strings,
+        merged from its secondary index without reading the table.
         Returns an empty list if the table or column is missing or on error.
         """
+        self.manifest.create_index(table_name, column_name)
+        if self.catalog.indexed(table_name, column_name):
+            return self.catalog.index_values(table_name, column_name)
+
         # Load the DataFrame for the table
         df = self.read_df(table_name)
         if df is None:
@@ -198,49 +724,47 @@ class ParquetStorage:
         # Return all unique index values as strings
         return [str(idx) for idx in indexed_df.index.tolist()]
 
+    def _upsert_log(self, table_name: str, catalog: Catalog = None) -> UpsertLog:
+        return UpsertLog(
+            self.manifest,
+            self._table_path(table_name),
+            table_name,
+            catalog,
+            self.profile(table_name),
+        )
+
     def update(self, table_name: str, index: str, df: pd.DataFrame) -> None:
         """
-        Update a table by merging rows from df based on a unique index column.
-        Existing rows with matching index values are replaced; new rows are appended.
+        Upsert rows from df into a table on a unique index column. The rows
+        are appended as a delta file and existing rows with matching index
+        values are replaced on read, so an upsert costs O(rows changed) and
+        the table never disappears. Deltas are compacted in the background.
         """
-        # 1) Load existing table (if any)
-        existing = self.read_df(table_name)
-        if existing is None or existing.empty:
-            # Nothing there yet → just write
-            self.write_df(df, table_name, index=False)
+        log = self._upsert_log(table_name)
+
+        # 1) Nothing there yet → just write
+        schema = log.schema()
+        if schema is None or self.manifest.rows(table_name) == 0:
+            log.write_base(df, index)
             self.logger.info(f"Created new table '{table_name}' with {len(df)} rows.")
             return
 
-        # 2) Sanity checks
-        if index not in existing.columns:
+        # 2) Sanity checks against the stored schema
+        if index not in schema.names:
             raise KeyError(f"Index column '{index}' not found in table '{table_name}'.")
-        missing = set(existing.columns) - set(df.columns)
-        extra = set(df.columns) - set(existing.columns)
+        missing = set(schema.names) - set(df.columns)
+        extra = set(df.columns) - set(schema.names)
         if missing or extra:
             raise ValueError(
                 f"Column mismatch for '{table_name}'. "
                 f"Missing in df: {missing}, extra in df: {extra}."
             )
 
-        # 3) Drop old rows, keep the rest
-        old_idx = existing.set_index(index)
-        new_idx = df.set_index(index)
-        keep = old_idx.drop(new_idx.index, errors="ignore")
-
-        # 4) Concat + reset index
-        combined = pd.concat([keep, new_idx]).reset_index()
-
-        # 5) Remove on‑disk data so we don’t leave stale files around
-        table_path = self._table_path(table_name)
-        if table_path.exists():
-            try:
-                shutil.rmtree(table_path)
-            except Exception as e:
-                self.logger.error(f"Failed to clear old table dir: {e}")
-
-        # 6) Write it back
-        self.write_df(combined, table_name, index=False)
+        # 3) Append the rows as a delta, committed by rename
+        delta = log.upsert(df, index)
         self.logger.info(
-            f"Updated table '{table_name}': {len(new_idx)} rows upserted, "
-            f"{len(combined) - len(new_idx)} rows untouched."
+            f"Updated table '{table_name}': {len(df)} rows upserted in {delta.name}."
         )
+
+        # 4) Fold the deltas into a new base once enough have accumulated
+        log.maybe_compact()
@@ -0,0 +1,249 @@
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from strawberry.config.dtos import StorageProfile
+from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.repository.manifest import Catalog, Manifest, replace_with_folder
+
+
+class UpsertLog:
+    """
+    Log-structured storage for a table maintained by upserts on an index
+    column, such as DIM_STOCKS.
+
+    The table directory holds one base file plus delta files under _delta/,
+    named by their write time; they apply in the order the manifest lists
+    them, which is their commit order:
+
+        DIM_STOCKS/base-<uuid>.parquet
+        DIM_STOCKS/_delta/<time_ns>-<uuid>.parquet
+
+    An upsert writes only its own rows as a new delta, under a temporary
+    name renamed into place before the manifest records it, so it costs
+    O(rows changed) and the table never disappears. Reads merge on the fly:
+    for each index value the row of the latest delta wins. Compaction folds
+    the deltas into a new base, normally in a background thread once
+    COMPACT_AFTER deltas have accumulated. Superseded files are left to
+    the manifest's garbage collection, so pinned readers keep working.
+    """
+
+    DELTA = "_delta"
+    COMPACT_AFTER = 8
+
+    _locks: dict[Path, threading.Lock] = {}
+    _locks_lock = threading.Lock()
+    _compacting: set[Path] = set()
+
+    def __init__(
+        self,
+        manifest: Manifest,
+        table_path: Path,
+        table_name: str,
+        catalog: Catalog = None,
+        profile: StorageProfile = None,
+    ):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.manifest = manifest
+        # what read() sees: the live manifest or a pinned snapshot
+        self.catalog = catalog if catalog is not None else manifest
+        self.profile = profile if profile is not None else StorageProfile()
+        self.table_path = Path(table_path)
+        self.table_name = table_name
+        self.delta_dir = self.table_path / self.DELTA
+
+    @property
+    def _lock(self) -> threading.Lock:
+        # serialises commits to one table across storage instances
+        with self._locks_lock:
+            return self._locks.setdefault(self.table_path, threading.Lock())
+
+    @property
+    def index(self) -> Optional[str]:
+        table = self.manifest.table(self.table_name)
+        return table.index if table is not None else None
+
+    def base_files(self) -> list[Path]:
+        return self.manifest.files(self.table_name, "")
+
+    def delta_files(self) -> list[Path]:
+        # in commit order: a writer that loses a commit race appends its
+        # delta after the winner's
+        return self.manifest.files(self.table_name, self.DELTA)
+
+    def has_deltas(self) -> bool:
+        return bool(self.delta_files())
+
+    # writing
+
+    def _write(self, df: pd.DataFrame, folder: Path, name: str, index: str) -> Path:
+        """
+        Write df as folder/name, tagged with its merge key, committed by rename.
+        """
+        folder.mkdir(parents=True, exist_ok=True)
+        keys = self.profile.sort_keys(list(df.columns))
+        if keys:
+            df = df.sort_values(keys, kind="stable")
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[Manifest.INDEX_KEY] = index.encode()
+        table = table.replace_schema_metadata(metadata)
+
+        path = folder / name
+        tmp = folder / f".{name}.tmp"
+        pq.write_table(table, str(tmp), **self.profile.write_options())
+        os.replace(tmp, path)
+        return path
+
+    def _migrate(self, index: str):
+        """
+        Move a table written as a single file into the directory layout, so
+        deltas can sit next to it.
+        """
+        legacy = pd.read_parquet(str(self.table_path))
+        staging = self.table_path.with_name(f".{self.table_name}.{uuid.uuid4().hex}")
+        base = self._write(legacy, staging, f"base-{uuid.uuid4().hex}.parquet", index)
+
+        # the single file is kept for pinned readers until gc
+        replace_with_folder(self.table_path, staging)
+        self.manifest.add_files(
+            self.table_name, [self.table_path / base.name], replace=True
+        )
+        self.logger.info(f"{self.table_name} | moved to the upsert log layout")
+
+    def write_base(self, df: pd.DataFrame, index: str) -> Path:
+        """
+        Replace the whole table with df as its base (no deltas).
+        """
+        with self._lock:
+            old = self.base_files() + self.delta_files()
+            name = f"base-{uuid.uuid4().hex}.parquet"
+            if self.table_path.is_file():
+                # a single-file table: stage the folder, keep the file retired
+                staging = self.table_path.with_name(
+                    f".{self.table_name}.{uuid.uuid4().hex}"
+                )
+                self._write(df, staging, name, index)
+                replace_with_folder(self.table_path, staging)
+                base = self.table_path / name
+            else:
+                base = self._write(df, self.table_path, name, index)
+            with self.manifest.transaction():
+                self.manifest.add_files(self.table_name, [base], replace=True)
+                self.manifest.remove_files(self.table_name, old)
+        return base
+
+    def upsert(self, df: pd.DataFrame, index: str) -> Path:
+        """
+        Append df as the next delta. Returns the delta file.
+        """
+        with self._lock:
+            if self.table_path.is_file():
+                self._migrate(index)
+
+            # unique without coordination: another process may be upserting
+            delta = self._write(
+                df,
+                self.delta_dir,
+                f"{time.time_ns():020d}-{uuid.uuid4().hex}.parquet",
+                index,
+            )
+            self.manifest.add_files(self.table_name, [delta])
+        return delta
+
+    def schema(self) -> pa.Schema:
+        files = self.base_files() or self.delta_files()
+        return pq.read_schema(str(files[0])) if files else None
+
+    # reading
+
+    def read(self, columns: list[str] = None, filters: pc.Expression = None) -> pd.DataFrame:
+        """
+        Merge-on-read view: base rows overridden by delta rows with the same
+        index value, the latest delta winning. Filters apply after the merge
+        so a row updated out of the filter is not served stale.
+        """
+        files = self.catalog.files(self.table_name, "") + self.catalog.files(
+            self.table_name, self.DELTA
+        )
+        if not files:
+            return None
+        index = self.catalog.table(self.table_name).index
+        wanted = None
+        if columns is not None:
+            wanted = list(dict.fromkeys([*columns, index]))
+
+        frames = [pq.read_table(str(f), columns=wanted).to_pandas() for f in files]
+        merged = pd.concat(frames, ignore_index=True)
+        merged = merged.drop_duplicates(subset=[index], keep="last")
+        merged = merged.reset_index(drop=True)
+
+        if filters is not None:
+            table = pa.Table.from_pandas(merged, preserve_index=False)
+            merged = table.filter(filters).to_pandas()
+        if columns is not None:
+            merged = merged[columns]
+        return merged
+
+    # compaction
+
+    def compact(self) -> dict:
+        """
+        Fold the current deltas into a new base. Deltas committed while the
+        merge runs are left in place and still apply on top of the new base.
+        """
+        with self._lock:
+            base_files = self.base_files()
+            deltas = self.delta_files()
+            index = self.index
+            # one compaction per table at a time
+            if not deltas or self.table_path in self._compacting:
+                return {"table": self.table_name, "deltas": 0}
+            self._compacting.add(self.table_path)
+
+        try:
+            frames = [pd.read_parquet(str(f)) for f in base_files + deltas]
+            merged = pd.concat(frames, ignore_index=True)
+            merged = merged.drop_duplicates(subset=[index], keep="last")
+
+            with self._lock:
+                base = self._write(
+                    merged, self.table_path, f"base-{uuid.uuid4().hex}.parquet", index
+                )
+                with self.manifest.transaction():
+                    self.manifest.add_files(self.table_name, [base], replace=True)
+                    self.manifest.remove_files(self.table_name, deltas)
+        finally:
+            with self._lock:
+                self._compacting.discard(self.table_path)
+
+        report = {
+            "table": self.table_name,
+            "deltas": len(deltas),
+            "rows": len(merged),
+            "base": base.name,
+        }
+        self.logger.info(
+            f"{self.table_name} | compacted {len(deltas)} deltas into {len(merged)} rows"
+        )
+        return report
+
+    def compact_in_background(self) -> threading.Thread:
+        thread = threading.Thread(
+            target=self.compact, name=f"compact-{self.table_name}"
+        )
+        thread.start()
+        return thread
+
+    def maybe_compact(self) -> Optional[threading.Thread]:
+        if len(self.delta_files()) < self.COMPACT_AFTER:
+            return None
+        return self.compact_in_background()
@@ -8,7 +8,7 @@ from strawberry.acquisition.acquire import Acquire
 from strawberry.ui.app_srv import AppServices
 from strawberry.ui.views import data_view
 from strawberry.ui.views.data_view import DataView
-from strawberry.ui.views.placeholder import PlaceholderView
+from strawberry.ui.views.screener_view import ScreenerView
 from strawberry.validation.validate import Validate
 from strawberry.logging.logger_factory import LoggerFactory
 from strawberry.ui.views.stock_view import StockView
@@ -26,14 +26,14 @@ class DataApp:
         self.logger = LoggerFactory().create_logger(self.__class__.__name__)
 
         self.srv = self.get_services()
-        placeholder = PlaceholderView(self.srv)
+        screener = ScreenerView(self.srv)
         stock_view = StockView(self.srv)
         data_view = DataView(self.srv)
 
         # Define pages
         self.st_pages = [
             st.Page(
-                placeholder.render,
+                screener.render,
                 title=self.PAGES[0],
                 url_path=self.URLs[0],
             ),
@@ -60,6 +60,8 @@ class DataApp:
 
         # Create navigation in the sidebar
         sel_page = st.navigation(self.st_pages, position="sidebar")
+        if st.sidebar.button("Refresh data"):
+            self.srv.refresh()
         sel_page.run()
 
 
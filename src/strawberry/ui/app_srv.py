@@ -2,7 +2,9 @@
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.compute as pc
 from strawberry.config.config_loader import ConfigLoader
+from strawberry.repository.query_service import QueryService
 from strawberry.repository.storage import ParquetStorage
 from strawberry.acquisition.acquire import Acquire
 from strawberry.validation.validate import Validate
@@ -25,11 +27,14 @@ class AppServices:
         self.fact_qtr_balance_config = self.config.fact_qtr_balance()
         self.logger.info("Configuration initialized")
 
-        # Storage backends
+        # Storage backends, pinned to a snapshot for the whole session so a
+        # pipeline run writing meanwhile never shows half-written tables
         self.acq_store = ParquetStorage(Path(self.env.acquisition_folder))
         self.val_store = ParquetStorage(Path(self.env.validated_folder))
         self.dim_store = ParquetStorage(Path(self.env.dim_stocks_folder))
-        self.dim_stocks_df = self.dim_store.read_df("DIM_STOCKS")
+        self.refresh()
+        # SQL over the same pinned snapshots
+        self.query_srv = QueryService([self.acq_store, self.val_store, self.dim_store])
         self.logger.info("Storage repositories initialized")
 
         # Services
@@ -45,13 +50,20 @@ class AppServices:
         self.table_loader = self.config.acquisition()
         self.tables = self.table_loader.table_names()
 
+    def refresh(self):
+        """
+        Move the session's snapshots to the latest published data.
+        """
+        for store in (self.acq_store, self.val_store, self.dim_store):
+            store.pin()
+        # memory-mapped and shared by every session, not a copy per session
+        self.dim_stocks = self.dim_store.read_arrow("DIM_STOCKS")
+
     def filter_dim_stocks_by_ticker(self, ticker) -> pd.DataFrame:
-        df = (
-            self.dim_stocks_df[self.dim_stocks_df["symbol"] == ticker]
-            if self.dim_stocks_df is not None
-            else None
-        )
-        return df if df is not None and not df.empty else None
+        if self.dim_stocks is None:
+            return None
+        df = self.dim_stocks.filter(pc.field("symbol") == ticker).to_pandas()
+        return df if not df.empty else None
 
     def stock_header(self, stock) -> str:
         return f"{stock['name']} ({stock['exchange']}: {stock['symbol']} {stock['currency']})"
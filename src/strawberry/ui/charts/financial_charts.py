@@ -14,6 +14,14 @@ class FinancialChart:
 
     RANGES = ["3Y", "5Y", "10Y", "MAX"]
 
+    def range_start(self, latest_date: pd.Timestamp, date_range: str) -> pd.Timestamp:
+        """
+        First date shown for a date range, or None for MAX.
+        """
+        if date_range not in self.OFFSETS or pd.isna(latest_date):
+            return None
+        return latest_date - self.OFFSETS[date_range]
+
     def _build_chart_options(self, x_data, series):
         return {
             "backgroundColor": "#0E1117",
@@ -13,6 +13,7 @@ from strawberry.validation.validate import Validate
 class DataView(BaseView):
 
     SECTIONS = ["Acquired", "Validated", "Dimensions"]
+    ALL_TICKERS = "All tickers"
     DIMENSIONS = ["DIM_STOCKS"]
     TABLE_HEIGHT = 1000
 
@@ -29,19 +30,22 @@ class DataView(BaseView):
         )
 
         # select ticker via sidebar
-        ticker = st.sidebar.selectbox("Select ticker", tickers)
+        ticker = st.sidebar.selectbox("Select ticker", [self.ALL_TICKERS, *tickers])
         self.logger.info(f"Selected ticker: {ticker}")
 
         # Then choose table via radio (acquired and validated share same table names))
         table = st.sidebar.radio("Select table", self.srv.acq_tables)
         self.logger.info(f"Selected table: {table}")
 
-        # Read and display DataFrame
-        df = (
-            self.srv.acq_store.read_df(table, ticker)
-            if section == self.SECTIONS[0]
-            else self.srv.val_store.read_df(table, ticker)
+        # Read and display DataFrame; all tickers are read in one scan
+        store = (
+            self.srv.acq_store if section == self.SECTIONS[0] else self.srv.val_store
         )
+        if ticker == self.ALL_TICKERS:
+            arrow = store.read_tickers(table, tickers)
+            df = arrow.to_pandas() if arrow is not None else None
+        else:
+            df = store.read_df(table, ticker)
         rows = len(df) if df is not None else 0
         self.logger.info(f"Loaded DataFrame with {rows} rows")
         if rows == 0:
@@ -56,7 +60,7 @@ class DataView(BaseView):
         table = st.sidebar.selectbox("Select dimension", self.DIMENSIONS)
         self.logger.info(f"Selected dimension: {table}")
 
-        df = self.dim_store.read_df(table)
+        df = self.srv.dim_store.read_df(table)
         rows = len(df) if df is not None else 0
         self.logger.info(f"Loaded dimension DataFrame with {rows} rows")
         if rows == 0:
@@ -0,0 +1,82 @@
+import streamlit as st
+
+from strawberry.ui.app_srv import AppServices
+from strawberry.ui.views.base_view import BaseView
+
+
+class ScreenerView(BaseView):
+    """
+    Screen the whole universe in DIM_STOCKS with one SQL query, plus an
+    ad-hoc SQL box over every registered table.
+    """
+
+    TABLE = "dimensions.DIM_STOCKS"
+    COLUMNS = [
+        "symbol",
+        "name",
+        "sector",
+        "industry",
+        "market_capitalization",
+        "pe_ratio",
+        "dividend_yield",
+        "eps",
+    ]
+    TABLE_HEIGHT = 800
+
+    def __init__(self, service: AppServices):
+        super().__init__(service)
+
+    def _sectors(self) -> list[str]:
+        result = self.srv.query_srv.query(
+            f"SELECT DISTINCT sector FROM {self.TABLE} "
+            "WHERE sector IS NOT NULL ORDER BY sector"
+        )
+        return result.column("sector").to_pylist()
+
+    def _screen(
+        self, sectors: list[str], min_cap: float, max_pe: float, min_yield: float
+    ):
+        where = [
+            "coalesce(TRY_CAST(market_capitalization AS DOUBLE), 0) >= ?",
+            "(? = 0 OR TRY_CAST(pe_ratio AS DOUBLE) BETWEEN 0 AND ?)",
+            "coalesce(TRY_CAST(dividend_yield AS DOUBLE), 0) >= ?",
+        ]
+        params = [min_cap * 1e9, max_pe, max_pe, min_yield / 100]
+        if sectors:
+            where.append(f"sector IN ({', '.join('?' for _ in sectors)})")
+            params += sectors
+        sql = (
+            f"SELECT {', '.join(self.COLUMNS)} FROM {self.TABLE} "
+            f"WHERE {' AND '.join(where)} "
+            "ORDER BY TRY_CAST(market_capitalization AS DOUBLE) DESC NULLS LAST"
+        )
+        return self.srv.query_srv.query(sql, params)
+
+    def _ad_hoc(self):
+        with st.expander("SQL"):
+            st.caption(", ".join(self.srv.query_srv.tables()))
+            sql = st.text_area("Query", f"SELECT count(*) FROM {self.TABLE}")
+            if st.button("Run"):
+                try:
+                    st.dataframe(self.srv.query_srv.select(sql).to_pandas())
+                except Exception as e:
+                    st.error(str(e))
+
+    def render(self, ticker: str = None):
+        self.logger.info("Displaying Screener page")
+        st.title("Screener")
+
+        if "DIM_STOCKS" not in self.srv.dim_store.catalog.table_names():
+            st.warning("No data available.")
+            return
+
+        sectors = st.sidebar.multiselect("Sector", self._sectors())
+        min_cap = st.sidebar.number_input("Min market cap ($bn)", 0.0, value=0.0)
+        max_pe = st.sidebar.number_input("Max P/E (0 = any)", 0.0, value=0.0)
+        min_yield = st.sidebar.number_input("Min dividend yield (%)", 0.0, value=0.0)
+
+        result = self._screen(sectors, min_cap, max_pe, min_yield)
+        st.caption(f"{result.num_rows} stocks")
+        st.dataframe(result.to_pandas(), height=self.TABLE_HEIGHT)
+
+        self._ad_hoc()
@@ -16,12 +16,28 @@ class FinancialView(BaseView):
         self.chart = FinancialChart()
         self.date_ranges = self.chart.RANGES
 
-    def render(self, ticker: str):
-        df = self.srv.dim_store.read_df(self.table_cfg.fact_table_name, ticker)
-        if df is None or df.empty:
-            st.warning("No data found.")
-            return
+    def _read(self, ticker: str, date_range: str) -> pd.DataFrame:
+        """
+        Read only the charted columns and, for a bounded date range, only the
+        rows inside it.
+        """
+        table = self.table_cfg.fact_table_name
+        date_col = self.table_cfg.date_col_name
+        # served from the memory-mapped mirror, not re-decoded each rerun
+        dates = self.srv.dim_store.read_arrow(table, ticker, columns=[date_col])
+        if dates is None or dates.num_rows == 0:
+            return None
+        dates = dates.to_pandas()
+
+        start = self.chart.range_start(dates[date_col].max(), date_range)
+        columns = [date_col] + [c.data_col_name for c in self.table_cfg.get_metric_cols()]
+        filters = None if start is None else [(date_col, ">=", start)]
+        df = self.srv.dim_store.read_arrow(
+            table, ticker, columns=columns, filters=filters
+        )
+        return None if df is None else df.to_pandas()
 
+    def render(self, ticker: str):
         date_range = st.radio(
             "Date Range",
             self.date_ranges,
@@ -29,5 +45,10 @@ class FinancialView(BaseView):
             key=f"{self.table_cfg.fact_table_name}_radio",
         )
 
+        df = self._read(ticker, date_range)
+        if df is None or df.empty:
+            st.warning("No data found.")
+            return
+
         with st.container():
             self.chart.render(df, self.table_cfg, date_range)
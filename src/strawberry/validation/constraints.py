@@ -0,0 +1,221 @@
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from strawberry.config.dtos import AcquisitionTableConfig
+from strawberry.config.dtos.AcquisitionTableConfig import ColumnConfig
+
+
+@dataclass
+class ColumnQuality:
+    """
+    Violation counts of one constrained column; bit is its bit in the
+    per-row violation bitmap.
+    """
+
+    bit: int
+    nulls: int = 0
+    regex: int = 0
+    below_min: int = 0
+    above_max: int = 0
+    # nulls replaced per the column's null_action
+    filled: int = 0
+
+    @property
+    def violations(self) -> int:
+        return self.nulls + self.regex + self.below_min + self.above_max
+
+
+@dataclass
+class QualitySummary:
+    """
+    Data-quality summary of a validated table, or of one ticker's partition
+    of it: rows, rows violating any constraint, and counts per column.
+    """
+
+    table: str
+    ticker: Optional[str] = None
+    rows: int = 0
+    rows_violating: int = 0
+    columns: dict[str, ColumnQuality] = field(default_factory=dict)
+    validated_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(d: dict) -> "QualitySummary":
+        return QualitySummary(
+            table=d["table"],
+            ticker=d.get("ticker"),
+            rows=d.get("rows", 0),
+            rows_violating=d.get("rows_violating", 0),
+            columns={
+                name: ColumnQuality(**c) for name, c in d.get("columns", {}).items()
+            },
+            validated_at=d.get("validated_at", 0.0),
+        )
+
+    @staticmethod
+    def merge(table: str, summaries: list["QualitySummary"]) -> "QualitySummary":
+        """
+        Roll partition summaries up into one for the table.
+        """
+        total = QualitySummary(table, validated_at=0.0)
+        for s in summaries:
+            total.rows += s.rows
+            total.rows_violating += s.rows_violating
+            total.validated_at = max(total.validated_at, s.validated_at)
+            for name, c in s.columns.items():
+                t = total.columns.setdefault(name, ColumnQuality(c.bit))
+                t.nulls += c.nulls
+                t.regex += c.regex
+                t.below_min += c.below_min
+                t.above_max += c.above_max
+                t.filled += c.filled
+        return total
+
+
+class ConstraintEngine:
+    """
+    The nullable, null_action, regex, min and max declarations of a table's
+    columns, compiled once into Arrow compute checks. Each converted column
+    is checked in a single vectorised pass and every constrained column owns
+    a bit of a per-row violation bitmap, stored in the VIOLATIONS column of
+    the validated table, so failing rows can be found without re-checking.
+
+    null_action "prior_value" fills nulls with the value of the row before
+    in date order (by the table's date column: Alpha Vantage lists rows
+    newest first) before the checks. regex is searched in the column's
+    text; min and max apply to numeric columns. Violations are recorded,
+    not rejected.
+    """
+
+    VIOLATIONS = "_violations"
+    NULL_ACTIONS = ("prior_value",)
+    NUMERIC_TYPES = ("float", "integer")
+    BITMAP_TYPES = ((8, pa.uint8()), (16, pa.uint16()), (32, pa.uint32()), (64, pa.uint64()))
+
+    def __init__(self, table: AcquisitionTableConfig):
+        self.table = table
+        self.constraints = [col for col in table.columns if self._constrained(col)]
+        for col in self.constraints:
+            self._check(col)
+        self.bits = {col.name: bit for bit, col in enumerate(self.constraints)}
+        self.date_column = self._date_column(table)
+        self.bitmap_type = next(
+            (t for width, t in self.BITMAP_TYPES if len(self.constraints) <= width), None
+        )
+        if self.bitmap_type is None:
+            raise ValueError(
+                f"{table.name} | {len(self.constraints)} constrained columns, "
+                f"the violation bitmap holds {self.BITMAP_TYPES[-1][0]}"
+            )
+
+    @staticmethod
+    def _date_column(table: AcquisitionTableConfig) -> Optional[str]:
+        """
+        The column that orders the rows: the first date in the primary key,
+        else the first date column.
+        """
+        dates = [col.name for col in table.columns if col.type == "date"]
+        keyed = [name for name in table.primary_key if name in dates]
+        return (keyed or dates or [None])[0]
+
+    @staticmethod
+    def _constrained(col: ColumnConfig) -> bool:
+        return (
+            not col.nullable
+            or bool(col.null_action)
+            or bool(col.regex)
+            or col.min is not None
+            or col.max is not None
+        )
+
+    def _check(self, col: ColumnConfig):
+        if col.null_action and col.null_action not in self.NULL_ACTIONS:
+            raise ValueError(
+                f"{self.table.name} | {col.name} | unknown null_action {col.null_action!r}"
+            )
+        bounded = col.min is not None or col.max is not None
+        if bounded and col.type not in self.NUMERIC_TYPES:
+            raise ValueError(
+                f"{self.table.name} | {col.name} | min/max on a {col.type} column"
+            )
+
+    def __bool__(self) -> bool:
+        return bool(self.constraints)
+
+    def _fill_prior(self, name: str, values: pa.Array, columns: dict) -> pa.Array:
+        """
+        Fill nulls with the prior value in date order, keeping the row order.
+        """
+        order = columns.get(self.date_column)
+        if order is None:
+            # nothing orders the rows: take them as listed
+            return pc.fill_null_forward(values)
+        if name == self.date_column:
+            # the dates themselves: when they descend the prior date is the
+            # next row's
+            dates = values.drop_null()
+            if len(dates) > 1 and pc.greater(dates[0], dates[-1]).as_py():
+                return pc.fill_null_backward(values)
+            return pc.fill_null_forward(values)
+
+        indices = pc.array_sort_indices(order, null_placement="at_start")
+        filled = pc.fill_null_forward(values.take(indices))
+        restore = np.empty(len(indices), dtype=np.int64)
+        restore[indices.to_numpy()] = np.arange(len(indices))
+        return filled.take(pa.array(restore))
+
+    @staticmethod
+    def _mask(condition: pa.Array) -> np.ndarray:
+        # a null comparison (null value) is not a violation
+        return pc.fill_null(condition, False).to_numpy(zero_copy_only=False)
+
+    def evaluate(
+        self, columns: dict[str, pa.Array], rows: int
+    ) -> tuple[pa.Array, QualitySummary]:
+        """
+        Apply the null actions to columns (in place) and check every
+        constraint. Returns the violation bitmap and the quality summary.
+        """
+        bitmap = np.zeros(rows, dtype=self.bitmap_type.to_pandas_dtype())
+        summary = QualitySummary(self.table.name, rows=rows)
+        for col in self.constraints:
+            values = columns[col.name]
+            quality = ColumnQuality(self.bits[col.name])
+
+            if col.null_action == "prior_value" and values.null_count:
+                filled = self._fill_prior(col.name, values, columns)
+                quality.filled = values.null_count - filled.null_count
+                values = columns[col.name] = filled
+
+            violated = np.zeros(rows, dtype=bool)
+            if not col.nullable:
+                mask = values.is_null().to_numpy(zero_copy_only=False)
+                quality.nulls = int(np.count_nonzero(mask))
+                violated |= mask
+            if col.regex:
+                text = values if pa.types.is_string(values.type) else pc.cast(values, pa.string())
+                mask = self._mask(pc.invert(pc.match_substring_regex(text, col.regex)))
+                quality.regex = int(np.count_nonzero(mask))
+                violated |= mask
+            if col.min is not None:
+                mask = self._mask(pc.less(values, col.min))
+                quality.below_min = int(np.count_nonzero(mask))
+                violated |= mask
+            if col.max is not None:
+                mask = self._mask(pc.greater(values, col.max))
+                quality.above_max = int(np.count_nonzero(mask))
+                violated |= mask
+
+            bitmap[violated] |= bitmap.dtype.type(1 << quality.bit)
+            summary.columns[col.name] = quality
+
+        summary.rows_violating = int(np.count_nonzero(bitmap))
+        return pa.array(bitmap, type=self.bitmap_type), summary
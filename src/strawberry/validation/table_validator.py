@@ -0,0 +1,113 @@
+from typing import Callable
+
+import pandas as pd
+import pyarrow as pa
+
+from strawberry.config.dtos import AcquisitionTableConfig
+from strawberry.config.dtos.AcquisitionTableConfig import ColumnConfig
+from strawberry.data_utilities.series_conversion import SeriesConversion
+from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.validation.constraints import ConstraintEngine, QualitySummary
+
+
+class TableValidator:
+    """
+    Validate a whole acquired table in one pass. The table's config is
+    compiled once into a conversion plan: a converter and a target Arrow
+    type per declared column. Every column of a frame is converted once,
+    straight into an Arrow array, and the arrays are assembled into a new
+    table: the frame is never mutated, so wide tables are not copied and
+    consolidated column after column.
+
+    Columns the config does not declare are carried over as they are. The
+    column constraints are checked by the table's ConstraintEngine, which
+    adds its violation bitmap column when the table declares any.
+    """
+
+    ARROW_TYPES = {
+        "date": pa.timestamp("ns"),
+        "float": pa.float64(),
+        "integer": pa.int64(),
+        "string": pa.string(),
+    }
+    # pandas dtypes the validated table reads back as
+    PANDAS_DTYPES = {
+        "date": "datetime64[ns]",
+        "float": "float64",
+        "integer": "Int64",
+        "string": "object",
+    }
+
+    def __init__(self, table: AcquisitionTableConfig, series: SeriesConversion = None):
+        self.logger = LoggerFactory().create_logger(__name__)
+        self.table = table
+        self.series = series or SeriesConversion()
+        self.columns = {col.name: col for col in table.columns}
+        self.plan = {
+            col.name: self._converter(col)
+            for col in table.columns
+            if col.type in self.ARROW_TYPES
+        }
+        self.constraints = ConstraintEngine(table)
+        self._metadata: dict[tuple, dict] = {}
+
+    def _converter(self, col: ColumnConfig) -> Callable[[str, pd.Series], pa.Array]:
+        arrow_type = self.ARROW_TYPES[col.type]
+
+        def convert(log_prefix: str, series: pd.Series) -> pa.Array:
+            values = self.series.validate_column(log_prefix, series, col)
+            return pa.array(values, type=arrow_type, from_pandas=True)
+
+        return convert
+
+    def missing(self, df: pd.DataFrame) -> list[str]:
+        return [name for name in self.columns if name not in df.columns]
+
+    def _pandas_metadata(self, df: pd.DataFrame) -> dict:
+        """
+        Pandas metadata that restores the declared dtypes (e.g. Int64) when
+        the validated table is read back, built once per column layout.
+        """
+        key = tuple(df.columns)
+        if key not in self._metadata:
+            template = {
+                name: pd.Series(
+                    dtype=self.PANDAS_DTYPES[self.columns[name].type]
+                    if name in self.plan
+                    else df[name].dtype
+                )
+                for name in df.columns
+            }
+            if self.constraints:
+                template[ConstraintEngine.VIOLATIONS] = pd.Series(
+                    dtype=self.constraints.bitmap_type.to_pandas_dtype()
+                )
+            self._metadata[key] = pa.Schema.from_pandas(
+                pd.DataFrame(template), preserve_index=False
+            ).metadata
+        return self._metadata[key]
+
+    def validate(
+        self, log_prefix: str, df: pd.DataFrame
+    ) -> tuple[pa.Table, QualitySummary]:
+        """
+        Convert every column of df per the plan into a new Arrow table with
+        the declared types, and check the column constraints. Conversion
+        errors are raised (TypeError or ValueError) as by
+        SeriesConversion.validate_column.
+        """
+        columns = {
+            name: self.plan[name](log_prefix, df[name])
+            if name in self.plan
+            else pa.array(df[name], from_pandas=True)
+            for name in df.columns
+        }
+        bitmap, summary = self.constraints.evaluate(columns, len(df))
+        if self.constraints:
+            columns[ConstraintEngine.VIOLATIONS] = bitmap
+
+        schema = pa.schema(
+            [pa.field(name, a.type) for name, a in columns.items()],
+            metadata=self._pandas_metadata(df),
+        )
+        return pa.Table.from_arrays(list(columns.values()), schema=schema), summary
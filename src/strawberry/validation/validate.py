@@ -1,25 +1,84 @@
-import numpy as np
-from sqlalchemy import true
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
 
 from strawberry.config.config_loader import ConfigLoader
 from strawberry.config.dtos import AcquisitionTableConfig
 from strawberry.data_utilities.series_conversion import SeriesConversion
 from strawberry.repository.storage import ParquetStorage
 from strawberry.logging.logger_factory import LoggerFactory
+from strawberry.validation.constraints import QualitySummary
+from strawberry.validation.table_validator import TableValidator
+
+
+@dataclass
+class ValidationResult:
+    """
+    Outcome of validating one (ticker, table) unit.
+    """
+
+    ticker: str
+    table: str
+    ok: bool
+    rows: int = 0
+    # rows violating a column constraint
+    violations: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+# the Validate of a pool worker process, created once per process
+_worker: Optional["Validate"] = None
+
+
+def _init_worker():
+    global _worker
+    _worker = Validate(tickers=[])
+
+
+def _validate_chunk(table_name: str, tickers: list[str]) -> list[ValidationResult]:
+    return _worker.validate_chunk(table_name, tickers)
 
 
 class Validate:
 
-    def __init__(self):
+    # quality summary stored with each validated partition
+    QUALITY = "_quality.json"
+
+    def __init__(self, tickers: list[str] = None):
         self.logger = LoggerFactory().create_logger(__name__)
         self.config = ConfigLoader()
         self.env = self.config.environment()
-        self.tickers = self.config.tickers()
+        self.tickers = tickers if tickers is not None else self.config.tickers()
         self.acq_cfg = self.config.acquisition()
+        self.val_cfg = self.acq_cfg.validation
+        self.tables = {table.name: table for table in self.acq_cfg.tables}
         self.series = SeriesConversion()
+        self.validators = {
+            table.name: TableValidator(table, self.series)
+            for table in self.acq_cfg.tables
+        }
 
         self.acq_store = ParquetStorage(self.env.acquisition_folder)
         self.val_store = ParquetStorage(self.env.validated_folder)
+        # failed units of the last run
+        self.errors: list[ValidationResult] = []
+
+    def _pending(self, table_name: str, ticker: str) -> bool:
+        """
+        The ticker's acquired partition has not been validated since it was
+        written: it never was, or it was acquired again (refreshed) since.
+        """
+        acquired = self.acq_store.last_update(table_name, ticker)
+        if acquired is None:
+            return False
+        validated = self.val_store.last_update(table_name, ticker)
+        return validated is None or acquired > validated
 
     def tickers_validated(self, tickers: list[str]) -> list[str]:
         """
@@ -36,7 +95,8 @@ class Validate:
 
     def tickers_not_validated(self, tickers: list[str]) -> list[str]:
         """
-        Return a set of tickers from the inputed tickers that have not yet been acquired
+        Return the tickers, of those acquired, with a partition not validated
+        since it was acquired or refreshed
         """
         tables = self.acq_cfg.table_names()
         acquired_tickers = [
@@ -44,64 +104,248 @@ class Validate:
             for ticker in self.tickers
             if self.acq_store.all_exist(tables, ticker)
         ]
-        validated_tickers = [
-            ticker
-            for ticker in self.tickers
-            if self.val_store.all_exist(tables, ticker)
-        ]
 
-        # Now compute the difference, preserving acquisition order:
-        validated_set = set(validated_tickers)
-        not_validated = [t for t in acquired_tickers if t not in validated_set]
+        # preserving acquisition order
+        not_validated = [
+            t for t in acquired_tickers if any(self._pending(table, t) for table in tables)
+        ]
         self.logger.info(f"{len(not_validated)} tickers not validated.")
         return not_validated
 
+    def _validate_frame(
+        self,
+        log_prefix: str,
+        table: AcquisitionTableConfig,
+        ticker: str,
+        df: pd.DataFrame = None,
+    ) -> Optional[QualitySummary]:
+        """
+        Validate and store a ticker's partition with its quality summary;
+        returns the summary, or None when the frame cannot be validated.
+        """
+        if df is None:
+            df = self.acq_store.read_df(table.name, ticker)
+        if df is None:
+            self.logger.warning(f"{log_prefix} could not be read.")
+            return None
+        validator = self.validators[table.name]
+        for name in validator.missing(df):
+            self.logger.warning(f"{log_prefix} {name} does not exist.")
+            return None
+
+        # convert all columns into a new table, stored in place of the
+        # symbol's partition of the validation directory
+        data, quality = validator.validate(log_prefix, df)
+        quality.ticker = ticker
+        self.val_store.write_arrow(data, table.name, ticker, replace=True)
+        self.val_store.write_partition_json(
+            table.name, ticker, self.QUALITY, quality.to_dict()
+        )
+        if quality.rows_violating:
+            self.logger.warning(
+                f"{log_prefix} {quality.rows_violating} of {quality.rows} rows "
+                "violate column constraints"
+            )
+        self.logger.info(f"{log_prefix} validated")
+        return quality
+
     def validate_table(
-        self, log_prefix: str, table: AcquisitionTableConfig, ticker: str
+        self,
+        log_prefix: str,
+        table: AcquisitionTableConfig,
+        ticker: str,
+        df: pd.DataFrame = None,
     ) -> bool:
-        df = self.acq_store.read_df(table.name, ticker)
-        for col in table.columns:
-            if col.name not in df:
-                self.logger.warning(f"{log_prefix} {col.name} does not exist.")
-                return False
-            df[col.name] = self.series.validate_column(log_prefix, df[col.name], col)
-
-        # add a symbol column and store in validation directory
-        df["symbol"] = ticker
-        self.val_store.write_df(df, table.name, ["symbol"])
-        self.logger.info(f"{log_prefix} validated")
-        return true
+        return self._validate_frame(log_prefix, table, ticker, df) is not None
+
+    def quality(self, table_name: str, tickers: list[str] = None) -> QualitySummary:
+        """
+        The table's quality summary, rolled up from the summaries stored
+        with the validated partitions of the tickers (default: all).
+        """
+        tickers = tickers if tickers is not None else self.val_store.get_tickers(table_name)
+        summaries = [
+            QualitySummary.from_dict(d)
+            for d in (
+                self.val_store.read_partition_json(table_name, t, self.QUALITY)
+                for t in tickers
+            )
+            if d is not None
+        ]
+        return QualitySummary.merge(table_name, summaries)
 
     def validate(self):
-        for ticker in self.tickers:
-            self.validate_ticker(ticker)
+        self.validate_tickers(self.tickers)
+
+    def _validate_unit(
+        self, table: AcquisitionTableConfig, ticker: str, df: pd.DataFrame = None
+    ) -> ValidationResult:
+        log_prefix = f"{ticker} | {table.name} | "
+        start = time.perf_counter()
+        error = None
+        quality = None
+        try:
+            quality = self._validate_frame(log_prefix, table, ticker, df)
+            ok = quality is not None
+            if not ok:
+                error = "missing columns or unreadable"
+        except (TypeError, ValueError) as e:
+            self.logger.warning(f"{log_prefix} {str(e)}")
+            ok, error = False, str(e)
+        except Exception as e:
+            # anything else, e.g. an I/O error, fails this unit alone
+            error = f"{type(e).__name__}: {e}"
+            self.logger.warning(f"{log_prefix} {error}")
+            ok = False
+
+        if ok:
+            self.logger.info(f"{log_prefix} successfully validated")
+        else:
+            self.logger.warning(f"{log_prefix} failed to validate")
+        return ValidationResult(
+            ticker=ticker,
+            table=table.name,
+            ok=ok,
+            rows=0 if df is None else len(df),
+            violations=0 if quality is None else quality.rows_violating,
+            seconds=time.perf_counter() - start,
+            error=error,
+        )
+
+    def validate_chunk(self, table_name: str, tickers: list[str]) -> list[ValidationResult]:
+        """
+        Validate one table for a chunk of tickers, reading the table once
+        for all of them and publishing their partitions together. Tickers
+        whose partition could not be read fail; when the chunk itself fails
+        none of its partitions are published and every ticker fails.
+        """
+        table = self.tables[table_name]
+        # the chunk's partitions are published in one manifest version
+        try:
+            with self.val_store.manifest.transaction():
+                results = [
+                    self._validate_unit(table, ticker, df)
+                    for ticker, df in self.acq_store.iter_tickers(table_name, tickers)
+                ]
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            self.logger.warning(f"{table_name} | {len(tickers)} tickers | {error}")
+            return [ValidationResult(t, table_name, False, error=error) for t in tickers]
+        read = {r.ticker for r in results}
+        results += [
+            ValidationResult(ticker, table_name, False, error="unreadable")
+            for ticker in tickers
+            if ticker not in read
+        ]
+        return results
+
+    def _chunks(self, tickers: list[str]) -> list[tuple[str, list[str]]]:
+        """
+        The partitions of the tickers acquired or refreshed since they were
+        last validated, as (table, tickers) chunks of at most chunk_size
+        tickers.
+        """
+        size = max(1, self.val_cfg.chunk_size)
+        chunks = []
+        for table in self.acq_cfg.tables:
+            pending = [t for t in tickers if self._pending(table.name, t)]
+            chunks += [
+                (table.name, pending[i : i + size]) for i in range(0, len(pending), size)
+            ]
+        return chunks
 
-    def validate_ticker(self, ticker: str):
+    def _validate_pool(
+        self, chunks: list[tuple[str, list[str]]], workers: int
+    ) -> list[ValidationResult]:
+        results: list[ValidationResult] = []
+        # spawn: the parent may hold threads and locks (e.g. a Prefect runner)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=_init_worker
+        ) as pool:
+            futures = {
+                pool.submit(_validate_chunk, table_name, tickers): (table_name, tickers)
+                for table_name, tickers in chunks
+            }
+            for future in as_completed(futures):
+                table_name, tickers = futures[future]
+                try:
+                    results += future.result()
+                except Exception as e:
+                    # the worker died or raised outside validation
+                    self.logger.warning(f"{table_name} | {len(tickers)} tickers | {e}")
+                    results += [
+                        ValidationResult(t, table_name, False, error=str(e))
+                        for t in tickers
+                    ]
+        return results
+
+    def validate_results(
+        self, tickers: list[str], max_workers: int = None
+    ) -> list[ValidationResult]:
+        """
+        Validate every partition of the tickers acquired or refreshed since
+        it was last validated and return a result per (ticker, table).
+        Chunks are spread across a process pool of max_workers (default:
+        the validation config, else one per core); with a single worker
+        they run in-process.
+        """
+        chunks = self._chunks(tickers)
+        workers = max_workers or self.val_cfg.max_workers or os.cpu_count() or 1
+        workers = min(workers, len(chunks))
+        self.logger.info(
+            f"Validating {sum(len(t) for _, t in chunks)} partitions "
+            f"with {max(workers, 1)} workers"
+        )
+
+        start = time.perf_counter()
+        if workers <= 1:
+            results = [r for name, ts in chunks for r in self.validate_chunk(name, ts)]
+        else:
+            results = self._validate_pool(chunks, workers)
+
+        self.errors = [r for r in results if not r.ok]
+        if self.errors:
+            failed = [f"{r.ticker} | {r.table}" for r in self.errors]
+            self.logger.warning(f"Failed to validate {len(failed)} partitions: {failed}")
+        self.logger.info(
+            f"Validated {len(results) - len(self.errors)} of {len(results)} partitions "
+            f"in {time.perf_counter() - start:.1f}s, "
+            f"{sum(r.violations for r in results)} rows violating column constraints"
+        )
+        return results
+
+    def validate_tickers(
+        self, tickers: list[str], max_workers: int = None
+    ) -> dict[str, bool]:
+        """
+        Validate every partition of the tickers acquired or refreshed since
+        it was last validated. Returns a success flag per ticker that had work.
+        """
+        results: dict[str, bool] = {}
+        for r in self.validate_results(tickers, max_workers):
+            results[r.ticker] = results.get(r.ticker, True) and r.ok
+        return results
+
+    def validate_ticker(self, ticker: str) -> bool:
+        results = []
         for table in self.acq_cfg.tables:
             log_prefix = f"{ticker} | {table.name} | "
-            try:
-                # if NOT exists as an acquired table, skip
-                if not self.acq_store.exists(table.name, ticker):
-                    self.logger.info(f"{log_prefix} not acquired, skipping")
-                    continue
-
-                # if exists as a validated table, skip
-                if self.val_store.exists(table.name, ticker):
-                    self.logger.info(f"{log_prefix} alreaded validated, skipping")
-                    continue
-
-                # validate the table
-                if self.validate_table(log_prefix, table, ticker):
-                    self.logger.info(f"{log_prefix} successfully validated")
-                else:
-                    self.logger.warning(f"{log_prefix} failed to validate")
-
-            except (TypeError, ValueError) as e:
-                exceptions = np.append(exceptions, [table.name, ticker, str(e)])
-                self.logger.warning(f"{log_prefix} {str(e)}")
-                return False
-
-        return True
+
+            # if NOT exists as an acquired table, skip
+            if not self.acq_store.exists(table.name, ticker):
+                self.logger.info(f"{log_prefix} not acquired, skipping")
+                continue
+
+            # if validated since it was acquired, skip
+            if not self._pending(table.name, ticker):
+                self.logger.info(f"{log_prefix} already validated, skipping")
+                continue
+
+            results.append(self._validate_unit(table, ticker))
+
+        self.errors = [r for r in results if not r.ok]
+        return not self.errors
 
 
 if __name__ == "__main__":